@@ -5,6 +5,7 @@ individual(s) to the offspring after the variation is carried out.
 """
 
 from .Variation import Variation
+from .Generator import generate_population
 from ..Util.ArgumentValidation import argument_validation
 
 
@@ -50,7 +51,6 @@ class AddRandomIndividualVariation(Variation):
         return self._generate_new_pop(children)
 
     def _generate_new_pop(self, population):
-        for _ in range(self._num_rand_indvs):
-            random_indv = self._chromosome_generator()
-            population.append(random_indv)
+        population += generate_population(self._chromosome_generator,
+                                          self._num_rand_indvs)
         return population
@@ -19,8 +19,16 @@ class AgeFitness(Selection):
     selection_size : int
         The size of the group of individuals to be randomly
         compared. The size must be an integer greater than 1.
+
+    Notes
+    -----
+    Groups of up to `MAX_PAIRWISE_GROUP_SIZE` individuals (e.g. the groups
+    of the default `selection_size`) are compared pair by pair.  Larger
+    groups, such as the whole population in `select_pareto_front`, are
+    compared by a sort-based sweep in O(n log n).
     """
     WORST_CASE_FACTOR = 50
+    MAX_PAIRWISE_GROUP_SIZE = 16
 
     @argument_validation(selection_size={">=": 2})
     def __init__(self, selection_size=2):
@@ -28,6 +36,8 @@ class AgeFitness(Selection):
         self._selected_indices = []
         self._population_index_array = np.array([])
         self._selection_attempts = 0
+        self._ages = np.array([])
+        self._fitnesses = np.array([])
 
     @argument_validation(target_population_size={">": 0})
     def __call__(self, population, target_population_size):
@@ -63,6 +73,7 @@ class AgeFitness(Selection):
         num_removed = 0
         start_pop_size = len(population)
         self._population_index_array = np.random.permutation(len(population))
+        self._get_ages_and_fitnesses(population)
 
         self._selection_attempts = 0
         while (start_pop_size - num_removed) > target_population_size and \
@@ -96,6 +107,7 @@ class AgeFitness(Selection):
         """
         num_removed = 0
         self._population_index_array = np.random.permutation(len(population))
+        self._get_ages_and_fitnesses(population)
 
         self._get_unique_random_individuals(population,
                                             len(population),
@@ -116,38 +128,102 @@ class AgeFitness(Selection):
                                                   selection_size,
                                                   replace=False)
 
-    # TODO look into optimizing. Possibly greedy approach
+    def _get_ages_and_fitnesses(self, population):
+        self._ages = np.array([indv.genetic_age for indv in population],
+                              dtype=float)
+        self._fitnesses = np.array([indv.fitness for indv in population],
+                                   dtype=float)
+
     def _get_individuals_for_removal(self, population,
                                      target_population_size, num_removed):
-        to_be_removed = set()
+        selected_indices = np.asarray(self._selected_indices, dtype=int)
+        population_indices = self._population_index_array[selected_indices]
+        ages = self._ages[population_indices]
+        fitnesses = self._fitnesses[population_indices]
+        if len(selected_indices) <= self.MAX_PAIRWISE_GROUP_SIZE:
+            removal_order = self._get_pairwise_removal_order(ages, fitnesses)
+        else:
+            removal_order = self._get_removal_order(ages, fitnesses)
+
         num_remaining = len(population) - num_removed
-        for i, indv_index_1 in enumerate(self._selected_indices[:-1]):
-            for indv_index_2 in self._selected_indices[i+1:]:
-                self._update_removal_set(population, indv_index_1,
-                                         indv_index_2, to_be_removed)
-                if num_remaining - len(to_be_removed) == target_population_size:
-                    return to_be_removed
-        return to_be_removed
-
-    def _update_removal_set(self, population, indv_index_1,
-                            indv_index_2, removal_set):
-        indv_1 = self._get_indvidual(population, indv_index_1)
-        indv_2 = self._get_indvidual(population, indv_index_2)
-
-        if self._first_dominates(indv_1, indv_2):
-            removal_set.add(indv_index_2)
-        elif self._first_dominates(indv_2, indv_1):
-            removal_set.add(indv_index_1)
+        num_to_remove = num_remaining - target_population_size
+        return set(selected_indices[removal_order[:num_to_remove]].tolist())
+
+    @staticmethod
+    def _get_pairwise_removal_order(ages, fitnesses):
+        ages = ages.tolist()
+        fitnesses = fitnesses.tolist()
+        removal_order = []
+        for i, (age_1, fitness_1) in enumerate(zip(ages, fitnesses)):
+            for j in range(i + 1, len(ages)):
+                if age_1 <= ages[j] and fitness_1 <= fitnesses[j]:
+                    removed = j
+                elif ages[j] <= age_1 and fitnesses[j] <= fitness_1:
+                    removed = i
+                else:
+                    continue
+                if removed not in removal_order:
+                    removal_order.append(removed)
+        return np.array(removal_order, dtype=int)
+
+    @staticmethod
+    def _get_removal_order(ages, fitnesses):
+        """Individuals removed by pairwise comparison of the selected
+        individuals, in the order they would be found by comparing the pairs
+        (i, j), i < j, in lexicographic order.
+
+        A pair removes j if i is no older and no less fit than j, otherwise
+        it removes i if j is no older and no less fit than i.  So j is first
+        removed by the pair with the lowest i that weakly dominates it.  If
+        there is none, it is first removed by the pair (j, k) with the lowest
+        k that strictly dominates it.
+        """
+        num_selected = len(ages)
+        positions = np.arange(num_selected)
+        min_strict_dominator = np.full(num_selected, num_selected)
+        min_equal = np.copy(positions)
+
+        is_valid = ~np.isnan(fitnesses)
+        fitness_ranks = np.zeros(num_selected, dtype=int)
+        _, fitness_ranks[is_valid] = np.unique(fitnesses[is_valid],
+                                               return_inverse=True)
+        fitness_ranks += 1
+        sweep_order = np.lexsort((positions, fitnesses, ages))
+        sweep_order = sweep_order[is_valid[sweep_order]]
+        new_group = np.ones(len(sweep_order) + 1, dtype=bool)
+        new_group[1:-1] = \
+            np.logical_or(np.diff(ages[sweep_order]) != 0,
+                          np.diff(fitness_ranks[sweep_order]) != 0)
+        group_starts = np.flatnonzero(new_group)
+
+        min_position_tree = np.full(num_selected + 1, num_selected)
+        for start, end in zip(group_starts[:-1], group_starts[1:]):
+            group = sweep_order[start:end]
+            rank = fitness_ranks[group[0]]
+            min_strict_dominator[group] = _prefix_min(min_position_tree, rank)
+            min_equal[group] = group[0]
+            _update_prefix_min(min_position_tree, rank, group[0])
+
+        min_weak_dominator = np.where(min_equal < positions,
+                                      np.minimum(min_strict_dominator,
+                                                 min_equal),
+                                      min_strict_dominator)
+        removed_by_lower = min_weak_dominator < positions
+        removed_by_higher = np.logical_and(~removed_by_lower,
+                                           min_strict_dominator < num_selected)
+        removed = np.flatnonzero(np.logical_or(removed_by_lower,
+                                               removed_by_higher))
+
+        first_in_pair = np.where(removed_by_lower, min_weak_dominator,
+                                 positions)[removed]
+        second_in_pair = np.where(removed_by_lower, positions,
+                                  min_strict_dominator)[removed]
+        return removed[np.lexsort((second_in_pair, first_in_pair))]
 
     def _get_indvidual(self, population, index):
         population_list_index = self._population_index_array[index]
         return population[population_list_index]
 
-    @staticmethod
-    def _first_dominates(indv_a, indv_b):
-        return indv_a.genetic_age <= indv_b.genetic_age and \
-                indv_a.fitness <= indv_b.fitness
-
     def _remove_indviduals(self, to_remove_list, num_removed):
         while to_remove_list:
             selection_index = to_remove_list.pop()
@@ -168,3 +244,17 @@ class AgeFitness(Selection):
                           for kept_index
                           in range(num_removed, len(population))]
         return new_population
+
+
+def _prefix_min(tree, index):
+    minimum = tree[0]
+    while index > 0:
+        minimum = min(minimum, tree[index])
+        index -= index & -index
+    return minimum
+
+
+def _update_prefix_min(tree, index, value):
+    while index < len(tree):
+        tree[index] = min(tree[index], value)
+        index += index & -index
@@ -100,6 +100,27 @@ class Archipelago(metaclass=ABCMeta):
         """
         pop_size1 = len(island_1.population)
         pop_size2 = len(island_2.population)
+        return Archipelago.assign_send_receive_by_size(pop_size1, pop_size2)
+
+    @staticmethod
+    def assign_send_receive_by_size(pop_size1, pop_size2):
+        """
+        Assign indices to be exchanged between two populations by random
+        shuffling.
+
+        Parameters
+        ----------
+        pop_size1: int
+            size of the first population
+        pop_size2: int
+            size of the second population
+
+        Returns
+        -------
+        tuple of list of ints:
+            The indices for individuals in population 1 and population 2,
+            respectively, to be sent to the other population.
+        """
         tot_pop = pop_size1 + pop_size2
         pop_shuffle = list(range(tot_pop))
         random.shuffle(pop_shuffle)
@@ -8,6 +8,8 @@ subclasses of Chromosome.
 import copy
 from abc import ABCMeta, abstractmethod
 
+import numpy as np
+
 
 class Chromosome(metaclass=ABCMeta):
     """A genetic individual
@@ -69,3 +71,25 @@ class Chromosome(metaclass=ABCMeta):
             distance from self to chromosome
         """
         raise NotImplementedError
+
+    @classmethod
+    def paired_distances(cls, individuals, others):
+        """Distances between pairs of chromosomes
+
+        Subclasses may override this to compute the distances of a whole
+        population at once.
+
+        Parameters
+        ----------
+        individuals : list of Chromosome
+                      first chromosome of each pair
+        others : list of Chromosome
+                 second chromosome of each pair
+
+        Returns
+        -------
+        array of float
+            distance from each individual to the corresponding other
+        """
+        return np.array([indv.distance(other)
+                         for indv, other in zip(individuals, others)])
@@ -10,7 +10,8 @@ from abc import ABCMeta, abstractmethod
 import numpy as np
 import scipy.optimize as optimize
 
-from .FitnessFunction import FitnessFunction, VectorBasedFunction
+from .FitnessFunction import FitnessFunction, VectorBasedFunction, \
+                             VectorGradientMixin
 
 ROOT_SET = {
     # 'hybr',
@@ -42,6 +43,15 @@ MINIMIZE_SET = {
     # 'trust-krylov'
 }
 
+JACOBIAN_SET = {
+    'lm',
+    'CG',
+    'BFGS',
+    'L-BFGS-B',
+    'SLSQP'
+}
+
+
 class ContinuousLocalOptimization(FitnessFunction):
     """Fitness evaluation metric for individuals.
 
@@ -85,6 +95,14 @@ class ContinuousLocalOptimization(FitnessFunction):
                 - krylov (not available yet)
                 - df-sane (not available yet)
 
+    Notes
+    -----
+    If `fitness_function` is a `VectorGradientMixin`, its analytic jacobian
+    (or gradient) is used by the algorithms that make use of derivatives
+    rather than a finite difference approximation.  The fitness (vector) and
+    its derivatives are then calculated together, in a single evaluation of
+    the individual per optimizer step.
+
     Attributes
     ----------
     eval_count : int
@@ -107,6 +125,8 @@ class ContinuousLocalOptimization(FitnessFunction):
         self._check_root_alg_returns_vector(fitness_function, algorithm)
         self._fitness_function = fitness_function
         self._algorithm = algorithm
+        self._use_jacobian = algorithm in JACOBIAN_SET and \
+            isinstance(fitness_function, VectorGradientMixin)
 
     @property
     def training_data(self):
@@ -147,6 +167,29 @@ class ContinuousLocalOptimization(FitnessFunction):
             self._optimize_params(individual)
         return self._evaluate_fitness(individual)
 
+    def evaluate_fitness_vector(self, individual):
+        """Evaluates the fitness vector of the individual. Provides local
+        optimization on `MultipleFloatChromosome` individual if necessary.
+
+        Parameters
+        ----------
+        individual : `MultipleValueChromosome`
+            Individual to which to calculate the fitness vector.
+
+        Returns
+        -------
+        array of numeric :
+            The fitness vector of the invdividual
+
+        Raises
+        ------
+        AttributeError :
+            the wrapped fitness function is not a `VectorBasedFunction`
+        """
+        if individual.needs_local_optimization():
+            self._optimize_params(individual)
+        return self._fitness_function.evaluate_fitness_vector(individual)
+
     def _check_algorithm_is_valid(self, algorithm):
         if algorithm not in ROOT_SET and algorithm not in MINIMIZE_SET:
             raise KeyError("{} is not a listed algorithm".format(algorithm))
@@ -160,8 +203,11 @@ class ContinuousLocalOptimization(FitnessFunction):
     def _optimize_params(self, individual):
         num_params = individual.get_number_local_optimization_params()
         c_0 = np.random.uniform(-10000, 10000, num_params)
+        sub_routine = self._sub_routine_for_fit_function
+        if self._use_jacobian:
+            sub_routine = self._sub_routine_for_fit_function_and_jacobian
         params = self._run_algorithm_for_optimization(
-            self._sub_routine_for_fit_function, individual, c_0)
+            sub_routine, individual, c_0)
         individual.set_local_optimization_params(params)
 
     def _sub_routine_for_fit_function(self, params, individual):
@@ -170,15 +216,24 @@ class ContinuousLocalOptimization(FitnessFunction):
             return self._fitness_function._evaluate_fitness_vector(individual)
         return self._fitness_function(individual)
 
+    def _sub_routine_for_fit_function_and_jacobian(self, params, individual):
+        individual.set_local_optimization_params(params)
+        if self._algorithm in ROOT_SET:
+            return self._fitness_function.get_fitness_vector_and_jacobian(
+                individual)
+        return self._fitness_function.get_fitness_and_gradient(individual)
+
     def _run_algorithm_for_optimization(self, sub_routine, individual, params):
         if self._algorithm in ROOT_SET:
             optimize_result = optimize.root(sub_routine, params,
                                             args=(individual),
+                                            jac=self._use_jacobian,
                                             method=self._algorithm,
                                             tol=1e-6)
         else:
             optimize_result = optimize.minimize(sub_routine, params,
                                                 args=(individual),
+                                                jac=self._use_jacobian,
                                                 method=self._algorithm,
                                                 tol=1e-6)
         return optimize_result.x
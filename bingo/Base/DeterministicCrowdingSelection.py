@@ -10,6 +10,9 @@ from .Selection import Selection
 
 class DeterministicCrowdingSelection(Selection):
     """The class that performs deterministic crowding selection on a population
+
+    The distances between all parents and children are computed at once with
+    the `paired_distances` of the chromosome class of the population.
     """
     def __call__(self, population, target_population_size):
         """Performs selection on a population
@@ -39,20 +42,32 @@ class DeterministicCrowdingSelection(Selection):
         offspring = population[target_population_size:]
         population = population[:target_population_size]
 
-        for i in range(target_population_size//2):
-            parent_1 = population[i*2]
-            parent_2 = population[i*2+1]
-            child_1 = offspring[i*2]
-            child_2 = offspring[i*2+1]
-
-            dist_a = parent_1.distance(child_1) + parent_2.distance(child_2)
-            dist_b = parent_1.distance(child_2) + parent_2.distance(child_1)
-            if dist_a <= dist_b:
-                population[i*2] = self._return_most_fit(child_1, parent_1)
-                population[i*2+1] = self._return_most_fit(child_2, parent_2)
+        if not population:
+            return population
+
+        parents_1 = population[0::2]
+        parents_2 = population[1::2]
+        children_1 = offspring[0::2]
+        children_2 = offspring[1::2]
+        num_pairs = len(parents_1)
+        distances = type(population[0]).paired_distances(
+            parents_1 + parents_2 + parents_1 + parents_2,
+            children_1 + children_2 + children_2 + children_1)
+        distances = distances.reshape((4, num_pairs))
+        dist_a = distances[0] + distances[1]
+        dist_b = distances[2] + distances[3]
+
+        for i in range(num_pairs):
+            if dist_a[i] <= dist_b[i]:
+                population[i*2] = self._return_most_fit(children_1[i],
+                                                        parents_1[i])
+                population[i*2+1] = self._return_most_fit(children_2[i],
+                                                          parents_2[i])
             else:
-                population[i*2] = self._return_most_fit(child_2, parent_1)
-                population[i*2+1] = self._return_most_fit(child_1, parent_2)
+                population[i*2] = self._return_most_fit(children_2[i],
+                                                        parents_1[i])
+                population[i*2+1] = self._return_most_fit(children_1[i],
+                                                          parents_2[i])
 
         return population
 
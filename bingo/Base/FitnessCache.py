@@ -0,0 +1,127 @@
+"""Memoization of fitness evaluations with local optimization
+
+This module contains a wrapper of fitness functions which remembers the
+fitness and optimized parameters of individuals with a given structure.
+Individuals that need local optimization and that have a structure which
+has already been seen skip the optimization and evaluation altogether.
+"""
+from collections import OrderedDict
+
+import numpy as np
+
+from .FitnessFunction import FitnessFunction
+from ..Util.ArgumentValidation import argument_validation
+
+
+class FitnessCache(FitnessFunction):
+    """Fitness evaluation with a cache of previous results
+
+    A least-recently-used cache of fitness and optimized local optimization
+    parameters, keyed on the structure of individuals.  Typically wraps a
+    `ContinuousLocalOptimization`.
+
+    Parameters
+    ----------
+    fitness_function : FitnessFunction
+                       The wrapped fitness function
+    cache_size : int
+                 (Optional) The maximum number of stored structures. Default
+                 is 1000.
+
+    Attributes
+    ----------
+    eval_count : int
+                 the number of evaluations that have been performed by the
+                 wrapped fitness function
+    training_data :
+                   (Optional) data that can be used in the wrapped fitness
+                   function. Setting the training data clears the cache.
+    hits : int
+           the number of evaluations that were retrieved from the cache
+    misses : int
+             the number of evaluations that were not in the cache
+
+    Notes
+    -----
+    Only individuals that need local optimization are cached. They must
+    implement `get_structure_key` and `get_local_optimization_params` in
+    addition to the `ContinuousLocalOptimization.ChromosomeInterface`.
+    Non-finite fitness values (e.g. from an unlucky local optimization) are
+    not cached, so later individuals with the same structure are optimized
+    again.
+    """
+    @argument_validation(cache_size={">": 0})
+    def __init__(self, fitness_function, cache_size=1000):
+        self._fitness_function = fitness_function
+        self._cache_size = cache_size
+        self._cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def training_data(self):
+        """TrainingData : data that can be used in fitness evaluations"""
+        return self._fitness_function.training_data
+
+    @training_data.setter
+    def training_data(self, value):
+        self._fitness_function.training_data = value
+        self.clear()
+
+    @property
+    def eval_count(self):
+        """int : the number of evaluations that have been performed"""
+        return self._fitness_function.eval_count
+
+    @eval_count.setter
+    def eval_count(self, value):
+        self._fitness_function.eval_count = value
+
+    def __call__(self, individual):
+        """Evaluates the fitness of the individual or retrieves it from the
+        cache.
+
+        Parameters
+        ----------
+        individual : Chromosome
+                     individual for which fitness will be calculated
+
+        Returns
+        -------
+         :
+            fitness of the individual
+        """
+        if not individual.needs_local_optimization():
+            return self._fitness_function(individual)
+
+        key = individual.get_structure_key()
+        if key in self._cache:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            fitness, params = self._cache[key]
+            individual.set_local_optimization_params(np.copy(params))
+            return fitness
+
+        self.misses += 1
+        fitness = self._fitness_function(individual)
+        if not np.isfinite(fitness):
+            return fitness
+        self._cache[key] = \
+            (fitness, np.copy(individual.get_local_optimization_params()))
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return fitness
+
+    def clear(self):
+        """Remove all stored structures from the cache"""
+        self._cache.clear()
+
+    def __len__(self):
+        """Gets the number of structures in the cache
+
+        Returns
+        -------
+        int :
+            size of the cache
+        """
+        return len(self._cache)
@@ -7,6 +7,8 @@ from abc import ABCMeta, abstractmethod
 
 import numpy as np
 
+from ..Util.ArgumentValidation import argument_validation
+
 
 class FitnessFunction(metaclass=ABCMeta):
     """Fitness evaluation metric for individuals.
@@ -54,7 +56,27 @@ class FitnessFunction(metaclass=ABCMeta):
 
 class VectorBasedFunction(FitnessFunction, metaclass=ABCMeta):
     """Fitness evaluation based on vectorized fitness
+
+    Parameters
+    ----------
+    training_data :
+                   (Optional) data that can be used in fitness evaluation
+    chunk_size : int
+                 (Optional) The number of data points in each block of rows of
+                 the training data that is evaluated at once.  Default is
+                 None: all of the training data is evaluated at once.
+
+    Attributes
+    ----------
+    chunk_size : int
+                 The number of data points in each block of rows of the
+                 training data that is evaluated at once
     """
+    @argument_validation(chunk_size={">": 0})
+    def __init__(self, training_data=None, chunk_size=None):
+        super().__init__(training_data)
+        self.chunk_size = chunk_size
+
     def __call__(self, individual):
         """Vector based fitness evaluation
 
@@ -71,9 +93,116 @@ class VectorBasedFunction(FitnessFunction, metaclass=ABCMeta):
          :
            fitness of the individual
         """
-        fitness_vector = self._evaluate_fitness_vector(individual)
-        return np.mean(np.abs(fitness_vector))
+        if self.chunk_size is None:
+            fitness_vector = self._evaluate_fitness_vector(individual)
+            return np.mean(np.abs(fitness_vector))
+
+        total_error = 0.0
+        num_points = 0
+        for fitness_vector in self._evaluate_fitness_vector_chunks(individual):
+            total_error += np.sum(np.abs(fitness_vector))
+            num_points += fitness_vector.size
+        return total_error / num_points
+
+    def evaluate_fitness_vector(self, individual):
+        """Vectorized fitness of an individual
+
+        Parameters
+        ----------
+        individual : Chromosome
+                     individual for which fitness will be calculated
+
+        Returns
+        -------
+        array of numeric :
+            the fitness vector of the individual
+        """
+        return self._evaluate_fitness_vector(individual)
 
     @abstractmethod
     def _evaluate_fitness_vector(self, individual):
         raise NotImplementedError
+
+    def _evaluate_fitness_vector_chunks(self, individual):
+        yield self._evaluate_fitness_vector(individual)
+
+    def _get_chunk_slices(self, num_points):
+        if self.chunk_size is None:
+            yield slice(None)
+            return
+        for start in range(0, max(num_points, 1), self.chunk_size):
+            yield slice(start, start + self.chunk_size)
+
+
+class VectorGradientMixin(metaclass=ABCMeta):
+    """Analytic derivatives of a vector based fitness
+
+    A mixin for `VectorBasedFunction` fitness functions which can calculate
+    the jacobian of their fitness vector with respect to the local
+    optimization parameters of an individual.  The gradient of the fitness
+    (mean absolute value of the fitness vector) follows from the jacobian.
+
+    Attributes
+    ----------
+    chunk_size : int
+                 The number of data points in each block of rows of the
+                 training data for which the fitness vector and jacobian are
+                 calculated at once (blocks are yielded by
+                 `_get_fitness_vector_and_jacobian_chunks`).  None (the
+                 default, unless set by e.g. `VectorBasedFunction`) calculates
+                 them for all of the training data at once.
+    """
+    chunk_size = None
+
+    @abstractmethod
+    def get_fitness_vector_and_jacobian(self, individual):
+        """Fitness vector and its jacobian
+
+        Parameters
+        ----------
+        individual : Chromosome
+                     individual for which fitness will be calculated
+
+        Returns
+        -------
+        tuple(N array of numeric, NxL array of numeric)
+            the fitness vector and its derivatives with respect to the L local
+            optimization parameters of the individual
+        """
+        raise NotImplementedError
+
+    def get_fitness_and_gradient(self, individual):
+        """Fitness and its gradient
+
+        Parameters
+        ----------
+        individual : Chromosome
+                     individual for which fitness will be calculated
+
+        Returns
+        -------
+        tuple(numeric, L array of numeric)
+            the fitness and its derivatives with respect to the L local
+            optimization parameters of the individual
+        """
+        if self.chunk_size is None:
+            fitness_vector, jacobian = \
+                self.get_fitness_vector_and_jacobian(individual)
+            fitness = np.mean(np.abs(fitness_vector))
+            gradient = np.mean(
+                np.sign(fitness_vector).reshape((-1, 1)) * jacobian, axis=0)
+            return fitness, gradient
+
+        total_error = 0.0
+        total_gradient = 0.0
+        num_points = 0
+        for fitness_vector, jacobian in \
+                self._get_fitness_vector_and_jacobian_chunks(individual):
+            total_error += np.sum(np.abs(fitness_vector))
+            total_gradient = total_gradient + np.sum(
+                np.sign(fitness_vector).reshape((-1, 1)) * jacobian, axis=0)
+            num_points += fitness_vector.size
+        return total_error / num_points, total_gradient / num_points
+
+    def _get_fitness_vector_and_jacobian_chunks(self, individual):
+        yield self.get_fitness_vector_and_jacobian(individual)
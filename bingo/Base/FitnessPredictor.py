@@ -12,6 +12,7 @@ Check out the works of the works of Schmidt and Lipson for more details:
 e.g., "Coevolution of Fitness Predictors" (2008) .
 """
 import logging
+import weakref
 from copy import copy
 import numpy as np
 from ..Util.ArgumentValidation import argument_validation
@@ -19,6 +20,8 @@ from .FitnessFunction import FitnessFunction
 
 LOGGER = logging.getLogger(__name__)
 
+MAX_INCREMENTAL_SUM_UPDATES = 32
+
 
 class FitnessPredictorFitnessFunction(FitnessFunction):
     """A fitness function for subset fitness predictors
@@ -39,6 +42,30 @@ class FitnessPredictorFitnessFunction(FitnessFunction):
                          as trainers
     num_trainers : int
                    number of trainers to use
+
+    Notes
+    -----
+    If the full fitness function provides `evaluate_fitness_vector` (e.g. a
+    `VectorBasedFunction`) with one value per point of the training data,
+    the absolute fitness vector of each trainer is cached when the trainer is
+    added.  Predicted fitness for the trainers is then the mean of the cached
+    values at the indices of the predictor, without evaluating the trainer.
+    The sums of these values are cached by the fitness function for each
+    evaluated predictor that is still alive (keyed by its id and a weak
+    reference).  A predictor which differs from a cached predictor by a
+    single index (e.g. after `SinglePointMutation`) has its sums updated by
+    the difference of the two points rather than recomputed.  Sums are
+    recomputed after `MAX_INCREMENTAL_SUM_UPDATES` successive updates, and
+    for each trainer that has been replaced.
+
+    The indices of a predictor are random, so indexing the training data with
+    them copies the selected points (only evenly spaced indices give a view,
+    see `as_view_index`).  Each subset is therefore gathered from the full
+    training data once and reused: the subset of each predictor that is still
+    alive, for the trainers that are evaluated on it, and the union of the
+    subsets of the predictors used by
+    `predict_fitness_for_trainer_by_predictors`, for every trainer predicted
+    by the same predictors.
     """
     @argument_validation(num_trainers={">": 0})
     def __init__(self, training_data, full_fitness_function,
@@ -47,9 +74,15 @@ class FitnessPredictorFitnessFunction(FitnessFunction):
         self._next_trainer_to_update = 0
         self.point_eval_count = 0
         self._fitness_function = copy(full_fitness_function)
-        self._trainers, self._true_fitness_for_trainers = \
+        self._trainers, self._true_fitness_for_trainers, \
+            self._point_errors_for_trainers = \
             self._make_initial_trainer_population(potential_trainers,
                                                   num_trainers)
+        self._trainer_ids = list(range(num_trainers))
+        self._next_trainer_id = num_trainers
+        self._point_error_sums_cache = {}
+        self._subset_training_data_cache = {}
+        self._union_training_data = None
 
     def __call__(self, individual):
         """Fitness function for subset fitness predictors
@@ -68,11 +101,17 @@ class FitnessPredictorFitnessFunction(FitnessFunction):
                 fitness of the predictor
         """
         self.eval_count += 1
+        point_error_sums = self._get_point_error_sums(individual)
         error_in_fitness_predictions = 0.0
-        for trainer, true_fitness in zip(self._trainers,
-                                         self._true_fitness_for_trainers):
-            predicted_fitness = \
-                self.predict_fitness_for_trainer(individual, trainer)
+        for trainer, true_fitness, point_errors, point_error_sum in \
+                zip(self._trainers, self._true_fitness_for_trainers,
+                    self._point_errors_for_trainers, point_error_sums):
+            if point_errors is None:
+                predicted_fitness = \
+                    self.predict_fitness_for_trainer(individual, trainer)
+            else:
+                self.point_eval_count += len(individual.values)
+                predicted_fitness = point_error_sum / len(individual.values)
             error_in_fitness_predictions += abs(true_fitness
                                                 - predicted_fitness)
         return error_in_fitness_predictions / len(self._trainers)
@@ -87,9 +126,16 @@ class FitnessPredictorFitnessFunction(FitnessFunction):
         trainer : Chromosome
                   individual to add to the training population
         """
-        self._trainers[self._next_trainer_to_update] = trainer.copy()
+        trainer = trainer.copy()
+        true_fitness, point_errors = self._get_true_fitness_for_trainer(trainer)
+        self._trainers[self._next_trainer_to_update] = trainer
         self._true_fitness_for_trainers[self._next_trainer_to_update] = \
-            self._get_true_fitness_for_trainer(trainer)
+            true_fitness
+        self._point_errors_for_trainers[self._next_trainer_to_update] = \
+            point_errors
+        self._trainer_ids[self._next_trainer_to_update] = \
+            self._next_trainer_id
+        self._next_trainer_id += 1
         self._increment_next_trainer_to_update()
 
     def predict_fitness_for_trainer(self, individual, trainer):
@@ -108,32 +154,191 @@ class FitnessPredictorFitnessFunction(FitnessFunction):
         float :
                 predicted fitness
         """
-        subset_training_data = \
-            self.training_data[individual.values]
+        subset_training_data = self._get_subset_training_data(individual)
         self._fitness_function.training_data = subset_training_data
         predicted_fitness = self._fitness_function(trainer)
         self.point_eval_count += len(subset_training_data)
         return predicted_fitness
 
+    def predict_fitness_for_trainer_by_predictors(self, individuals, trainer):
+        """Get predicted values of fitness for a trainer from several
+        predictors
+
+        If the full fitness function provides fitness vectors, the trainer is
+        evaluated once on the union of the subsets of all the predictors.
+        `point_eval_count` is still incremented by the size of the subset of
+        each predictor, as if each prediction were made separately, so that
+        the predictor computation ratio of a `FitnessPredictorIsland` does
+        not depend on the overlap of the subsets.
+
+        Parameters
+        ----------
+        individuals : list of MultipleValueChromosome
+                      subset fitness predictors to use in calculating
+                      predicted fitness
+        trainer : Chromosome
+                  the trainer of which to calculate fitness
+
+        Returns
+        -------
+        array of float :
+                         predicted fitness for each of the predictors
+        """
+        subset_sizes = np.array([len(indv.values) for indv in individuals])
+        point_errors = None
+        if np.all(subset_sizes > 0):
+            all_indices = np.concatenate(
+                [np.array(indv.values, dtype=int) for indv in individuals])
+            union_indices, union_positions = np.unique(all_indices,
+                                                       return_inverse=True)
+            point_errors = self._get_subset_point_errors(trainer,
+                                                         union_indices)
+
+        if point_errors is None:
+            return np.array([self.predict_fitness_for_trainer(indv, trainer)
+                             for indv in individuals])
+
+        self.point_eval_count += np.sum(subset_sizes)
+        subset_starts = np.cumsum(subset_sizes) - subset_sizes
+        return np.add.reduceat(point_errors[union_positions],
+                               subset_starts) / subset_sizes
+
+    def _get_subset_training_data(self, individual):
+        indices = np.array(individual.values, dtype=int)
+        cached = self._subset_training_data_cache.get(id(individual))
+        if cached is not None:
+            reference, source, cached_indices, subset_training_data = cached
+            if reference() is individual and source is self.training_data \
+                    and np.array_equal(cached_indices, indices):
+                return subset_training_data
+
+        for key, (reference, *_) in \
+                list(self._subset_training_data_cache.items()):
+            if reference() is None:
+                del self._subset_training_data_cache[key]
+        subset_training_data = self.training_data[individual.values]
+        self._subset_training_data_cache[id(individual)] = \
+            (weakref.ref(individual), self.training_data, indices,
+             subset_training_data)
+        return subset_training_data
+
+    def _get_union_training_data(self, indices):
+        if self._union_training_data is not None:
+            source, cached_indices, union_training_data = \
+                self._union_training_data
+            if source is self.training_data and \
+                    np.array_equal(cached_indices, indices):
+                return union_training_data
+
+        union_training_data = self.training_data[indices]
+        self._union_training_data = \
+            (self.training_data, indices, union_training_data)
+        return union_training_data
+
+    def _get_subset_point_errors(self, trainer, indices):
+        subset_training_data = self._get_union_training_data(indices)
+        self._fitness_function.training_data = subset_training_data
+        try:
+            fitness_vector = self._fitness_function.evaluate_fitness_vector(
+                trainer)
+        except AttributeError:
+            return None
+
+        if np.shape(fitness_vector) != (len(indices), ):
+            return None
+        return np.abs(fitness_vector)
+
+    def _get_point_error_sums(self, individual):
+        indices = np.array(individual.values, dtype=int)
+        trainer_ids = np.array(self._trainer_ids)
+        sums = np.full(len(self._trainers), np.nan)
+        num_updates = 0
+
+        cached = self._get_closest_cached_sums(individual, indices)
+        if cached is not None:
+            cached_indices, cached_trainer_ids, cached_sums, num_updates = \
+                cached
+            changed = np.flatnonzero(cached_indices != indices)
+            same_trainer = cached_trainer_ids == trainer_ids
+            if changed.size == 0:
+                sums[same_trainer] = cached_sums[same_trainer]
+            elif num_updates < MAX_INCREMENTAL_SUM_UPDATES:
+                num_updates += 1
+                old_index = cached_indices[changed[0]]
+                new_index = indices[changed[0]]
+                for i in np.flatnonzero(same_trainer):
+                    point_errors = self._point_errors_for_trainers[i]
+                    if point_errors is not None:
+                        sums[i] = cached_sums[i] + point_errors[new_index] \
+                            - point_errors[old_index]
+
+        needs_sum = ~np.isfinite(sums)
+        if np.any(needs_sum):
+            num_updates = 0
+        for i in np.flatnonzero(needs_sum):
+            point_errors = self._point_errors_for_trainers[i]
+            if point_errors is not None:
+                sums[i] = np.sum(point_errors[indices])
+
+        self._point_error_sums_cache[id(individual)] = \
+            (weakref.ref(individual), indices, trainer_ids, sums, num_updates)
+        return sums
+
+    def _get_closest_cached_sums(self, individual, indices):
+        closest = None
+        for key, (reference, cached_indices, *cached_sums) in \
+                list(self._point_error_sums_cache.items()):
+            cached_individual = reference()
+            if cached_individual is None:
+                del self._point_error_sums_cache[key]
+            elif cached_indices.shape == indices.shape:
+                num_changed = np.count_nonzero(cached_indices != indices)
+                if cached_individual is individual and num_changed == 0:
+                    return (cached_indices, *cached_sums)
+                if num_changed <= 1 and closest is None:
+                    closest = (cached_indices, *cached_sums)
+        return closest
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_point_error_sums_cache"] = {}
+        state["_subset_training_data_cache"] = {}
+        state["_union_training_data"] = None
+        return state
+
     def _get_true_fitness_for_trainer(self, trainer):
         self._fitness_function.training_data = self.training_data
-        predicted_fitness = self._fitness_function(trainer)
         self.point_eval_count += len(self.training_data)
-        return predicted_fitness
+        try:
+            fitness_vector = self._fitness_function.evaluate_fitness_vector(
+                trainer)
+        except AttributeError:
+            return self._fitness_function(trainer), None
+
+        point_errors = np.abs(fitness_vector)
+        true_fitness = np.mean(point_errors)
+        if point_errors.shape != (len(self.training_data), ):
+            point_errors = None
+        return true_fitness, point_errors
 
     def _make_initial_trainer_population(self, potential_trainers,
                                          num_trainers):
         trainers = []
         true_fitness_for_trainers = []
+        point_errors_for_trainers = []
         for indv in potential_trainers:
-            true_fitness = self._get_true_fitness_for_trainer(indv)
+            trainer = indv.copy()
+            true_fitness, point_errors = \
+                self._get_true_fitness_for_trainer(trainer)
             if not np.isnan(true_fitness):
-                trainers.append(indv.copy())
+                trainers.append(trainer)
                 true_fitness_for_trainers.append(true_fitness)
+                point_errors_for_trainers.append(point_errors)
             # TODO could implement a check to make sure no fitness predictors
             #  are nan for candidate individual
             if len(trainers) == num_trainers:
-                return trainers, true_fitness_for_trainers
+                return trainers, true_fitness_for_trainers, \
+                    point_errors_for_trainers
 
         raise RuntimeError("FitnessPredictorFitnessFunction could not be "
                            "initialized. Not enough valid trainers.")
@@ -78,6 +78,12 @@ class FitnessPredictorIsland(Island):
     population : list of Chromosomes
                  The population that is evolving
 
+    Notes
+    -----
+    The indices of the best fitness predictor are random, so its subset of
+    the training data is a copy of the selected points rather than a view.
+    The subset is gathered from the full training data when the best
+    predictor is updated, and only if its indices have changed.
     """
     @argument_validation(population_size={">=": 0},
                          predictor_population_size={">=": 0},
@@ -108,6 +114,7 @@ class FitnessPredictorIsland(Island):
             self._make_fitness_predictor_fitness_function()
 
         self._predictor_island = self._make_predictor_island()
+        self._best_predictor_values = None
         self._update_to_use_best_fitness_predictor()
 
     def execute_generational_step(self):
@@ -177,6 +184,9 @@ class FitnessPredictorIsland(Island):
 
     def _update_to_use_best_fitness_predictor(self):
         best_predictor = self._predictor_island.best_individual()
+        if best_predictor.values == self._best_predictor_values:
+            return
+        self._best_predictor_values = list(best_predictor.values)
         best_subset_data = \
             self._full_training_data[best_predictor.values]
         self._fitness_function.training_data = best_subset_data
@@ -186,20 +196,18 @@ class FitnessPredictorIsland(Island):
         self._predictor_fitness_function.add_trainer(best_candidate.copy())
 
     def _find_best_new_trainer(self):
-        best_candidate = self.population[0]
-        max_variance = 0
-        for individual in self.population:
-            variance = self._calculate_predictor_variance_of(individual)
-            if variance > max_variance:
-                max_variance = variance
-                best_candidate = individual
-        return best_candidate
+        variances = np.array([self._calculate_predictor_variance_of(indv)
+                              for indv in self.population])
+        variances[np.isnan(variances)] = -np.inf
+        best_index = np.argmax(variances)
+        if variances[best_index] > 0:
+            return self.population[best_index]
+        return self.population[0]
 
     def _calculate_predictor_variance_of(self, individual):
-        predicted_fitness_list = \
-            [self._predictor_fitness_function.predict_fitness_for_trainer(
-                    predictor, individual)
-             for predictor in self._predictor_island.population]
+        predicted_fitness_list = self._predictor_fitness_function.\
+            predict_fitness_for_trainer_by_predictors(
+                self._predictor_island.population, individual)
         try:
             variance = np.var(predicted_fitness_list)
         except (ArithmeticError, OverflowError, FloatingPointError,
@@ -22,3 +22,42 @@ class Generator(metaclass=ABCMeta):
             A newly generated individual
         """
         raise NotImplementedError
+
+    def generate_population(self, population_size):
+        """Generates a population of individuals
+
+        Parameters
+        ----------
+        population_size : int
+                          The number of individuals to generate
+
+        Returns
+        -------
+        list of GeneticIndividual :
+            The newly generated individuals
+        """
+        return [self() for _ in range(population_size)]
+
+
+def generate_population(generator, population_size):
+    """Generates a population of individuals with any generator
+
+    Uses the `generate_population` method of the generator if it has one.
+    Otherwise, e.g. for generators which are not a subclass of `Generator`,
+    the generator is called once per individual.
+
+    Parameters
+    ----------
+    generator : Generator
+                The generator of the individuals
+    population_size : int
+                      The number of individuals to generate
+
+    Returns
+    -------
+    list of GeneticIndividual :
+        The newly generated individuals
+    """
+    if hasattr(generator, "generate_population"):
+        return generator.generate_population(population_size)
+    return [generator() for _ in range(population_size)]
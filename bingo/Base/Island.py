@@ -9,6 +9,7 @@ import numpy as np
 
 from ..Util.ArgumentValidation import argument_validation
 from .AgeFitnessSelection import AgeFitness
+from .Generator import generate_population
 
 LOGGER = logging.getLogger(__name__)
 
@@ -18,7 +19,8 @@ class Island:
     Island: code for island of genetic algorithm
     """
     @argument_validation(population_size={">=": 0})
-    def __init__(self, evolution_algorithm, generator, population_size):
+    def __init__(self, evolution_algorithm, generator, population_size,
+                 pareto_archive=None):
         """Initialization of island
 
         Parameters
@@ -29,6 +31,11 @@ class Island:
             The generator class that returns an instance of a chromosome
         population_size : int
             The desired size of the population
+        pareto_archive : ParetoArchive
+            (Optional) An archive in which the pareto front of fitness and
+            complexity is maintained incrementally. Default is None: the
+            pareto front of age and fitness is selected with
+            `pareto_front_selection`.
 
         Attributes
         ----------
@@ -39,9 +46,10 @@ class Island:
             The population that is evolvingj
             
         """
-        self.population = [generator() for _ in range(population_size)]
+        self.population = generate_population(generator, population_size)
         self.generational_age = 0
         self.pareto_front_selection = AgeFitness()
+        self.pareto_archive = pareto_archive
         self._ea = evolution_algorithm
         self._population_size = population_size
         self._pareto_front = []
@@ -106,6 +114,9 @@ class Island:
         """Updates a list of Chromosomes that form the pareto front based on 
             the new population.
         """
+        if self.pareto_archive is not None:
+            self.pareto_archive.update(self.population)
+            return
         self._pareto_front = self.pareto_front_selection.select_pareto_front(
             self._pareto_front + self.population)
         self._pareto_front.sort(key=lambda x: x.fitness)
@@ -119,5 +130,7 @@ class Island:
             The list of Chromosomes in the population that represent the 
             pareto front. The pareto front is returned in sorted order.
         """
+        if self.pareto_archive is not None:
+            return self.pareto_archive.get_individuals()
         return self._pareto_front
         
\ No newline at end of file
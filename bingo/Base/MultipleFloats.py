@@ -47,6 +47,16 @@ class MultipleFloatChromosome(MultipleValueChromosome, ChromosomeInterface):
         """
         return len(self._needs_opt_list)
 
+    def get_local_optimization_params(self):
+        """Get local optimization parameters
+
+        Returns
+        -------
+        list of float
+            Values of the parameters
+        """
+        return [self.values[index] for index in self._needs_opt_list]
+
     def set_local_optimization_params(self, params):
         """Set local optimization parameters
 
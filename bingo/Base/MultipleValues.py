@@ -3,6 +3,8 @@
 This file contains several classes that are used for chromosomes
 that contains a list of genetic information. 
 """
+import copy
+
 import numpy as np
 
 from .Chromosome import Chromosome
@@ -36,6 +38,21 @@ class MultipleValueChromosome(Chromosome):
     def __str__(self):
         return str(self.values)
 
+    def copy(self):
+        """copy
+
+        A faster alternative to a deep copy: only the values are duplicated.
+
+        Returns
+        -------
+        MultipleValueChromosome
+            A copy of self
+        """
+        chromosome_copy = self.__class__.__new__(self.__class__)
+        chromosome_copy.__dict__.update(self.__dict__)
+        chromosome_copy.values = copy.copy(self.values)
+        return chromosome_copy
+
     def distance(self, chromosome):
         """Computes the distance (a measure of similarity) between
         two individuals.
@@ -49,9 +66,34 @@ class MultipleValueChromosome(Chromosome):
         dist : float
             The distance between self and another chromosome
         """
-        dist = np.sum(self.values != chromosome.values)
+        dist = np.sum(np.asarray(self.values) != np.asarray(chromosome.values))
         return dist
 
+    @classmethod
+    def paired_distances(cls, individuals, others):
+        """Distances between pairs of chromosomes
+
+        The values of all chromosomes are compared at once when all of them
+        have the same number of values.
+
+        Parameters
+        ----------
+        individuals : list of MultipleValueChromosome
+                      first chromosome of each pair
+        others : list of MultipleValueChromosome
+                 second chromosome of each pair
+
+        Returns
+        -------
+        array of int
+            distance from each individual to the corresponding other
+        """
+        if len({len(indv.values) for indv in individuals + others}) > 1:
+            return super().paired_distances(individuals, others)
+        values = np.array([indv.values for indv in individuals])
+        other_values = np.array([indv.values for indv in others])
+        return np.sum(values != other_values, axis=1)
+
 
 class MultipleValueChromosomeGenerator(Generator):
     """Generation of a population of Multi-Value Chromosomes
@@ -0,0 +1,237 @@
+"""The multiprocess implementation of the Archipelago
+
+This module defines the Archipelago data structure that runs each of its
+islands in a separate process on the local machine.  Islands stay in their
+worker processes; only migrating individuals and best individuals are
+communicated.
+"""
+import copy
+import multiprocessing
+import random
+
+import numpy as np
+
+from .Archipelago import Archipelago
+
+
+class ParallelArchipelago(Archipelago):
+    """An archipelago that executes island generations in parallel processes.
+
+    Worker processes are started on first use and run until `shutdown` is
+    called.  An error raised in a worker is raised again after the responses
+    of all workers have been received.  If the communication with a worker
+    fails, all workers are terminated.
+
+    Parameters
+    ----------
+    island : Island
+        The island from which other islands will be copied
+    num_islands : int, default = 2
+        The number of islands to create in the archipelago's
+        list of islands
+    """
+    def __init__(self, island, num_islands=2):
+        super().__init__(island, num_islands)
+        self._islands = self._generate_islands()
+        self._connections = None
+        self._workers = None
+        self._converged = False
+        self._best_indv = None
+
+    def step_through_generations(self, num_steps):
+        """ Executes 'num_steps' number of generations for
+        each island in the archipelago's list of islands
+
+        Parameters
+        ----------
+        num_steps : int
+            The number of generations to execute per island
+        """
+        self._send_to_all("step", num_steps)
+        self._receive_from_all()
+        self.archipelago_age += num_steps
+
+    def coordinate_migration_between_islands(self):
+        """Shuffles island populations for migration and performs
+        migration by swapping pairs of individuals between islands
+        """
+        self._send_to_all("population_size")
+        pop_sizes = self._receive_from_all()
+        island_partners = self._shuffle_island_indices()
+
+        for i in range(self._num_islands//2):
+            self._swap_island_individuals(island_partners[i*2],
+                                          island_partners[i*2 + 1],
+                                          pop_sizes)
+
+    def test_for_convergence(self, error_tol):
+        """Tests that the fitness of individuals is less than
+        or equal to the specified error tolerance
+
+        Parameters
+        ----------
+        error_tol : int
+            Upper bound for acceptable fitness of an individual
+
+        Returns
+        -------
+        bool :
+            Indicates whether a chromosome has converged.
+        """
+        self._send_to_all("best_individual")
+        list_of_best_indvs = self._receive_from_all()
+        list_of_best_indvs.sort(key=lambda x: x.fitness)
+
+        best_indv = list_of_best_indvs[0]
+        converged = best_indv.fitness <= error_tol
+
+        self._best_indv = best_indv
+        self._converged = converged
+        return converged
+
+    def get_best_individual(self):
+        """Returns the best individual if the islands converged to an
+        acceptable fitness.
+
+        Returns
+        -------
+        Chromosome :
+            The best individual whose fitness was within the error
+            tolerance.
+        """
+        return self._best_indv
+
+    def get_populations(self):
+        """Gathers the populations of all of the islands
+
+        Returns
+        -------
+        list of list of Chromosomes :
+            The population of each island
+        """
+        self._send_to_all("population")
+        return self._receive_from_all()
+
+    def shutdown(self):
+        """Stops the worker processes"""
+        if self._workers is None:
+            return
+        try:
+            self._send_to_all("stop")
+            for worker in self._workers:
+                worker.join()
+        finally:
+            self._terminate_workers()
+
+    def _generate_islands(self):
+        island_list = []
+        for _ in range(self._num_islands):
+            island_list.append(copy.deepcopy(self._island))
+        return island_list
+
+    def _start_workers(self):
+        self._connections = []
+        self._workers = []
+        for island in self._islands:
+            parent_connection, worker_connection = multiprocessing.Pipe()
+            worker = multiprocessing.Process(target=_island_worker,
+                                             args=(island, worker_connection),
+                                             daemon=True)
+            worker.start()
+            self._connections.append(parent_connection)
+            self._workers.append(worker)
+        self._islands = None
+
+    def _send_to_all(self, command, *args):
+        if self._workers is None:
+            if self._islands is None:
+                raise RuntimeError("The worker processes were terminated")
+            self._start_workers()
+        for i in range(self._num_islands):
+            self._send(i, command, *args)
+
+    def _receive_from_all(self):
+        return self._receive(*range(self._num_islands))
+
+    def _send(self, island_index, command, *args):
+        try:
+            self._connections[island_index].send((command, args))
+        except BaseException:
+            self._terminate_workers()
+            raise
+
+    def _receive(self, *island_indices):
+        try:
+            responses = [self._connections[i].recv() for i in island_indices]
+        except BaseException:
+            self._terminate_workers()
+            raise
+        for response in responses:
+            if isinstance(response, Exception):
+                raise response
+        return responses
+
+    def _terminate_workers(self):
+        if self._workers is None:
+            return
+        for worker in self._workers:
+            if worker.is_alive():
+                worker.terminate()
+            worker.join()
+        for connection in self._connections:
+            connection.close()
+        self._connections = None
+        self._workers = None
+
+    def _shuffle_island_indices(self):
+        indices = list(range(self._num_islands))
+        random.shuffle(indices)
+        return indices
+
+    def _swap_island_individuals(self, island_1, island_2, pop_sizes):
+        indexes_to_2, indexes_to_1 = Archipelago.assign_send_receive_by_size(
+            pop_sizes[island_1], pop_sizes[island_2])
+
+        self._send(island_1, "emigrate", indexes_to_2)
+        self._send(island_2, "emigrate", indexes_to_1)
+        indvs_to_2, indvs_to_1 = self._receive(island_1, island_2)
+
+        self._send(island_1, "immigrate", indvs_to_1)
+        self._send(island_2, "immigrate", indvs_to_2)
+        self._receive(island_1, island_2)
+
+
+def _island_worker(island, connection):
+    np.random.seed()
+    random.seed()
+    emigrant_indexes = set()
+    while True:
+        command, args = connection.recv()
+        if command == "stop":
+            break
+        try:
+            if command == "step":
+                for _ in range(args[0]):
+                    island.execute_generational_step()
+                response = None
+            elif command == "population_size":
+                response = len(island.population)
+            elif command == "best_individual":
+                response = island.best_individual()
+            elif command == "population":
+                response = island.population
+            elif command == "emigrate":
+                emigrant_indexes = args[0]
+                response = [island.population[i] for i in emigrant_indexes]
+            elif command == "immigrate":
+                new_population = [indv for i, indv
+                                  in enumerate(island.population)
+                                  if i not in emigrant_indexes] + args[0]
+                island.load_population(new_population)
+                response = None
+            else:
+                raise KeyError("{} is not a worker command".format(command))
+        except Exception as err:  # pylint: disable=broad-except
+            response = err
+        connection.send(response)
+    connection.close()
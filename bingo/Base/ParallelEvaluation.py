@@ -0,0 +1,172 @@
+"""The genetic operation of Evaluation, performed in parallel.
+
+This module defines an evaluation phase of bingo evolutionary algorithms
+which distributes fitness evaluations over a pool of processes.  The fitness
+function (and its training data) is installed once in each worker process;
+only the individuals and the results of their evaluation are exchanged.
+"""
+from concurrent.futures import ProcessPoolExecutor
+import os
+
+import numpy as np
+
+from .Evaluation import Evaluation
+from ..Util.ArgumentValidation import argument_validation
+
+_WORKER_FITNESS_FUNCTION = None
+
+
+class ParallelEvaluation(Evaluation):
+    """Phase for calculating fitness of a population on multiple processes.
+
+    All individuals in the population are evaluated with a fitness function
+    unless their fitness has already been set.  Evaluations are performed by
+    a `concurrent.futures.ProcessPoolExecutor` which is started on first use
+    and restarted whenever the training data of the fitness function is
+    replaced by different data, or when `refresh_training_data` is called.
+
+    Parameters
+    ----------
+    fitness_function : FitnessFunction
+                        The function class that is used to calculate fitnesses
+                        of individuals in the population.
+    num_workers : int
+                  (Optional) The number of worker processes. Default is the
+                  number of cpus.
+
+    Attributes
+    ----------
+    fitness_function : FitnessFunction
+                        The function class that is used to calculate fitnesses
+                        of individuals in the population.
+    eval_count : int
+                 the number of fitness function evaluations that have occurred,
+                 including the evaluations performed by the workers
+
+    Notes
+    -----
+    Individuals which need local optimization get their optimized parameters
+    from the workers through `get_local_optimization_params` and
+    `set_local_optimization_params`.
+
+    Replaced training data is compared with the data of the workers by a
+    fingerprint which does not depend on the size of the data: the shape,
+    dtype, strides and memory bounds of its public arrays, and the values of
+    its other public attributes.  Replacing the training data by a view of
+    the same memory (e.g. the same evenly spaced subset of memory-mapped
+    data) therefore does not restart the workers, whereas a copy of equal
+    data does.  Training data which is modified in place is not detected;
+    call `refresh_training_data` afterwards.
+    """
+    @argument_validation(num_workers={">": 0})
+    def __init__(self, fitness_function, num_workers=None):
+        super().__init__(fitness_function)
+        if num_workers is None:
+            num_workers = os.cpu_count()
+        self._num_workers = num_workers
+        self._executor = None
+        self._executor_training_data = None
+        self._executor_training_data_fingerprint = None
+
+    def __call__(self, population):
+        """Evaluates the fitness of an individual
+
+        Parameters
+        ----------
+        population : list of Chromosome
+                     population for which fitness should be calculated
+        """
+        unevaluated = [indv for indv in population if not indv.fit_set]
+        if not unevaluated:
+            return
+
+        chunksize = max(1, len(unevaluated) // (4 * self._num_workers))
+        results = self._get_executor().map(_evaluate_in_worker, unevaluated,
+                                           chunksize=chunksize)
+        for indv, (fitness, params, eval_count) in zip(unevaluated, results):
+            if params is not None:
+                indv.set_local_optimization_params(params)
+            indv.fitness = fitness
+            self.eval_count += eval_count
+
+    def shutdown(self):
+        """Stop the worker processes"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+            self._executor_training_data = None
+            self._executor_training_data_fingerprint = None
+
+    def refresh_training_data(self):
+        """Sends the training data to the workers again
+
+        Needed after the training data of the fitness function is modified
+        in place.  The worker processes are restarted on the next
+        evaluation.
+        """
+        self.shutdown()
+
+    def _get_executor(self):
+        training_data = getattr(self.fitness_function, "training_data", None)
+        if self._executor is not None and \
+                self._executor_training_data is not training_data:
+            if _get_fingerprint(training_data) != \
+                    self._executor_training_data_fingerprint:
+                self.shutdown()
+            else:
+                self._executor_training_data = training_data
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                self._num_workers, initializer=_initialize_worker,
+                initargs=(self.fitness_function, ))
+            self._executor_training_data = training_data
+            self._executor_training_data_fingerprint = \
+                _get_fingerprint(training_data)
+        return self._executor
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        state["_executor_training_data"] = None
+        state["_executor_training_data_fingerprint"] = None
+        return state
+
+
+def _get_fingerprint(data):
+    # The training data of the workers is referenced while its fingerprint is
+    # used, so neither its memory bounds nor the ids of its objects can be
+    # reused by different data.
+    if isinstance(data, np.ndarray):
+        return (data.shape, data.dtype.str, data.strides,
+                np.byte_bounds(data))
+    if data is None or isinstance(data, (bool, int, float, complex, str,
+                                         bytes)):
+        return data
+    if isinstance(data, (list, tuple)):
+        return (type(data), tuple(_get_fingerprint(item) for item in data))
+    if hasattr(data, "__dict__"):
+        return (type(data),
+                tuple((name, _get_fingerprint(value))
+                      for name, value in sorted(vars(data).items())
+                      if not name.startswith("_")))
+    return id(data)
+
+
+def _initialize_worker(fitness_function):
+    global _WORKER_FITNESS_FUNCTION
+    _WORKER_FITNESS_FUNCTION = fitness_function
+    np.random.seed()
+
+
+def _evaluate_in_worker(individual):
+    initial_eval_count = _WORKER_FITNESS_FUNCTION.eval_count
+    needs_opt = hasattr(individual, "needs_local_optimization") and \
+        individual.needs_local_optimization()
+
+    fitness = _WORKER_FITNESS_FUNCTION(individual)
+
+    params = None
+    if needs_opt:
+        params = individual.get_local_optimization_params()
+    eval_count = _WORKER_FITNESS_FUNCTION.eval_count - initial_eval_count
+    return fitness, params, eval_count
@@ -0,0 +1,154 @@
+"""A bounded archive of non-dominated individuals
+
+This module contains an archive of the individuals that form the pareto front
+of fitness and complexity of all individuals that have been inserted.
+Individuals are inserted one at a time and the archive is kept sorted by
+fitness, so that maintaining the front of an evolving population is cheap.
+If the archive has a maximum size, the most crowded individuals are evicted.
+"""
+import bisect
+
+import numpy as np
+
+from ..Util.ArgumentValidation import argument_validation
+
+
+class ParetoArchive:
+    """An archive of non-dominated individuals
+
+    Both objectives are minimized: fitness and complexity.  Individuals
+    without a `get_complexity` method have a complexity of 0.  Of several
+    individuals with identical objectives only the first one inserted is
+    kept.
+
+    Parameters
+    ----------
+    max_size : int
+               (Optional) The maximum number of individuals in the archive.
+               Default is None: the size is unbounded.
+
+    Notes
+    -----
+    Copies of the inserted individuals are stored.  Genetic age is not an
+    objective: the age of a stored copy does not increase, so it could not
+    be compared with the ages of evolving individuals.
+    """
+    @argument_validation(max_size={">": 0})
+    def __init__(self, max_size=None):
+        self._max_size = max_size
+        self._individuals = []
+        self._keys = []
+        self._objectives = np.empty((0, 2))
+
+    def update(self, population):
+        """Inserts all individuals of a population into the archive
+
+        Parameters
+        ----------
+        population : list of Chromosome
+                     individuals to insert
+        """
+        for individual in population:
+            self.insert(individual)
+
+    def insert(self, individual):
+        """Inserts an individual into the archive if it is not dominated
+
+        Individuals in the archive that are dominated by the new individual
+        are removed.
+
+        Parameters
+        ----------
+        individual : Chromosome
+                     individual to insert
+
+        Returns
+        -------
+        bool :
+            whether the individual was inserted
+        """
+        objectives = self._get_objectives(individual)
+        if np.any(np.isnan(objectives)):
+            return False
+
+        key = tuple(objectives)
+        position = bisect.bisect_right(self._keys, key)
+        if np.any(np.all(self._objectives[:position] <= objectives, axis=1)):
+            return False
+
+        is_dominated = np.all(self._objectives[position:] >= objectives,
+                              axis=1)
+        for dominated_position in \
+                np.flatnonzero(is_dominated)[::-1] + position:
+            del self._individuals[dominated_position]
+            del self._keys[dominated_position]
+        remaining = np.ones(len(self._objectives), dtype=bool)
+        remaining[position:] = ~is_dominated
+
+        self._individuals.insert(position, individual.copy())
+        self._keys.insert(position, key)
+        self._objectives = np.insert(self._objectives[remaining], position,
+                                     objectives, axis=0)
+
+        if self._max_size is not None and len(self) > self._max_size:
+            self._evict_most_crowded()
+        return True
+
+    def get_individuals(self):
+        """Gets the individuals in the archive
+
+        Returns
+        -------
+        list of Chromosome :
+            The individuals in the archive, sorted by fitness
+        """
+        return list(self._individuals)
+
+    def clear(self):
+        """Remove all individuals from the archive"""
+        self._individuals = []
+        self._keys = []
+        self._objectives = self._objectives[:0]
+
+    def __len__(self):
+        """Gets the number of individuals in the archive
+
+        Returns
+        -------
+        int :
+            size of the archive
+        """
+        return len(self._individuals)
+
+    def __getitem__(self, index):
+        return self._individuals[index]
+
+    def __iter__(self):
+        return iter(self._individuals)
+
+    def _get_objectives(self, individual):
+        fitness = individual.fitness
+        if fitness is None:
+            fitness = np.nan
+        complexity = 0
+        if hasattr(individual, "get_complexity"):
+            complexity = individual.get_complexity()
+        return np.array([fitness, complexity], dtype=float)
+
+    def _evict_most_crowded(self):
+        most_crowded = np.argmin(self._get_crowding_distances())
+        del self._individuals[most_crowded]
+        del self._keys[most_crowded]
+        self._objectives = np.delete(self._objectives, most_crowded, axis=0)
+
+    def _get_crowding_distances(self):
+        distances = np.zeros(len(self._objectives))
+        for objective in self._objectives.T:
+            order = np.argsort(objective, kind="stable")
+            distances[order[[0, -1]]] = np.inf
+            objective_range = objective[order[-1]] - objective[order[0]]
+            if objective_range > 0:
+                distances[order[1:-1]] += \
+                    (objective[order[2:]] - objective[order[:-2]]) \
+                    / objective_range
+        return distances
@@ -5,7 +5,6 @@ individuals (or "chromosomes") chosen at random from the population. The winner
 of each tournament (the one with the smallest fitness) is selected to advance
 into the next generation.
 """
-from operator import attrgetter
 import numpy as np
 
 from .Selection import Selection
@@ -25,6 +24,15 @@ class Tournament(Selection):
     ----------
     tournament_size : int
                       The size of the tournaments
+
+    Notes
+    -----
+    All tournaments are drawn at once as a matrix of random population
+    indices, in which each row holds the members of one tournament.  Only
+    tournaments with repeated members are redrawn (without replacement), so
+    that the members of each tournament are distinct.  Individuals
+    with a fitness of nan never win a tournament against an individual with a
+    numeric fitness.
     """
     @argument_validation(tournament_size={">=": 1})
     def __init__(self, tournament_size):
@@ -45,11 +53,23 @@ class Tournament(Selection):
         list of Chromosome :
             A subset of the input population
         """
-        next_generation = []
-        for _ in range(target_population_size):
-            tournament_members = np.random.choice(population, self._size,
-                                                  replace=False)
-            winner = min(tournament_members, key=attrgetter('fitness'))
-            next_generation.append(winner.copy())
-
-        return next_generation
+        if self._size > len(population):
+            raise ValueError("Tournament size is larger than the population")
+        tournaments = self._draw_tournaments(len(population),
+                                             target_population_size)
+        fitness = np.array([indv.fitness for indv in population], dtype=float)
+        fitness[np.isnan(fitness)] = np.inf
+        winners = tournaments[np.arange(target_population_size),
+                              np.argmin(fitness[tournaments], axis=1)]
+        return [population[i].copy() for i in winners]
+
+    def _draw_tournaments(self, population_size, num_tournaments):
+        tournaments = np.random.randint(population_size,
+                                        size=(num_tournaments, self._size))
+        sorted_tournaments = np.sort(tournaments, axis=1)
+        has_repeats = np.any(
+            sorted_tournaments[:, 1:] == sorted_tournaments[:, :-1], axis=1)
+        for i in np.flatnonzero(has_repeats):
+            tournaments[i] = np.random.choice(population_size, self._size,
+                                              replace=False)
+        return tournaments
@@ -1,15 +1,29 @@
 """
 This module contains the abstract definition of the data containers that store
-training data for bingo evolutionary analysis.
+training data for bingo evolutionary analysis.  It also contains helper
+functions for memory-mapped training data: loading of arrays from .npy files
+and conversion of evenly spaced indices to slices so that their subsets are
+views.
 """
 
 import abc
+from collections import namedtuple
+import mmap
+import os
+
+import numpy as np
 
 
 class TrainingData(metaclass=abc.ABCMeta):
     """An index-able data containing class
 
     An abstract base class for a training data container.
+
+    Notes
+    -----
+    Memory-mapped arrays in the training data are pickled by reference to
+    their file (rather than by value) so that copies of the training data,
+    e.g. in worker processes, share the same file-backed memory.
     """
     @abc.abstractmethod
     def __getitem__(self, items):
@@ -37,3 +51,121 @@ class TrainingData(metaclass=abc.ABCMeta):
             size of the training dataset
         """
         raise NotImplementedError
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for name, value in state.items():
+            reference = _get_memmap_reference(value)
+            if reference is not None:
+                state[name] = reference
+        return state
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            if isinstance(value, _MemmapReference):
+                state[name] = value.open()
+        self.__dict__.update(state)
+
+
+def load_arrays(path, names, mmap_mode="r"):
+    """Loads named arrays from a directory of .npy files or a .npz archive
+
+    The arrays in a directory are stored one per file, named `<name>.npy`
+    (e.g. written by `np.save`), and are memory-mapped with `np.load`.  The
+    arrays in a .npz archive cannot be memory-mapped and are read into
+    memory.
+
+    Parameters
+    ----------
+    path : str
+           path to a directory of .npy files or to a .npz archive
+    names : list of str
+            names of the arrays
+    mmap_mode : {None, 'r+', 'r', 'c'}
+                (Optional) mode of the memory maps of the arrays in a
+                directory, see `np.memmap`.  None reads all arrays into
+                memory. Default is 'r'.
+
+    Returns
+    -------
+    list of numpy array :
+        the arrays in the order of `names`.  Missing arrays are None.
+    """
+    if os.path.isdir(path):
+        arrays = []
+        for name in names:
+            filename = os.path.join(path, name + ".npy")
+            if os.path.exists(filename):
+                arrays.append(np.load(filename, mmap_mode=mmap_mode))
+            else:
+                arrays.append(None)
+        return arrays
+
+    with np.load(path) as archive:
+        return [archive[name] if name in archive.files else None
+                for name in names]
+
+
+def as_view_index(items):
+    """Converts evenly spaced indices into an equivalent slice
+
+    Indexing an array with a slice gives a view of the array rather than a
+    copy.  Indices which are not evenly spaced, such as the random indices of
+    fitness predictors, cannot be converted and still give a copy.
+
+    Parameters
+    ----------
+    items : list, array or slice
+            indices of a subset
+
+    Returns
+    -------
+    slice or type of items :
+        an equivalent slice if the indices are evenly spaced, increasing and
+        non-negative, otherwise `items` is returned unchanged
+    """
+    if not isinstance(items, (list, np.ndarray)) or len(items) == 0:
+        return items
+    indices = np.asarray(items)
+    if indices.ndim != 1 or not np.issubdtype(indices.dtype, np.integer) \
+            or indices[0] < 0:
+        return items
+    if len(indices) == 1:
+        return slice(int(indices[0]), int(indices[0]) + 1)
+    step = indices[1] - indices[0]
+    if step <= 0 or np.any(np.diff(indices) != step):
+        return items
+    return slice(int(indices[0]), int(indices[-1]) + 1, int(step))
+
+
+class _MemmapReference(namedtuple("_MemmapReference",
+                                  ["filename", "mode", "offset", "dtype",
+                                   "shape", "order"])):
+    def open(self):
+        return np.memmap(self.filename, dtype=self.dtype, mode=self.mode,
+                         offset=self.offset, shape=self.shape,
+                         order=self.order)
+
+
+def _get_memmap_reference(array):
+    if not isinstance(array, np.memmap) or array.size == 0:
+        return None
+    file_map = array
+    while isinstance(file_map.base, np.ndarray):
+        file_map = file_map.base
+    if not isinstance(file_map, np.memmap) \
+            or not isinstance(file_map.base, mmap.mmap) \
+            or file_map.filename is None:
+        return None
+    if array.flags.c_contiguous:
+        order = "C"
+    elif array.flags.f_contiguous:
+        order = "F"
+    else:
+        return None
+
+    offset = file_map.offset + np.byte_bounds(array)[0] \
+        - np.byte_bounds(file_map)[0]
+    mode = "r+" if file_map.mode == "w+" else file_map.mode
+    return _MemmapReference(file_map.filename, mode, offset, array.dtype,
+                            array.shape, order)
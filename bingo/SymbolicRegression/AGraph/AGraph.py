@@ -53,6 +53,9 @@ IS_ARITY_2_MAP : dict {int: bool}
 IS_TERMINAL_MAP : dict {int: bool}
                  A map of node number to boolean that states whether the
                  node is a terminal
+IS_COMMUTATIVE_MAP : dict {int: bool}
+                     A map of node number to boolean that states whether the
+                     node is an arity 2 node whose parameters commute
 STACK_PRINT_MAP : dict {int: str}
                   A map of node number to a format string for stack output
 LATEX_PRINT_MAP : dict {int: str}
@@ -60,11 +63,13 @@ LATEX_PRINT_MAP : dict {int: str}
 CONSOLE_PRINT_MAP : dict {int: str}
                   A map of node number to a format string for console output
 """
+import copy
 import logging
 import numpy as np
 
 from ..Equation import Equation
 from ...Base import ContinuousLocalOptimization
+from . import StackCompiler
 
 try:
     from bingocpp.build import bingocpp as Backend
@@ -139,20 +144,59 @@ IS_TERMINAL_MAP = {0: True,
                    11: False,
                    12: False}
 
+IS_COMMUTATIVE_MAP = {0: False,
+                      1: False,
+                      2: True,
+                      3: False,
+                      4: True,
+                      5: False,
+                      6: False,
+                      7: False,
+                      8: False,
+                      9: False,
+                      10: False,
+                      11: False,
+                      12: False}
+
 
 class AGraph(Equation, ContinuousLocalOptimization.ChromosomeInterface):
     """Acyclic graph representation of an equation.
 
     Agraph is initialized with with empty command array and no constants.
 
+    Parameters
+    ----------
+    compiled_evaluation : bool
+                          (optional) evaluate the equation with a compiled
+                          (and cached) version of its stack rather than with
+                          the backend. Default is False.
+    simplification : bool
+                     (optional) evaluate the equation (and its derivatives
+                     with respect to x) with a simplified version of its
+                     stack. Default is False.
+
     Attributes
     ----------
     command_array
+
+    Notes
+    -----
+    The simplified stack folds each subgraph that depends only on constants
+    into a single constant, whose value is calculated whenever the constants
+    are set.  It also collapses abs(abs(x)) into abs(x).  Both are exact for
+    all floating point values, including non-finite ones, so the simplified
+    stack evaluates to the same values as the unsimplified one.  Derivatives
+    with respect to the constants are evaluated with the unsimplified stack.
     """
-    def __init__(self):
+    def __init__(self, compiled_evaluation=False, simplification=False):
         super().__init__()
+        self._compiled_evaluation = compiled_evaluation
+        self._simplification = simplification
         self._command_array = np.empty([0, 3], dtype=int)
         self._short_command_array = np.empty([0, 3], dtype=int)
+        self._simplified_command_array = self._short_command_array
+        self._simplified_constant_sources = []
+        self._simplified_constants = None
         self._constants = []
         self._needs_opt = False
         self._num_constants = 0
@@ -188,15 +232,36 @@ class AGraph(Equation, ContinuousLocalOptimization.ChromosomeInterface):
             self._renumber_constants(util)
 
         self._update_short_command_array(util)
+        if self._simplification:
+            self._simplified_command_array, \
+                self._simplified_constant_sources = \
+                _simplify_stack(self._short_command_array)
+            self._simplified_constants = None
+            if not self._needs_opt:
+                self._fold_constants()
 
     def _update_short_command_array(self, util):
-        self._short_command_array = self._command_array[util]
+        short_command_array = _get_compacted_stack(self._command_array, util)
+        self._short_command_array = \
+            _eliminate_common_subexpressions(short_command_array)
+
+    def _fold_constants(self):
+        constants = np.empty(len(self._simplified_constant_sources))
+        for i, source in enumerate(self._simplified_constant_sources):
+            if source.shape[0] == 1:
+                constants[i] = self._constants[source[0, 1]]
+            else:
+                constants[i] = Backend.evaluate(source, np.zeros((1, 1)),
+                                                self._constants)[0, 0]
+        self._simplified_constants = constants
 
-        buffer_map = np.cumsum(util)
-        for command in self._short_command_array:
-            if not IS_TERMINAL_MAP[command[0]]:
-                command[1] = buffer_map[command[1]] - 1
-                command[2] = buffer_map[command[2]] - 1
+    def _get_evaluation_stack_and_constants(self):
+        if not self._simplification:
+            return self._short_command_array, self._constants
+
+        if self._simplified_constants is None:
+            self._fold_constants()
+        return self._simplified_command_array, self._simplified_constants
 
     def _check_optimization_requirement(self, util):
         for i in range(self._command_array.shape[0]):
@@ -228,6 +293,24 @@ class AGraph(Equation, ContinuousLocalOptimization.ChromosomeInterface):
         """
         return self._needs_opt
 
+    def copy(self):
+        """copy
+
+        A faster alternative to a deep copy: only the command arrays and
+        constants are duplicated.
+
+        Returns
+        -------
+        AGraph
+            A copy of self
+        """
+        agraph_copy = self.__class__.__new__(self.__class__)
+        agraph_copy.__dict__.update(self.__dict__)
+        agraph_copy._command_array = np.copy(self._command_array)
+        agraph_copy._short_command_array = np.copy(self._short_command_array)
+        agraph_copy._constants = copy.copy(self._constants)
+        return agraph_copy
+
     def get_utilized_commands(self):
         """"Find which commands are utilized.
 
@@ -253,6 +336,16 @@ class AGraph(Equation, ContinuousLocalOptimization.ChromosomeInterface):
         """
         return self._num_constants
 
+    def get_local_optimization_params(self):
+        """Get the local optimization parameters.
+
+        Returns
+        -------
+        list of numeric
+            Values of constants
+        """
+        return self._constants
+
     def set_local_optimization_params(self, params):
         """Set the local optimization parameters.
 
@@ -265,6 +358,8 @@ class AGraph(Equation, ContinuousLocalOptimization.ChromosomeInterface):
         """
         self._constants = params
         self._needs_opt = False
+        if self._simplification:
+            self._fold_constants()
 
     def evaluate_equation_at(self, x):
         """Evaluate the AGraph equation.
@@ -283,8 +378,10 @@ class AGraph(Equation, ContinuousLocalOptimization.ChromosomeInterface):
             :math:`f(x)`
         """
         try:
-            f_of_x = Backend.evaluate(self._short_command_array,
-                                      x, self._constants)
+            stack, constants = self._get_evaluation_stack_and_constants()
+            if self._compiled_evaluation:
+                return StackCompiler.evaluate(stack, x, constants)
+            f_of_x = Backend.evaluate(stack, x, constants)
             return f_of_x
         except (ArithmeticError, OverflowError, ValueError,
                 FloatingPointError) as err:
@@ -308,8 +405,9 @@ class AGraph(Equation, ContinuousLocalOptimization.ChromosomeInterface):
             :math:`f(x)` and :math:`df(x)/dx_i`
         """
         try:
+            stack, constants = self._get_evaluation_stack_and_constants()
             f_of_x, df_dx = Backend.evaluate_with_derivative(
-                self._short_command_array, x, self._constants, True)
+                stack, x, constants, True)
             return f_of_x, df_dx
         except (ArithmeticError, OverflowError, ValueError,
                 FloatingPointError) as err:
@@ -398,6 +496,25 @@ class AGraph(Equation, ContinuousLocalOptimization.ChromosomeInterface):
         """
         return np.count_nonzero(self.get_utilized_commands())
 
+    def get_structure_key(self):
+        """Hashable representation of the structure of the AGraph equation.
+
+        Agraphs which differ only in unused commands, unused parameters or the
+        values of their constants have the same key.
+
+        Returns
+        -------
+        bytes
+            the utilized commands of the stack, with renumbered constants and
+            unused parameters removed
+        """
+        key_array = np.copy(self._short_command_array)
+        is_constant = key_array[:, 0] == 1
+        key_array[is_constant, 1] = np.arange(np.count_nonzero(is_constant))
+        is_arity_1 = [not IS_ARITY_2_MAP[node] for node in key_array[:, 0]]
+        key_array[is_arity_1, 2] = key_array[is_arity_1, 1]
+        return key_array.tobytes()
+
     def _get_stack_string(self, short=False):
         if short:
             stack = self._short_command_array
@@ -468,3 +585,146 @@ class AGraph(Equation, ContinuousLocalOptimization.ChromosomeInterface):
         dist = np.sum(self.command_array != chromosome.command_array)
 
         return dist
+
+    @classmethod
+    def paired_distances(cls, individuals, others):
+        """Computes the distances between pairs of Agraphs
+
+        The command arrays of all agraphs are stacked and compared at once
+        when they have the same size.
+
+        Parameters
+        ----------
+        individuals : list of Agraph
+                      first individual of each pair
+        others : list of Agraph
+                 second individual of each pair
+
+        Returns
+        -------
+         : array of int
+            distance from each individual to the corresponding other
+        """
+        if len({indv.command_array.shape
+                for indv in individuals + others}) > 1:
+            return super().paired_distances(individuals, others)
+        command_arrays = np.stack([indv.command_array
+                                   for indv in individuals])
+        other_command_arrays = np.stack([indv.command_array
+                                         for indv in others])
+        return np.sum(command_arrays != other_command_arrays, axis=(1, 2))
+
+
+def _get_compacted_stack(stack, util):
+    """The utilized commands of a stack, with references renumbered"""
+    compacted_stack = stack[util]
+
+    buffer_map = np.cumsum(util)
+    for command in compacted_stack:
+        if not IS_TERMINAL_MAP[command[0]]:
+            command[1] = buffer_map[command[1]] - 1
+            command[2] = buffer_map[command[2]] - 1
+    return compacted_stack
+
+
+def _eliminate_common_subexpressions(stack):
+    """Removes commands that are identical to a previous command
+
+    Commands are identical if they have the same node and the same (used)
+    parameters, after references to removed commands have been redirected to
+    their identical predecessors.
+    """
+    first_occurrence = {}
+    short_locations = np.empty(stack.shape[0], dtype=int)
+    kept_commands = []
+    for i, (node, param1, param2) in enumerate(stack):
+        if not IS_TERMINAL_MAP[node]:
+            param1 = short_locations[param1]
+            if IS_ARITY_2_MAP[node] or 0 <= param2 < i:
+                param2 = short_locations[param2]
+        command_key = _get_command_key(node, param1, param2)
+        if command_key not in first_occurrence:
+            first_occurrence[command_key] = len(kept_commands)
+            kept_commands.append((node, param1, param2))
+        short_locations[i] = first_occurrence[command_key]
+
+    if len(kept_commands) == stack.shape[0]:
+        return stack
+    return np.array(kept_commands, dtype=stack.dtype).reshape((-1, 3))
+
+
+def _get_command_key(node, param1, param2):
+    if IS_COMMUTATIVE_MAP[node]:
+        return node, min(param1, param2), max(param1, param2)
+    if IS_ARITY_2_MAP[node]:
+        return node, param1, param2
+    return node, param1
+
+
+def _simplify_stack(stack):
+    """Simplifies a stack by folding constants and collapsing identities
+
+    Returns
+    -------
+    tuple(Nx3 array of int, list of Nx3 array of int)
+        The simplified stack and, for each of its constants, the stack of the
+        constant-only subgraph which evaluates to the constant.
+    """
+    num_commands = stack.shape[0]
+    equivalent_rows = np.empty(num_commands, dtype=int)
+    params = np.empty((num_commands, 2), dtype=int)
+    is_constant = np.zeros(num_commands, dtype=bool)
+    first_occurrence = {}
+    for i, (node, param1, param2) in enumerate(stack):
+        if IS_TERMINAL_MAP[node]:
+            is_constant[i] = node == 1
+            param2 = param1
+        else:
+            is_constant[i] = is_constant[param1] and \
+                (not IS_ARITY_2_MAP[node] or is_constant[param2])
+            param1 = equivalent_rows[param1]
+            param2 = equivalent_rows[param2] if IS_ARITY_2_MAP[node] \
+                else param1
+            if node == 11 and stack[param1, 0] == 11:
+                # abs(abs(x)) = abs(x)
+                equivalent_rows[i] = param1
+                continue
+
+        command_key = _get_command_key(node, param1, param2)
+        if command_key in first_occurrence:
+            equivalent_rows[i] = first_occurrence[command_key]
+            continue
+        first_occurrence[command_key] = i
+        equivalent_rows[i] = i
+        params[i] = param1, param2
+
+    return _get_folded_stack(stack, equivalent_rows[-1], params, is_constant)
+
+
+def _get_folded_stack(stack, root, params, is_constant):
+    """The stack needed by the root with constant-only rows as constants"""
+    is_needed = np.zeros(stack.shape[0], dtype=bool)
+    is_needed[root] = True
+    for i in range(root, -1, -1):
+        if is_needed[i] and not is_constant[i] and \
+                not IS_TERMINAL_MAP[stack[i, 0]]:
+            is_needed[params[i]] = True
+
+    folded_stack = []
+    constant_sources = []
+    folded_locations = np.empty(stack.shape[0], dtype=int)
+    for i in np.flatnonzero(is_needed):
+        node = stack[i, 0]
+        param1, param2 = params[i]
+        if is_constant[i]:
+            node = 1
+            param1 = param2 = len(constant_sources)
+            util = Backend.get_utilized_commands(stack[:i + 1])
+            constant_sources.append(_get_compacted_stack(stack[:i + 1], util))
+        elif not IS_TERMINAL_MAP[node]:
+            param1 = folded_locations[param1]
+            param2 = folded_locations[param2]
+        folded_locations[i] = len(folded_stack)
+        folded_stack.append((node, param1, param2))
+    return np.array(folded_stack, dtype=int).reshape((-1, 3)), \
+        constant_sources
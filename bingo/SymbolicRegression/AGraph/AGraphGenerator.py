@@ -19,11 +19,20 @@ class AGraphGenerator(Generator):
                   command array size of the generated acyclic graphs
     component_generator : AGraph.ComponentGenerator
                           Generator of stack components of agraphs
+    compiled_evaluation : bool
+                          (optional) generated agraphs use compiled
+                          evaluation. Default is False.
+    simplification : bool
+                     (optional) generated agraphs are evaluated with
+                     simplified stacks. Default is False.
     """
     @argument_validation(agraph_size={">=": 1})
-    def __init__(self, agraph_size, component_generator):
+    def __init__(self, agraph_size, component_generator,
+                 compiled_evaluation=False, simplification=False):
         self.agraph_size = agraph_size
         self.component_generator = component_generator
+        self.compiled_evaluation = compiled_evaluation
+        self.simplification = simplification
 
     def __call__(self):
         """Generates random agraph individual.
@@ -35,10 +44,35 @@ class AGraphGenerator(Generator):
         Agraph
             new random acyclic graph individual
         """
-        individual = AGraph()
+        individual = AGraph(self.compiled_evaluation, self.simplification)
         individual.command_array = self._create_command_array()
         return individual
 
+    def generate_population(self, population_size):
+        """Generates a population of random agraph individuals.
+
+        The command arrays of the whole population are generated at once by
+        the component generator.
+
+        Parameters
+        ----------
+        population_size : int
+                          The number of individuals to generate
+
+        Returns
+        -------
+        list of Agraph
+            new random acyclic graph individuals
+        """
+        command_arrays = self.component_generator.random_command_stacks(
+            population_size, self.agraph_size)
+        population = []
+        for command_array in command_arrays:
+            individual = AGraph(self.compiled_evaluation, self.simplification)
+            individual.command_array = command_array
+            population.append(individual)
+        return population
+
     def _create_command_array(self):
         command_array = np.empty((self.agraph_size, 3), dtype=int)
         for i in range(self.agraph_size):
@@ -138,6 +138,74 @@ def evaluate_with_derivative(stack, x, constants, wrt_param_x_or_c):
     return _evaluate_with_derivative(stack, x, constants, wrt_param_x_or_c)
 
 
+def evaluate_population(stacks, x, constants):
+    """Evaluate a population of equations
+
+    Evaluate the equations associated with several Agraphs, at the values x.
+    Commands at the same location in each stack are grouped by node so that
+    each group is evaluated with a single (vectorized) call.
+
+    Parameters
+    ----------
+    stacks : list of Nx3 numpy array of int.
+             The command stacks associated with the equations. N is the
+             number of commands in each stack and can differ between stacks.
+    x : MxD array of numeric.
+        Values at which to evaluate the equations. D is the number of
+        dimensions in x and M is the number of data points in x.
+    constants : list of list-like of numeric.
+                numeric constants that are used in each of the equations
+
+    Returns
+    -------
+    PxM array of numeric
+        :math`f(x)` for each of the P equations
+    """
+    if not stacks:
+        return np.empty((0, x.shape[0]))
+
+    stack_lengths = np.array([len(stack) for stack in stacks])
+    stack_ends = np.cumsum(stack_lengths)
+    stack_starts = stack_ends - stack_lengths
+    commands = np.vstack(stacks)
+    locations = np.arange(commands.shape[0]) - np.repeat(stack_starts,
+                                                         stack_lengths)
+
+    forward_eval = np.empty((commands.shape[0], x.shape[0]))
+    _load_population_terminals(commands, x, constants, stack_lengths,
+                               forward_eval)
+
+    is_operator = commands[:, 0] > 1
+    commands[is_operator, 1:] += np.repeat(stack_starts,
+                                           stack_lengths)[is_operator, None]
+    for location in range(np.max(stack_lengths)):
+        rows = np.flatnonzero(np.logical_and(locations == location,
+                                             is_operator))
+        for node in np.unique(commands[rows, 0]):
+            node_rows = rows[commands[rows, 0] == node]
+            forward_eval[node_rows] = Nodes.forward_eval_function(
+                node, commands[node_rows, 1], commands[node_rows, 2],
+                x, constants, forward_eval)
+    return forward_eval[stack_ends - 1]
+
+
+def _load_population_terminals(commands, x, constants, stack_lengths,
+                               forward_eval):
+    x_rows = np.flatnonzero(commands[:, 0] == 0)
+    forward_eval[x_rows] = x[:, commands[x_rows, 1]].T
+
+    c_rows = np.flatnonzero(commands[:, 0] == 1)
+    if c_rows.size > 0:
+        num_constants = np.array([len(consts) for consts in constants])
+        constant_starts = np.cumsum(num_constants) - num_constants
+        all_constants = np.concatenate(
+            [np.asarray(consts, dtype=float).ravel() for consts in constants])
+        c_owners = np.repeat(np.arange(len(stack_lengths)),
+                             stack_lengths)[c_rows]
+        c_indices = constant_starts[c_owners] + commands[c_rows, 1]
+        forward_eval[c_rows] = all_constants[c_indices].reshape((-1, 1))
+
+
 def get_utilized_commands(stack):
     """Find which commands are utilized.
 
@@ -38,6 +38,7 @@ class ComponentGenerator:
 
         self.input_x_dimension = input_x_dimension
         self._num_initial_load_statements = num_initial_load_statements
+        self._terminal_probability = terminal_probability
 
         self._terminal_pmf = self._make_terminal_pdf(constant_probability)
         self._operator_pmf = ProbabilityMassFunction()
@@ -89,6 +90,57 @@ class ComponentGenerator:
             return self._random_terminal_command(stack_location)
         return self._random_command_function_pmf.draw_sample()(stack_location)
 
+    def random_command_stacks(self, num_stacks, stack_size):
+        """Get several random command stacks
+
+        The stacks are generated all at once with vectorized random draws.
+
+        Parameters
+        ----------
+        num_stacks : int
+                     number of command stacks
+        stack_size : int
+                     number of commands in each stack
+
+        Returns
+        -------
+        num_stacks x stack_size x 3 array of int
+            random stacks of commands in the form [node, parameter 1,
+            parameter 2]
+        """
+        stack_locations = np.tile(np.arange(stack_size), (num_stacks, 1))
+        is_terminal = np.random.random((num_stacks, stack_size)) \
+            < self._terminal_probability
+        is_terminal[:, :self._num_initial_load_statements] = True
+        is_operator = np.logical_not(is_terminal)
+
+        stacks = np.empty((num_stacks, stack_size, 3), dtype=int)
+        stacks[is_terminal] = \
+            self._random_terminal_commands(np.count_nonzero(is_terminal))
+        stacks[is_operator] = \
+            self._random_operator_commands(stack_locations[is_operator])
+        return stacks
+
+    def _random_terminal_commands(self, num_commands):
+        commands = np.full((num_commands, 3), -1, dtype=int)
+        if num_commands == 0:
+            return commands
+        commands[:, 0] = self._terminal_pmf.draw_samples(num_commands)
+        is_load_x = commands[:, 0] == 0
+        if np.any(is_load_x):
+            commands[is_load_x, 1:] = np.random.randint(
+                self.input_x_dimension, size=(np.count_nonzero(is_load_x), 2))
+        return commands
+
+    def _random_operator_commands(self, stack_locations):
+        commands = np.empty((len(stack_locations), 3), dtype=int)
+        if commands.shape[0] == 0:
+            return commands
+        commands[:, 0] = self._operator_pmf.draw_samples(len(stack_locations))
+        commands[:, 1] = np.random.randint(stack_locations)
+        commands[:, 2] = np.random.randint(stack_locations)
+        return commands
+
     def _random_operator_command(self, stack_location):
         return np.array([self.random_operator(),
                          self.random_operator_parameter(stack_location),
@@ -0,0 +1,122 @@
+"""Compilation of Agraph command stacks into python functions.
+
+This module translates a command stack into the source of a straight-line
+python function made of numpy expressions (one per command) and compiles it.
+Compiled stacks are cached so that repeated evaluation of the same stack
+structure, e.g. during local optimization of its constants, skips the
+command-by-command interpretation done by the python backend.
+
+Attributes
+----------
+EXPRESSION_MAP : dictionary {int: str}
+                 A map of node number to a format string for the numpy
+                 expression that evaluates the node.  It must match the
+                 forward evaluation of `BackendNodes` (which is tested for
+                 every node).  The cache must be cleared after changing it.
+COMPILE_CACHE_SIZE : int
+                     The maximum number of compiled stacks that are cached
+"""
+import functools
+
+import numpy as np
+
+COMPILE_CACHE_SIZE = 1024
+
+EXPRESSION_MAP = {0: "x[:, {}]",
+                  1: "constants[{}]",
+                  2: "{} + {}",
+                  3: "{} - {}",
+                  4: "{} * {}",
+                  5: "{} / {}",
+                  6: "np.sin({})",
+                  7: "np.cos({})",
+                  8: "np.exp({})",
+                  9: "np.log(np.abs({}))",
+                  10: "np.power(np.abs({}), {})",
+                  11: "np.abs({})",
+                  12: "np.sqrt(np.abs({}))"}
+
+
+def evaluate(stack, x, constants):
+    """Evaluate an equation using its compiled stack
+
+    Evauluate the equation associated with an Agraph, at the values x.
+
+    Parameters
+    ----------
+    stack : Nx3 numpy array of int.
+            The command stack associated with an equation. N is the number of
+            commands in the stack.
+    x : MxD array of numeric.
+        Values at which to evaluate the equations. D is the number of
+        dimensions in x and M is the number of data points in x.
+    constants : list-like of numeric.
+                numeric constants that are used in the equation
+
+    Returns
+    -------
+    Mx1 array of numeric
+        :math`f(x)`
+    """
+    compiled_stack = compile_stack(stack)
+    return compiled_stack(x, np.asarray(constants, dtype=float))
+
+
+def compile_stack(stack):
+    """Get the compiled function of a command stack
+
+    Compiled functions are cached based on the stack alone.
+
+    Parameters
+    ----------
+    stack : Nx3 numpy array of int.
+            The command stack associated with an equation. N is the number of
+            commands in the stack.
+
+    Returns
+    -------
+    function(x, constants) :
+        Evaluates the stack at x (MxD array) with constants (L array of
+        float), returning an Mx1 array
+    """
+    stack_bytes = np.ascontiguousarray(stack, dtype=int).tobytes()
+    return _compile_stack_bytes(stack_bytes)
+
+
+def cache_info():
+    """Statistics of the compiled stack cache
+
+    Returns
+    -------
+    namedtuple :
+        hits, misses, maxsize and currsize of the cache
+    """
+    return _compile_stack_bytes.cache_info()
+
+
+def clear_cache():
+    """Remove all compiled stacks from the cache"""
+    _compile_stack_bytes.cache_clear()
+
+
+@functools.lru_cache(maxsize=COMPILE_CACHE_SIZE)
+def _compile_stack_bytes(stack_bytes):
+    stack = np.frombuffer(stack_bytes, dtype=int).reshape((-1, 3))
+    source = _get_function_source(stack, EXPRESSION_MAP)
+    namespace = {"np": np}
+    exec(compile(source, "<agraph stack>", "exec"), namespace)
+    return namespace["compiled_stack"]
+
+
+def _get_function_source(stack, expression_map):
+    lines = ["def compiled_stack(x, constants):"]
+    for i, (node, param1, param2) in enumerate(stack):
+        if node > 1:
+            param1 = "r%d" % param1
+            param2 = "r%d" % param2
+        expression = expression_map[node].format(param1, param2)
+        lines.append("    r%d = %s" % (i, expression))
+    lines.append("    f_of_x = np.empty(x.shape[0])")
+    lines.append("    f_of_x[:] = r%d" % (stack.shape[0] - 1))
+    lines.append("    return f_of_x.reshape((-1, 1))")
+    return "\n".join(lines) + "\n"
@@ -10,18 +10,23 @@ that are unique to symbolic regression of inter-atomic potentials. Namely,
 these classes are an appropriate fitness evaluator and a corresponding training
 data container.
 """
+from concurrent.futures import ProcessPoolExecutor
+import itertools
 import warnings
 import logging
 
 import numpy as np
 
-from ..Base.FitnessFunction import VectorBasedFunction
-from ..Base.TrainingData import TrainingData
+from ..Base.FitnessFunction import VectorBasedFunction, VectorGradientMixin
+from ..Base.TrainingData import TrainingData, as_view_index, \
+    load_arrays
 
 LOGGER = logging.getLogger(__name__)
 
+CELL_SIZE_TOLERANCE = 1e-8
 
-class PairwiseAtomicPotential(VectorBasedFunction):
+
+class PairwiseAtomicPotential(VectorBasedFunction, VectorGradientMixin):
     """Fitness based on total potential energy of a set of configurations.
 
     Pairwise atomic potential which is fit with total potential energy for a
@@ -43,14 +48,44 @@ class PairwiseAtomicPotential(VectorBasedFunction):
         pair_energies = individual.evaluate_equation_at(
             self.training_data.r).flatten()
 
-        err_vec = []
-        for i, energy_true in enumerate(self.training_data.potential_energy):
-            energy = np.sum(pair_energies[self.training_data.config_lims_r[i]:
-                                          self.training_data.config_lims_r[
-                                              i + 1]])
-            err_vec.append(energy - energy_true)
+        energies = self._sum_by_configuration(pair_energies)
+        return (energies - self.training_data.potential_energy).flatten()
+
+    def get_fitness_vector_and_jacobian(self, individual):
+        """Fitness vector and its jacobian
+
+        Parameters
+        ----------
+        individual : Equation
+                     individual for which fitness will be calculated
+
+        Returns
+        -------
+        tuple(N array of numeric, NxL array of numeric)
+            the fitness vector of the N configurations and its derivatives
+            with respect to the L constants of the individual
+        """
+        self.eval_count += 1
+        pair_energies, pair_derivs = \
+            individual.evaluate_equation_with_local_opt_gradient_at(
+                self.training_data.r)
+
+        energies = self._sum_by_configuration(pair_energies.flatten())
+        err_vec = energies - self.training_data.potential_energy
+        jacobian = self._sum_by_configuration(pair_derivs)
+        return err_vec, jacobian
+
+    def _sum_by_configuration(self, pair_values):
+        config_lims_r = np.asarray(self.training_data.config_lims_r)
+        config_starts = config_lims_r[:-1]
+        is_populated = config_starts < config_lims_r[1:]
 
-        return np.array(err_vec).flatten()
+        sums = np.zeros((len(config_starts), ) + pair_values.shape[1:])
+        if np.any(is_populated):
+            sums[is_populated] = np.add.reduceat(
+                pair_values[:config_lims_r[-1]], config_starts[is_populated],
+                axis=0)
+        return sums
 
 
 class PairwiseAtomicTrainingData(TrainingData):
@@ -75,14 +110,21 @@ class PairwiseAtomicTrainingData(TrainingData):
      config_lims_r : 1d numpy array
                      (optional) bounds of all of the r_indices corresponding to
                      each configuration
+     num_workers : int
+                   (optional) number of processes used to find the pairwise
+                   distances of the configurations. Default is 1.
 
     Notes
     -----
     Ininilization must be performed with either configurations or a
     combination of r_list and config_lims_r.
+
+    Pairwise distances of configurations are found with cell lists when the
+    periodic size of a configuration is at least three times its cutoff
+    distance.
     """
     def __init__(self, potential_energy, configurations=None, r_list=None,
-                 config_lims_r=None):
+                 config_lims_r=None, num_workers=1):
 
         potential_energy = self._flatten_energies_if_needed(potential_energy)
 
@@ -90,7 +132,8 @@ class PairwiseAtomicTrainingData(TrainingData):
             self._check_equal_num_of_energies_and_configs(configurations,
                                                           potential_energy)
             config_lims_r, r_list = \
-                self._synthesize_atomic_configurations(configurations)
+                self._synthesize_atomic_configurations(configurations,
+                                                       num_workers)
 
         elif r_list is None or config_lims_r is None:
             raise RuntimeError('Invalid construction of ' +
@@ -100,9 +143,38 @@ class PairwiseAtomicTrainingData(TrainingData):
         self.config_lims_r = config_lims_r
         self.potential_energy = potential_energy
 
+    @classmethod
+    def load(cls, path, mmap_mode="r"):
+        """Loads PairwiseAtomicTrainingData from .npy files or a .npz archive
+
+        Parameters
+        ----------
+         path : str
+                path to a directory containing potential_energy.npy,
+                r_list.npy and config_lims_r.npy, which are memory-mapped, or
+                to a .npz archive containing arrays with these names, which
+                are read into memory
+         mmap_mode : {None, 'r+', 'r', 'c'}
+                     (Optional) mode of the memory maps of .npy files, see
+                     `np.memmap`.  Default is 'r'.
+
+        Returns
+        -------
+         PairwiseAtomicTrainingData :
+                                       the training data
+        """
+        potential_energy, r_list, config_lims_r = load_arrays(
+            path, ["potential_energy", "r_list", "config_lims_r"],
+            mmap_mode)
+        return cls(potential_energy, r_list=r_list,
+                   config_lims_r=config_lims_r)
+
     def __getitem__(self, items):
         """gets a subset of the PairwiseAtomicTrainingData
 
+        Consecutive indices give a subset which is a view of the data,
+        other indices give a copy.
+
         Parameters
         ----------
          items : list or int
@@ -113,18 +185,29 @@ class PairwiseAtomicTrainingData(TrainingData):
          PairwiseAtomicTrainingData :
                                        a subset
         """
-
-        r_inds = []
-        new_config_lims_r = [0]
-        for i in items:
-            r_inds += range(self.config_lims_r[i], self.config_lims_r[i+1])
-            new_config_lims_r.append(len(r_inds))
-        new_config_lims_r = np.array(new_config_lims_r)
+        items = as_view_index(items)
+        config_lims_r = np.asarray(self.config_lims_r)
+        if isinstance(items, slice) and items.step in (None, 1):
+            start, stop, _ = items.indices(len(self))
+            stop = max(start, stop)
+            r_start = config_lims_r[start]
+            r_stop = config_lims_r[stop]
+            new_r_list = self.r[r_start:r_stop, :]
+            new_config_lims_r = config_lims_r[start:stop + 1] - r_start
+        else:
+            items = np.arange(len(self))[items]
+            r_starts = config_lims_r[items]
+            r_counts = config_lims_r[items + 1] - r_starts
+            new_config_lims_r = np.zeros(len(items) + 1, dtype=int)
+            np.cumsum(r_counts, out=new_config_lims_r[1:])
+            r_inds = np.repeat(r_starts - new_config_lims_r[:-1], r_counts) \
+                + np.arange(new_config_lims_r[-1])
+            new_r_list = self.r[r_inds, :]
 
         new_potential_energy = self.potential_energy[items]
         temp = PairwiseAtomicTrainingData(
             potential_energy=new_potential_energy,
-            r_list=self.r[r_inds, :],
+            r_list=new_r_list,
             config_lims_r=new_config_lims_r)
         return temp
 
@@ -155,38 +238,78 @@ class PairwiseAtomicTrainingData(TrainingData):
         return potential_energy
 
     @staticmethod
-    def _synthesize_atomic_configurations(configurations):
-        r_list = []
-        config_lims_r = [0]
-        for (structure, periodic_size, r_cutoff) in configurations:
-            # make radius list
-            natoms = structure.shape[0]
-            rcutsq = r_cutoff ** 2
-            for atomi in range(0, natoms):
-                xtmp = structure[atomi, 0]
-                ytmp = structure[atomi, 1]
-                ztmp = structure[atomi, 2]
-                for atomj in range(atomi + 1, natoms):
-                    delx = structure[atomj, 0] - xtmp
-                    while delx > 0.5 * periodic_size:
-                        delx -= periodic_size
-                    while delx < -0.5 * periodic_size:
-                        delx += periodic_size
-                    dely = structure[atomj, 1] - ytmp
-                    while dely > 0.5 * periodic_size:
-                        dely -= periodic_size
-                    while dely < -0.5 * periodic_size:
-                        dely += periodic_size
-                    delz = structure[atomj, 2] - ztmp
-                    while delz > 0.5 * periodic_size:
-                        delz -= periodic_size
-                    while delz < -0.5 * periodic_size:
-                        delz += periodic_size
-
-                    rsq = delx * delx + dely * dely + delz * delz
-                    if rsq <= rcutsq:
-                        r_list.append(np.sqrt(rsq))
-            config_lims_r.append(len(r_list))
-        r_list = np.array(r_list).reshape([-1, 1])
-        config_lims_r = np.array(config_lims_r)
-        return config_lims_r, r_list
+    def _synthesize_atomic_configurations(configurations, num_workers=1):
+        if num_workers > 1:
+            with ProcessPoolExecutor(num_workers) as executor:
+                config_r_lists = list(executor.map(_get_pair_distances,
+                                                   configurations))
+        else:
+            config_r_lists = [_get_pair_distances(configuration)
+                              for configuration in configurations]
+
+        config_lims_r = np.zeros(len(config_r_lists) + 1, dtype=int)
+        np.cumsum([len(r) for r in config_r_lists], out=config_lims_r[1:])
+        r_list = np.concatenate([np.zeros(0)] + config_r_lists)
+        return config_lims_r, r_list.reshape([-1, 1])
+
+
+def _get_pair_distances(configuration):
+    """Distances between all pairs of atoms (i < j) within the cutoff,
+    ordered by i then j, using the minimum image convention"""
+    structure, periodic_size, r_cutoff = configuration
+    structure = np.asarray(structure, dtype=float)
+    num_cells = int(periodic_size / (r_cutoff * (1 + CELL_SIZE_TOLERANCE)))
+    if num_cells < 3:
+        atoms_i, atoms_j = np.triu_indices(structure.shape[0], 1)
+    else:
+        atoms_i, atoms_j = _get_neighbor_cell_pairs(structure, periodic_size,
+                                                    num_cells)
+
+    delta = structure[atoms_j] - structure[atoms_i]
+    _wrap_to_minimum_image(delta, periodic_size)
+    rsq = delta[:, 0] * delta[:, 0] + delta[:, 1] * delta[:, 1] \
+        + delta[:, 2] * delta[:, 2]
+    return np.sqrt(rsq[rsq <= r_cutoff ** 2])
+
+
+def _get_neighbor_cell_pairs(structure, periodic_size, num_cells):
+    num_atoms = structure.shape[0]
+    cell_size = periodic_size / num_cells
+    cell_coords = np.floor(np.mod(structure, periodic_size)
+                           / cell_size).astype(int)
+    cell_coords = np.clip(cell_coords, 0, num_cells - 1)
+    cells = np.ravel_multi_index(cell_coords.T, (num_cells, ) * 3)
+
+    atoms_by_cell = np.argsort(cells, kind="stable")
+    cell_starts = np.searchsorted(cells[atoms_by_cell],
+                                  np.arange(num_cells ** 3 + 1))
+
+    pairs_i = []
+    pairs_j = []
+    for offset in itertools.product((-1, 0, 1), repeat=3):
+        neighbor_cells = np.ravel_multi_index(
+            (np.mod(cell_coords + offset, num_cells)).T, (num_cells, ) * 3)
+        starts = cell_starts[neighbor_cells]
+        counts = cell_starts[neighbor_cells + 1] - starts
+        atoms_i = np.repeat(np.arange(num_atoms), counts)
+        count_offsets = np.cumsum(counts) - counts
+        atoms_j = atoms_by_cell[np.repeat(starts - count_offsets, counts)
+                                + np.arange(np.sum(counts))]
+        is_ordered = atoms_i < atoms_j
+        pairs_i.append(atoms_i[is_ordered])
+        pairs_j.append(atoms_j[is_ordered])
+    pairs_i = np.concatenate(pairs_i)
+    pairs_j = np.concatenate(pairs_j)
+
+    pair_order = np.lexsort((pairs_j, pairs_i))
+    return pairs_i[pair_order], pairs_j[pair_order]
+
+
+def _wrap_to_minimum_image(delta, periodic_size):
+    # repeated subtraction (rather than rounding) reproduces the distances of
+    # the original per pair implementation exactly
+    for sign in (1, -1):
+        outside = sign * delta > 0.5 * periodic_size
+        while np.any(outside):
+            delta[outside] -= sign * periodic_size
+            outside = sign * delta > 0.5 * periodic_size
@@ -11,13 +11,16 @@ appropriate fitness evaluator and a corresponding training data container.
 import warnings
 import logging
 
-from ..Base.FitnessFunction import VectorBasedFunction
-from ..Base.TrainingData import TrainingData
+import numpy as np
+
+from ..Base.FitnessFunction import VectorBasedFunction, VectorGradientMixin
+from ..Base.TrainingData import TrainingData, as_view_index, \
+    load_arrays
 
 LOGGER = logging.getLogger(__name__)
 
 
-class ExplicitRegression(VectorBasedFunction):
+class ExplicitRegression(VectorBasedFunction, VectorGradientMixin):
     """ Traditional fitness evaluation for symbolic regression
 
     fitness = y - f(x) where x and y are in the training_data (i.e.
@@ -28,11 +31,51 @@ class ExplicitRegression(VectorBasedFunction):
     ----------
     training_data : ExplicitTrainingData
                     data that is used in fitness evaluation.
+    chunk_size : int
+                 (Optional) The number of data points in each block of rows of
+                 the training data that is evaluated at once.  Default is
+                 None: all of the training data is evaluated at once.
     """
     def _evaluate_fitness_vector(self, individual):
+        if self.chunk_size is None:
+            return next(self._evaluate_fitness_vector_chunks(individual))
+        return np.concatenate(
+            list(self._evaluate_fitness_vector_chunks(individual)))
+
+    def _evaluate_fitness_vector_chunks(self, individual):
+        self.eval_count += 1
+        for rows in self._get_chunk_slices(self.training_data.x.shape[0]):
+            f_of_x = individual.evaluate_equation_at(self.training_data.x[rows])
+            yield (f_of_x - self.training_data.y[rows]).flatten()
+
+    def get_fitness_vector_and_jacobian(self, individual):
+        """Fitness vector and its jacobian
+
+        Parameters
+        ----------
+        individual : Equation
+                     individual for which fitness will be calculated
+
+        Returns
+        -------
+        tuple(M array of numeric, MxL array of numeric)
+            the fitness vector and its derivatives with respect to the L
+            constants of the individual
+        """
+        if self.chunk_size is None:
+            return next(self._get_fitness_vector_and_jacobian_chunks(
+                individual))
+        fitness_vectors, jacobians = zip(
+            *self._get_fitness_vector_and_jacobian_chunks(individual))
+        return np.concatenate(fitness_vectors), np.vstack(jacobians)
+
+    def _get_fitness_vector_and_jacobian_chunks(self, individual):
         self.eval_count += 1
-        f_of_x = individual.evaluate_equation_at(self.training_data.x)
-        return (f_of_x - self.training_data.y).flatten()
+        for rows in self._get_chunk_slices(self.training_data.x.shape[0]):
+            f_of_x, df_dc = \
+                individual.evaluate_equation_with_local_opt_gradient_at(
+                    self.training_data.x[rows])
+            yield (f_of_x - self.training_data.y[rows]).flatten(), df_dc
 
 
 class ExplicitTrainingData(TrainingData):
@@ -66,9 +109,34 @@ class ExplicitTrainingData(TrainingData):
         self.x = x
         self.y = y
 
+    @classmethod
+    def load(cls, path, mmap_mode="r"):
+        """Loads ExplicitTrainingData from .npy files or a .npz archive
+
+        Parameters
+        ----------
+        path : str
+               path to a directory containing x.npy and y.npy, which are
+               memory-mapped, or to a .npz archive containing arrays named x
+               and y, which are read into memory
+        mmap_mode : {None, 'r+', 'r', 'c'}
+                    (Optional) mode of the memory maps of .npy files, see
+                    `np.memmap`.  Default is 'r'.
+
+        Returns
+        -------
+        ExplicitTrainingData :
+                                the training data
+        """
+        x, y = load_arrays(path, ["x", "y"], mmap_mode)
+        return cls(x, y)
+
     def __getitem__(self, items):
         """gets a subset of the ExplicitTrainingData
 
+        Evenly spaced indices give a subset which is a view of the data,
+        other indices give a copy.
+
         Parameters
         ----------
         items : list or int
@@ -79,6 +147,7 @@ class ExplicitTrainingData(TrainingData):
         ExplicitTrainingData :
                                 a Subset
         """
+        items = as_view_index(items)
         temp = ExplicitTrainingData(self.x[items, :], self.y[items, :])
         return temp
 
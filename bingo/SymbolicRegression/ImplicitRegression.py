@@ -9,13 +9,16 @@ that are unique to implicit symbolic regression. Namely, these classes are
 appropriate fitness evaluators, a corresponding training data container, and
 two helper functions.
 """
+import functools
 import warnings
 import logging
 
 import numpy as np
 
 from ..Base.FitnessFunction import VectorBasedFunction
-from ..Base.TrainingData import TrainingData
+from ..Base.TrainingData import TrainingData, as_view_index, \
+    load_arrays
+from ..Util.ArgumentValidation import argument_validation
 
 LOGGER = logging.getLogger(__name__)
 
@@ -38,45 +41,77 @@ class ImplicitRegression(VectorBasedFunction):
                       (optional) minimum number of nonzero components of dot
     normalize_dot : bool
                     normalize the terms in the dot product (default = False)
+    chunk_size : int
+                 (Optional) The number of data points in each block of rows of
+                 the training data that is evaluated at once.  Default is
+                 None: all of the training data is evaluated at once.
+
+    Notes
+    -----
+    When the dot product is normalized, the normalized dx_dt of the training
+    data is used if it is available (see
+    `ImplicitTrainingData.normalized_dx_dt`).
     """
+    @argument_validation(chunk_size={">": 0})
     def __init__(self, training_data, required_params=None,
-                 normalize_dot=False):
+                 normalize_dot=False, chunk_size=None):
         super().__init__(training_data)
+        self.chunk_size = chunk_size
         self._required_params = required_params
         self._normalize_dot = normalize_dot
 
     def _evaluate_fitness_vector(self, individual):
         self.eval_count += 1
-        _, df_dx = individual.evaluate_equation_with_x_gradient_at(
-            x=self.training_data.x)
-
-        dot_product = self._do_dfdx_dot_dxdt(df_dx)
-
-        if self._required_params is not None:
-            if not self._enough_parameters_used(dot_product):
-                return np.full((self.training_data.x.shape[0],), np.inf)
-
-        denominator = np.sum(np.abs(dot_product), axis=1)
-        normalized_fitness = np.sum(dot_product, axis=1) / denominator
-        normalized_fitness[~np.isfinite(denominator)] = np.inf
-        return normalized_fitness
-
-    def _enough_parameters_used(self, dot_product):
-        n_params_used = (abs(dot_product) > 1e-16).sum(1)
+        enough_params_used = self._required_params is None
+        fitness_chunks = []
+        num_points = self.training_data.x.shape[0]
+        for rows in self._get_chunk_slices(num_points):
+            _, df_dx = individual.evaluate_equation_with_x_gradient_at(
+                x=self.training_data.x[rows])
+
+            dot_product = self._do_dfdx_dot_dxdt(df_dx, rows)
+            numerator = np.sum(dot_product, axis=1)
+            abs_dot_product = np.abs(dot_product, out=dot_product)
+            if not enough_params_used:
+                enough_params_used = \
+                    self._enough_parameters_used(abs_dot_product)
+
+            denominator = np.sum(abs_dot_product, axis=1)
+            normalized_fitness = np.divide(numerator, denominator,
+                                           out=numerator)
+            normalized_fitness[~np.isfinite(denominator)] = np.inf
+            fitness_chunks.append(normalized_fitness)
+
+        if not enough_params_used:
+            return np.full((num_points,), np.inf)
+        if len(fitness_chunks) == 1:
+            return fitness_chunks[0]
+        return np.concatenate(fitness_chunks)
+
+    def _enough_parameters_used(self, abs_dot_product):
+        n_params_used = np.count_nonzero(abs_dot_product > 1e-16, axis=1)
         enough_params_used = np.any(n_params_used >= self._required_params)
         return enough_params_used
 
-    def _do_dfdx_dot_dxdt(self, df_dx):
-        left_dot = df_dx
-        right_dot = self.training_data.dx_dt
-        if self._normalize_dot:
-            left_dot = self._normalize_by_row(left_dot)
-            right_dot = self._normalize_by_row(right_dot)
-        return left_dot * right_dot
+    def _do_dfdx_dot_dxdt(self, df_dx, rows):
+        if not self._normalize_dot:
+            return df_dx * self.training_data.dx_dt[rows]
+
+        dot_product = df_dx * self._get_normalized_dx_dt(rows)
+        dot_product /= self._get_row_norms(df_dx).reshape((-1, 1))
+        return dot_product
+
+    def _get_normalized_dx_dt(self, rows):
+        normalized_dx_dt = getattr(self.training_data, "normalized_dx_dt",
+                                   None)
+        if normalized_dx_dt is None:
+            dx_dt = self.training_data.dx_dt[rows]
+            return dx_dt / self._get_row_norms(dx_dt).reshape((-1, 1))
+        return normalized_dx_dt[rows]
 
     @staticmethod
-    def _normalize_by_row(array):
-        return array / np.linalg.norm(array, axis=1).reshape((-1, 1))
+    def _get_row_norms(array):
+        return np.sqrt(np.einsum("ij,ij->i", array, array))
 
 
 class ImplicitRegressionSchmidt(VectorBasedFunction):
@@ -95,36 +130,51 @@ class ImplicitRegressionSchmidt(VectorBasedFunction):
     -----
     This may not be a correct implementation of this algorithm.  Importantly,
     it couldn't reproduce the  results in the papers.
+
+    For each partial derivative, the pairs with all other partial derivatives
+    are compared at once, so memory use is proportional to the size of x.
     """
     def _evaluate_fitness_vector(self, individual):
         _, df_dx = individual.evaluate_equation_with_x_gradient_at(
             x=self.training_data.x)
+        dx_dt = self.training_data.dx_dt
 
-        num_parameters = self.training_data.x.shape[1]
+        num_parameters = dx_dt.shape[1]
         worst_fitness = 0
         diff_worst = np.full((num_parameters, ), np.inf)
-        for i in range(num_parameters):
-            for j in range(num_parameters):
-                if i != j:
-                    df_dxi = np.copy(df_dx[:, i])
-                    df_dxj = np.copy(df_dx[:, j])
-                    dxi_dxj_2 = (self.training_data.dx_dt[:, i] /
-                                 self.training_data.dx_dt[:, j])
-                    for k in range(num_parameters):
-                        if k != i and k != j:
-                            df_dxj += df_dx[:, k] * \
-                                      self.training_data.dx_dt[:, k] / \
-                                      self.training_data.dx_dt[:, j]
-
-                    dxi_dxj_1 = df_dxj / df_dxi
-                    diff = np.log(1. + np.abs(dxi_dxj_1 + dxi_dxj_2))
-                    fit = np.mean(diff)
-                    if np.isfinite(fit) and fit > worst_fitness:
-                        diff_worst = np.copy(diff)
-                        worst_fitness = fit
+        with np.errstate(divide="ignore", invalid="ignore"):
+            dot_terms = df_dx * dx_dt
+            for i in range(num_parameters):
+                # df_dxj[:, j] = df_dx[:, j] + sum over k != i, j of
+                #                df_dx[:, k] * dx_dt[:, k] / dx_dt[:, j]
+                terms = np.copy(dot_terms)
+                terms[:, i] = 0
+                df_dxj = _sum_excluding_each_column(terms)
+                df_dxj /= dx_dt
+                df_dxj += df_dx
+
+                dxi_dxj_1 = df_dxj / df_dx[:, [i]]
+                dxi_dxj_2 = dx_dt[:, [i]] / dx_dt
+                diff = np.log(1. + np.abs(dxi_dxj_1 + dxi_dxj_2))
+                fit = np.mean(diff, axis=0)
+                fit[i] = 0
+                fit[~np.isfinite(fit)] = 0
+
+                j = np.argmax(fit)
+                if fit[j] > worst_fitness:
+                    diff_worst = diff[:, j]
+                    worst_fitness = fit[j]
         return diff_worst
 
 
+def _sum_excluding_each_column(terms):
+    """sum over the columns, excluding each column in turn"""
+    excluded_sums = np.zeros(terms.shape)
+    np.cumsum(terms[:, :-1], axis=1, out=excluded_sums[:, 1:])
+    excluded_sums[:, :-1] += np.cumsum(terms[:, :0:-1], axis=1)[:, ::-1]
+    return excluded_sums
+
+
 class ImplicitTrainingData(TrainingData):
     """
     ImplicitTrainingData: Training data of this type contains an input array of
@@ -156,9 +206,54 @@ class ImplicitTrainingData(TrainingData):
         self.x = x
         self.dx_dt = dx_dt
 
+    @property
+    def dx_dt(self):
+        """2D numpy array : time derivative of x"""
+        return self._dx_dt
+
+    @dx_dt.setter
+    def dx_dt(self, dx_dt):
+        self._dx_dt = dx_dt
+        self._normalized_dx_dt = None
+
+    @property
+    def normalized_dx_dt(self):
+        """2D numpy array : dx_dt normalized by row.  It is calculated once
+        and then stored until dx_dt is replaced."""
+        if self._normalized_dx_dt is None:
+            norms = np.linalg.norm(self._dx_dt, axis=1).reshape((-1, 1))
+            self._normalized_dx_dt = self._dx_dt / norms
+        return self._normalized_dx_dt
+
+    @classmethod
+    def load(cls, path, mmap_mode="r"):
+        """Loads ImplicitTrainingData from .npy files or a .npz archive
+
+        Parameters
+        ----------
+         path : str
+                path to a directory containing x.npy and (optionally)
+                dx_dt.npy, which are memory-mapped, or to a .npz archive
+                containing an array named x and (optionally) an array named
+                dx_dt, which are read into memory
+         mmap_mode : {None, 'r+', 'r', 'c'}
+                     (Optional) mode of the memory maps of .npy files, see
+                     `np.memmap`.  Default is 'r'.
+
+        Returns
+        -------
+         ImplicitTrainingData :
+                                the training data
+        """
+        x, dx_dt = load_arrays(path, ["x", "dx_dt"], mmap_mode)
+        return cls(x, dx_dt)
+
     def __getitem__(self, items):
         """gets a subset of the ExplicitTrainingData
 
+        Evenly spaced indices give a subset which is a view of the data,
+        other indices give a copy.
+
         Parameters
         ----------
          items : list or int
@@ -169,7 +264,10 @@ class ImplicitTrainingData(TrainingData):
          ExplicitTrainingData :
                                 a subset
         """
+        items = as_view_index(items)
         temp = ImplicitTrainingData(self.x[items, :], self.dx_dt[items, :])
+        if self._normalized_dx_dt is not None:
+            temp._normalized_dx_dt = self._normalized_dx_dt[items, :]
         return temp
 
     def __len__(self):
@@ -182,6 +280,11 @@ class ImplicitTrainingData(TrainingData):
         """
         return self.x.shape[0]
 
+    def __getstate__(self):
+        state = super().__getstate__()
+        state["_normalized_dx_dt"] = None
+        return state
+
 
 def calculate_partials(X):
     """Calculate derivatves with respect to time (first dimension).
@@ -197,36 +300,32 @@ def calculate_partials(X):
     -------
     2d numpy array :
         updated X array and corresponding time derivatives
+
+    Notes
+    -----
+    The derivatives of all columns of a trajectory are calculated at once with
+    a Savitzky-Golay filter whose weights are cached.
     """
     # find splits
     break_points = np.where(np.any(np.isnan(X), 1))[0].tolist()
     break_points.append(X.shape[0])
 
+    x_segments = []
+    time_deriv_segments = []
+    inds_segments = []
     start = 0
     for end in break_points:
-        x_seg = np.copy(X[start:end, :])
+        x_seg = X[start:end, :]
         # calculate time derivs using filter
-        time_deriv = np.empty(x_seg.shape)
-        for i in range(x_seg.shape[1]):
-            time_deriv[:, i] = savitzky_golay_gram(x_seg[:, i], 7, 3, 1)
+        time_deriv = savitzky_golay_gram(x_seg, 7, 3, 1)
         # remove edge effects
-        time_deriv = time_deriv[3:-4, :]
-        x_seg = x_seg[3:-4, :]
-
-        if start == 0:
-            x_all = np.copy(x_seg)
-            time_deriv_all = np.copy(time_deriv)
-            inds_all = np.arange(start + 3, end - 4)
-        else:
-            x_all = np.vstack((x_all, np.copy(x_seg)))
-            time_deriv_all = np.vstack((time_deriv_all,
-                                        np.copy(time_deriv)))
-
-            inds_all = np.hstack((inds_all,
-                                  np.arange(start + 3, end - 4)))
+        x_segments.append(x_seg[3:-4, :])
+        time_deriv_segments.append(time_deriv[3:-4, :])
+        inds_segments.append(np.arange(start + 3, end - 4))
         start = end + 1
 
-    return x_all, time_deriv_all, inds_all
+    return np.concatenate(x_segments), np.concatenate(time_deriv_segments), \
+        np.concatenate(inds_segments)
 
 
 def savitzky_golay_gram(y, window_size, order, deriv=0):
@@ -248,8 +347,9 @@ def savitzky_golay_gram(y, window_size, order, deriv=0):
 
     Parameters
     ----------
-     y : array_like, shape (N,)
-         the values of the time history of the signal.
+     y : array_like, shape (N,) or (N, D)
+         the values of the time history of the signal. Each column of a 2d
+         array is filtered separately.
      window_size : int
                    the length of the window. Must be an odd integer number.
      order : int
@@ -261,7 +361,7 @@ def savitzky_golay_gram(y, window_size, order, deriv=0):
 
     Returns
     -------
-     ys : ndarray, shape (N)
+     ys : ndarray, shape (N) or (N, D)
           the smoothed signal (or it's n-th derivative).
 
     References
@@ -270,75 +370,80 @@ def savitzky_golay_gram(y, window_size, order, deriv=0):
        the Convolution (Savitzky-Golay) Method. Analytical Chemistry, 1990, 62,
        pp 570-573
     """
-    n_order = order
-    m_half_filter_size = np.int((window_size - 1) / 2)  # 2m + 1 = filter size
-    s_derivative_order = deriv
-
-    def generalized_factorial(a, b):
-        """Generalized factorial"""
-        g_f = 1
-        for j in range(a - b + 1, a + 1):
-            g_f *= j
-        return g_f
-
-    def gram_polynomial(gp_i, gp_m, gp_k, gp_s):
-        """
-        Calculates the Gram Polynomial (gp_s=0) or its gp_s'th derivative
-        evaluated at gp_i, order gp_k, over 2gp_m+1 points
-        """
-        if gp_k > 0:
-            gram_poly = (4. * gp_k - 2.) / (gp_k * (2. * gp_m - gp_k + 1.)) * \
-                        (gp_i * gram_polynomial(gp_i, gp_m, gp_k - 1, gp_s) +
-                         gp_s * gram_polynomial(gp_i, gp_m, gp_k - 1,
-                                                gp_s - 1)) - \
-                        ((gp_k - 1.) * (2. * gp_m + gp_k)) / \
-                        (gp_k * (2. * gp_m - gp_k + 1.)) * \
-                        gram_polynomial(gp_i, gp_m, gp_k - 2, gp_s)
+    y = np.asarray(y, dtype=float)
+    m_half_filter_size = (window_size - 1) // 2  # 2m + 1 = filter size
+    weights = _savitzky_golay_weights(m_half_filter_size, order, deriv)
+
+    # windows near the boundaries are centered m points from the boundary
+    y_len = y.shape[0]
+    points = np.arange(y_len)
+    y_center = np.clip(points, m_half_filter_size,
+                       y_len - m_half_filter_size - 1)
+    w_ind = points - y_center + m_half_filter_size
+    if y.ndim > 1:
+        w_ind = w_ind.reshape((-1, 1))
 
-        else:
-            if gp_k == 0 and gp_s == 0:
-                gram_poly = 1.
-            else:
-                gram_poly = 0.
-        return gram_poly
+    # do convolution
+    f = np.zeros(y.shape)
+    for k in range(-m_half_filter_size, m_half_filter_size + 1):
+        f += y[y_center + k] * weights[k + m_half_filter_size, w_ind]
+    return f
 
-    def gram_weight(gw_i, gw_t, gw_m, gw_n, gw_s):
-        """
-        Calculate the weight og the gw_i'th data point for the gw_t'th
-        Least-Square point of the gw_s'th derivative over 2gw_m+1 points,
-        order gw_n
-        """
-        weight = 0
-        for k in range(gw_n + 1):
-            weight += (2. * k + 1.) * generalized_factorial(2 * gw_m, k) / \
-                      generalized_factorial(2 * gw_m + k + 1, k + 1) * \
-                      gram_polynomial(gw_i, gw_m, k, 0) * \
-                      gram_polynomial(gw_t, gw_m, k, gw_s)
-        return weight
-
-    # fill weights
-    weights = np.empty((2 * m_half_filter_size + 1, 2 * m_half_filter_size + 1))
-    for i in range(-m_half_filter_size, m_half_filter_size + 1):
-        for t in range(-m_half_filter_size, m_half_filter_size + 1):
-            weights[i + m_half_filter_size, t + m_half_filter_size] = \
-                gram_weight(i, t, m_half_filter_size, n_order,
-                            s_derivative_order)
 
-    # do convolution
-    y_len = len(y)
-    f = np.empty(y_len)
-    for i in range(y_len):
-        if i < m_half_filter_size:
-            y_center = m_half_filter_size
-            w_ind = i
-        elif y_len - i <= m_half_filter_size:
-            y_center = y_len - m_half_filter_size - 1
-            w_ind = 2 * m_half_filter_size + 1 - (y_len - i)
+@functools.lru_cache(maxsize=None)
+def _savitzky_golay_weights(m_half_filter_size, order, deriv):
+    """
+    Weights of the Savitzky-Golay filter over 2m+1 points.  Element (i, t) is
+    the weight of the i'th data point for the t'th Least-Square point.
+    """
+    filter_points = range(-m_half_filter_size, m_half_filter_size + 1)
+    weights = np.array([[_gram_weight(i, t, m_half_filter_size, order, deriv)
+                         for t in filter_points] for i in filter_points])
+    weights.flags.writeable = False
+    return weights
+
+
+def _generalized_factorial(a, b):
+    """Generalized factorial"""
+    g_f = 1
+    for j in range(a - b + 1, a + 1):
+        g_f *= j
+    return g_f
+
+
+@functools.lru_cache(maxsize=None)
+def _gram_polynomial(gp_i, gp_m, gp_k, gp_s):
+    """
+    Calculates the Gram Polynomial (gp_s=0) or its gp_s'th derivative
+    evaluated at gp_i, order gp_k, over 2gp_m+1 points
+    """
+    if gp_k > 0:
+        gram_poly = (4. * gp_k - 2.) / (gp_k * (2. * gp_m - gp_k + 1.)) * \
+                    (gp_i * _gram_polynomial(gp_i, gp_m, gp_k - 1, gp_s) +
+                     gp_s * _gram_polynomial(gp_i, gp_m, gp_k - 1,
+                                             gp_s - 1)) - \
+                    ((gp_k - 1.) * (2. * gp_m + gp_k)) / \
+                    (gp_k * (2. * gp_m - gp_k + 1.)) * \
+                    _gram_polynomial(gp_i, gp_m, gp_k - 2, gp_s)
+
+    else:
+        if gp_k == 0 and gp_s == 0:
+            gram_poly = 1.
         else:
-            y_center = i
-            w_ind = m_half_filter_size
-        f[i] = 0
-        for k in range(-m_half_filter_size, m_half_filter_size + 1):
-            f[i] += y[y_center + k] * weights[k + m_half_filter_size, w_ind]
+            gram_poly = 0.
+    return gram_poly
 
-    return f
+
+def _gram_weight(gw_i, gw_t, gw_m, gw_n, gw_s):
+    """
+    Calculate the weight og the gw_i'th data point for the gw_t'th
+    Least-Square point of the gw_s'th derivative over 2gw_m+1 points,
+    order gw_n
+    """
+    weight = 0
+    for k in range(gw_n + 1):
+        weight += (2. * k + 1.) * _generalized_factorial(2 * gw_m, k) / \
+                  _generalized_factorial(2 * gw_m + k + 1, k + 1) * \
+                  _gram_polynomial(gw_i, gw_m, k, 0) * \
+                  _gram_polynomial(gw_t, gw_m, k, gw_s)
+    return weight
@@ -1,7 +1,8 @@
 """
 This module implements a probability mass function from which single samples
-can be drawn
+(or batches of samples) can be drawn
 """
+from bisect import bisect_right
 import logging
 import numpy as np
 
@@ -15,6 +16,11 @@ class ProbabilityMassFunction:
     probability weights are given. Samples (items) can then be drawn from the
     pmf according to their relative weights.
 
+    A cumulative distribution table is precomputed whenever the items change,
+    so that drawing a sample needs only a single uniform random number and a
+    binary search. The samples drawn are the same as those of
+    `numpy.random.choice` with the same random state.
+
     Parameters
     ----------
     items : list, optional
@@ -43,6 +49,7 @@ class ProbabilityMassFunction:
         self._is_weights_same_size_as_items(weights)
         self._total_weight, self.normalized_weights = \
             self._normalize_weights(weights)
+        self._update_sampling_table()
 
     def _get_default_weights(self):
         n_items = len(self.items)
@@ -99,6 +106,20 @@ class ProbabilityMassFunction:
 
         self._total_weight, self.normalized_weights = \
             self._normalize_weights(weights)
+        self._update_sampling_table()
+
+    def _update_sampling_table(self):
+        cumulative_weights = np.cumsum(self.normalized_weights)
+        if cumulative_weights.size > 0:
+            cumulative_weights /= cumulative_weights[-1]
+        self._cumulative_weights = cumulative_weights
+        self._cumulative_weights_list = cumulative_weights.tolist()
+
+        items_array = np.array(self.items)
+        if items_array.ndim != 1:
+            items_array = np.empty(len(self.items), dtype=object)
+            items_array[:] = self.items
+        self._items_array = items_array
 
     def _get_mean_current_weight(self):
         if self.normalized_weights.size == 0:
@@ -115,4 +136,32 @@ class ProbabilityMassFunction:
         -------
             A single item
         """
-        return np.random.choice(self.items, 1, p=self.normalized_weights)[0]
+        self._check_not_empty()
+        index = bisect_right(self._cumulative_weights_list, np.random.random())
+        return self.items[index]
+
+    def draw_samples(self, num_samples):
+        """Draw several samples from the PMF
+
+        Draw random samples from the PMF according to the probabilities
+        associated with weighting of items.
+
+        Parameters
+        ----------
+        num_samples : int
+                      The number of samples to draw
+
+        Returns
+        -------
+        numpy array
+            num_samples items
+        """
+        self._check_not_empty()
+        indices = np.searchsorted(self._cumulative_weights,
+                                  np.random.random(num_samples), side='right')
+        return self._items_array[indices]
+
+    def _check_not_empty(self):
+        if not self.items:
+            LOGGER.error("Sample drawn from empty ProbabilityMassFunction")
+            raise ValueError
@@ -95,6 +95,19 @@ def test_deep_copy_agraph(sample_agraph_1):
     assert pytest.approx(agraph_copy._constants[0]) == 1.0
 
 
+def test_copy_agraph_is_independent(sample_agraph_1, sample_agraph_1_values):
+    agraph_copy = sample_agraph_1.copy()
+    agraph_copy.command_array[3, 0] = 7
+    agraph_copy.notify_command_array_modification()
+
+    assert sample_agraph_1.command_array[3, 0] == 6
+    assert sample_agraph_1.fitness == 1
+    assert not agraph_copy.fit_set
+    np.testing.assert_allclose(
+        sample_agraph_1.evaluate_equation_at(sample_agraph_1_values.x),
+        sample_agraph_1_values.f_of_x)
+
+
 def test_agraph_latex_print(expected_agraph_behavior):
     assert expected_agraph_behavior["latex string"] == \
            expected_agraph_behavior["agraph"].get_latex_string()
@@ -144,6 +157,154 @@ def test_invalid_agraph_stack_print(invalid_agraph):
     assert invalid_agraph.get_stack_string() == expected_str
 
 
+def test_common_subexpressions_removed_from_small_stack():
+    test_graph = AGraph.AGraph()
+    test_graph.command_array = np.array([[0, 0, 0],  # sin(X_0) * sin(X_0)
+                                         [0, 0, 1],  # + sin(X_0)
+                                         [6, 0, 0],
+                                         [6, 1, 0],
+                                         [4, 2, 3],
+                                         [2, 4, 3]])
+    expected_str = "(0) <= X_0\n" +\
+                   "(1) <= sin (0)\n" +\
+                   "(2) <= (1) * (1)\n" +\
+                   "(3) <= (2) + (1)\n"
+    assert test_graph._get_stack_string(short=True) == expected_str
+    assert test_graph.get_complexity() == 6
+    x = np.linspace(-1, 1, 5).reshape((-1, 1))
+    np.testing.assert_allclose(test_graph.evaluate_equation_at(x),
+                               np.sin(x)**2 + np.sin(x))
+
+
+def test_commutative_common_subexpressions_removed_from_small_stack():
+    test_graph = AGraph.AGraph()
+    test_graph.command_array = np.array([[0, 0, 0],  # (X_0 + X_1) -
+                                         [0, 1, 1],  # (X_1 + X_0)
+                                         [2, 0, 1],
+                                         [2, 1, 0],
+                                         [3, 2, 3]])
+    expected_str = "(0) <= X_0\n" +\
+                   "(1) <= X_1\n" +\
+                   "(2) <= (0) + (1)\n" +\
+                   "(3) <= (2) - (2)\n"
+    assert test_graph._get_stack_string(short=True) == expected_str
+
+
+def test_distinct_constants_not_merged_in_small_stack():
+    test_graph = AGraph.AGraph()
+    test_graph.command_array = np.array([[1, -1, -1],
+                                         [1, -1, -1],
+                                         [2, 0, 1]])
+    assert test_graph.get_number_local_optimization_params() == 2
+    assert test_graph._get_stack_string(short=True).count("C") == 2
+
+
+def simplified_agraph(command_array, constants=None):
+    test_graph = AGraph.AGraph(simplification=True)
+    test_graph.command_array = np.array(command_array)
+    if constants is not None:
+        test_graph.set_local_optimization_params(constants)
+    return test_graph
+
+
+@pytest.mark.parametrize("command_array, expected_stack", [
+    ([[0, 0, 0], [3, 0, 0], [2, 0, 1]], [[0, 0, 0], [3, 0, 0], [2, 0, 1]]),
+    ([[0, 0, 0], [0, 1, 1], [5, 1, 1], [4, 0, 2]],
+     [[0, 0, 0], [0, 1, 1], [5, 1, 1], [4, 0, 2]]),
+    ([[0, 0, 0], [11, 0, 0], [11, 1, 1]], [[0, 0, 0], [11, 0, 0]]),
+    ([[0, 0, 0], [11, 0, 0], [11, 1, 1], [2, 1, 2]],
+     [[0, 0, 0], [11, 0, 0], [2, 1, 1]]),
+    ([[0, 0, 0], [1, 0, 0], [1, 1, 1], [10, 1, 2], [4, 0, 3]],
+     [[0, 0, 0], [1, 0, 0], [4, 0, 1]]),
+])
+def test_simplified_stack(command_array, expected_stack):
+    test_graph = simplified_agraph(command_array, [2.0, 3.0])
+    np.testing.assert_array_equal(test_graph._simplified_command_array,
+                                  expected_stack)
+
+
+@pytest.mark.parametrize("command_array", [
+    [[0, 0, 0], [3, 0, 0]],
+    [[0, 0, 0], [5, 0, 0]],
+    [[0, 0, 0], [11, 0, 0], [11, 1, 1], [1, 0, 0], [4, 2, 3]],
+    [[0, 0, 0], [1, 0, 0], [5, 1, 1], [3, 0, 0], [2, 2, 3]],
+])
+def test_simplified_evaluation_exact_for_non_finite_values(command_array):
+    test_graph = simplified_agraph(command_array, [np.inf])
+    reference_graph = AGraph.AGraph()
+    reference_graph.command_array = np.array(command_array)
+    reference_graph.set_local_optimization_params([np.inf])
+    x = np.array([[np.inf], [-np.inf], [np.nan], [0.], [1.]])
+    np.testing.assert_array_equal(test_graph.evaluate_equation_at(x),
+                                  reference_graph.evaluate_equation_at(x))
+    np.testing.assert_array_equal(
+        test_graph.evaluate_equation_with_x_gradient_at(x)[1],
+        reference_graph.evaluate_equation_with_x_gradient_at(x)[1])
+
+
+def test_folded_constants_calculated_when_constants_set(mocker):
+    test_graph = simplified_agraph([[0, 0, 0],  # x * exp(c0)
+                                    [1, -1, -1],
+                                    [8, 1, 1],
+                                    [4, 0, 2]])
+    mocker.spy(AGraph.Backend, "evaluate")
+    test_graph.set_local_optimization_params([1.0])
+    assert AGraph.Backend.evaluate.call_count == 1
+    x = np.linspace(-1, 1, 5).reshape((-1, 1))
+    for _ in range(3):
+        np.testing.assert_allclose(test_graph.evaluate_equation_at(x),
+                                   x * np.exp(1.0))
+    assert AGraph.Backend.evaluate.call_count == 4
+
+
+def test_folded_constants_follow_local_optimization_params():
+    test_graph = simplified_agraph([[0, 0, 0],  # x * (c0 + exp(c1))
+                                    [1, -1, -1],
+                                    [1, -1, -1],
+                                    [8, 2, 2],
+                                    [2, 1, 3],
+                                    [4, 0, 4]])
+    assert test_graph.get_number_local_optimization_params() == 2
+    assert test_graph._simplified_command_array.shape == (3, 3)
+    x = np.linspace(-1, 1, 5).reshape((-1, 1))
+    for constants in [[1.0, 0.0], [-2.0, 1.5]]:
+        test_graph.set_local_optimization_params(constants)
+        expected = x * (constants[0] + np.exp(constants[1]))
+        np.testing.assert_allclose(test_graph.evaluate_equation_at(x),
+                                   expected)
+        _, df_dx = test_graph.evaluate_equation_with_x_gradient_at(x)
+        np.testing.assert_allclose(
+            df_dx, np.full(x.shape, constants[0] + np.exp(constants[1])))
+        _, df_dc = test_graph.evaluate_equation_with_local_opt_gradient_at(x)
+        np.testing.assert_allclose(df_dc, np.c_[x, x * np.exp(constants[1])])
+
+
+def test_constant_equation_simplified_to_single_constant():
+    test_graph = simplified_agraph([[1, -1, -1],
+                                    [6, 0, 0],
+                                    [12, 1, 1]], [0.5])
+    np.testing.assert_array_equal(test_graph._simplified_command_array,
+                                  [[1, 0, 0]])
+    x = np.zeros((3, 1))
+    np.testing.assert_allclose(test_graph.evaluate_equation_at(x),
+                               np.full((3, 1), np.sqrt(np.sin(0.5))))
+
+
+@pytest.mark.parametrize("compiled_evaluation", [True, False])
+def test_simplified_evaluation_matches(all_funcs_agraph, compiled_evaluation):
+    x = np.linspace(0.5, 2, 12).reshape((-1, 3))
+    test_graph = AGraph.AGraph(compiled_evaluation=compiled_evaluation,
+                               simplification=True)
+    test_graph.command_array = np.copy(all_funcs_agraph.command_array)
+    test_graph.set_local_optimization_params(
+        all_funcs_agraph.get_local_optimization_params())
+    np.testing.assert_allclose(test_graph.evaluate_equation_at(x),
+                               all_funcs_agraph.evaluate_equation_at(x))
+    np.testing.assert_allclose(
+        test_graph.evaluate_equation_with_x_gradient_at(x)[1],
+        all_funcs_agraph.evaluate_equation_with_x_gradient_at(x)[1])
+
+
 def test_evaluate_agraph(sample_agraph_1, sample_agraph_1_values):
     np.testing.assert_allclose(
         sample_agraph_1.evaluate_equation_at(sample_agraph_1_values.x),
@@ -257,3 +418,41 @@ def test_evaluate_local_opt_gradient_overflow_exception(mocker,
 
 def test_distance_between_graphs(sample_agraph_1):
     assert sample_agraph_1.distance(sample_agraph_1) == 0
+
+
+def test_paired_distances_match_distance(sample_agraph_1):
+    other = sample_agraph_1.copy()
+    other.command_array[0, 0] = 1
+    other.command_array[1, 1:] = 5
+    individuals = [sample_agraph_1, sample_agraph_1, other]
+    others = [sample_agraph_1, other, sample_agraph_1]
+    expected = [indv.distance(oth) for indv, oth in zip(individuals, others)]
+    np.testing.assert_array_equal(
+        AGraph.AGraph.paired_distances(individuals, others), expected)
+
+
+def test_compiled_evaluate_agraph(sample_agraph_1, sample_agraph_1_values):
+    compiled_agraph = AGraph.AGraph(compiled_evaluation=True)
+    compiled_agraph.command_array = sample_agraph_1.command_array
+    compiled_agraph.set_local_optimization_params([1.0, ])
+    np.testing.assert_allclose(
+        compiled_agraph.evaluate_equation_at(sample_agraph_1_values.x),
+        sample_agraph_1_values.f_of_x)
+
+
+def test_structure_key_ignores_unused_parameters_and_constants(
+        sample_agraph_1):
+    other_agraph = AGraph.AGraph()
+    other_agraph.command_array = np.array([[0, 0, 1],
+                                           [1, 5, 5],
+                                           [2, 0, 1],
+                                           [6, 2, 0],
+                                           [3, 0, 0],
+                                           [2, 3, 1]])
+    other_agraph.set_local_optimization_params([2.0, ])
+    assert other_agraph.get_structure_key() == \
+           sample_agraph_1.get_structure_key()
+    other_agraph.command_array[3, 0] = 7
+    other_agraph.notify_command_array_modification()
+    assert other_agraph.get_structure_key() != \
+           sample_agraph_1.get_structure_key()
@@ -197,3 +197,21 @@ def test_agraph_get_utilized_commands(backend, expected_stack_util):
 ])
 def test_agraph_backend_identifiers(the_backend, expected):
     assert the_backend.is_cpp() == expected
+
+
+def test_python_backend_evaluate_population(sample_agraph_values,
+                                            sample_stack, all_funcs_stack):
+    stacks = [sample_stack, all_funcs_stack, np.array([[0, 1, 1]])]
+    constants = [[2.0, ], sample_agraph_values.constants, []]
+    expected = np.vstack([
+        PythonBackend.evaluate(stack, sample_agraph_values.x, consts).T
+        for stack, consts in zip(stacks, constants)])
+    f_of_x = PythonBackend.evaluate_population(stacks,
+                                               sample_agraph_values.x,
+                                               constants)
+    np.testing.assert_allclose(expected, f_of_x)
+
+
+def test_python_backend_evaluate_empty_population(sample_agraph_values):
+    f_of_x = PythonBackend.evaluate_population([], sample_agraph_values.x, [])
+    assert f_of_x.shape == (0, sample_agraph_values.x.shape[0])
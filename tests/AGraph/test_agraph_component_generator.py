@@ -117,3 +117,38 @@ def test_random_command(sample_component_generator):
         generated_commands[stack_location, :] = \
             sample_component_generator.random_command(stack_location)
     np.testing.assert_array_equal(generated_commands, expected_commands)
+
+
+@pytest.mark.parametrize("num_initial_loads", [1, 3])
+def test_random_command_stacks(sample_component_generator, num_initial_loads):
+    sample_component_generator._num_initial_load_statements = \
+        num_initial_loads
+    stacks = sample_component_generator.random_command_stacks(50, 8)
+    assert stacks.shape == (50, 8, 3)
+
+    nodes = stacks[:, :, 0]
+    is_terminal = nodes < 2
+    assert np.all(is_terminal[:, :num_initial_loads])
+    assert np.all(np.isin(nodes, [0, 1, 2, 6]))
+    assert np.all(stacks[nodes == 1, 1:] == -1)
+    assert np.all(np.isin(stacks[nodes == 0, 1:], [0, 1]))
+
+    locations = np.tile(np.arange(8), (50, 1))
+    operator_params = stacks[~is_terminal, 1:]
+    assert np.all(operator_params >= 0)
+    assert np.all(operator_params < locations[~is_terminal].reshape(-1, 1))
+
+
+def test_random_command_stacks_only_terminals():
+    generator = ComponentGenerator(input_x_dimension=2,
+                                   terminal_probability=1.0)
+    stacks = generator.random_command_stacks(5, 4)
+    assert np.all(stacks[:, :, 0] < 2)
+
+
+def test_random_command_stacks_with_no_operators():
+    no_operator_generator = ComponentGenerator(input_x_dimension=1,
+                                               terminal_probability=0.0)
+    _ = no_operator_generator.random_command_stacks(3, 1)
+    with pytest.raises(ValueError):
+        _ = no_operator_generator.random_command_stacks(3, 2)
@@ -30,3 +30,25 @@ def test_generate(sample_component_generator):
     agraph = generate_agraph()
     np.testing.assert_array_equal(agraph.command_array,
                                   expected_command_array)
+
+
+def test_generate_population(sample_component_generator):
+    generate_agraph = AGraphGenerator(6, sample_component_generator,
+                                      compiled_evaluation=True)
+    population = generate_agraph.generate_population(10)
+    assert len(population) == 10
+    for agraph in population:
+        assert agraph.command_array.shape == (6, 3)
+        assert agraph._compiled_evaluation
+    second_command_array = np.copy(population[1].command_array)
+    population[0].command_array[:] = 0
+    np.testing.assert_array_equal(population[1].command_array,
+                                  second_command_array)
+
+
+def test_generated_agraphs_use_simplification(sample_component_generator):
+    generate_agraph = AGraphGenerator(6, sample_component_generator,
+                                      simplification=True)
+    assert generate_agraph()._simplification
+    for agraph in generate_agraph.generate_population(3):
+        assert agraph._simplification
@@ -0,0 +1,60 @@
+# Ignoring some linting rules in tests
+# pylint: disable=redefined-outer-name
+# pylint: disable=missing-docstring
+import pytest
+import numpy as np
+
+from bingo.SymbolicRegression.AGraph import Backend
+from bingo.SymbolicRegression.AGraph import BackendNodes
+from bingo.SymbolicRegression.AGraph import StackCompiler
+
+
+@pytest.fixture
+def sample_x():
+    return np.vstack((np.linspace(-1.0, 0.0, 11),
+                      np.linspace(0.0, 1.0, 11))).transpose()
+
+
+def test_every_backend_node_compiled():
+    assert set(StackCompiler.EXPRESSION_MAP) == \
+        set(BackendNodes.FORWARD_EVAL_MAP)
+
+
+@pytest.mark.parametrize("operator",
+                         sorted(set(BackendNodes.FORWARD_EVAL_MAP) - {0, 1}))
+@pytest.mark.parametrize("constants", [[10, 3.14],
+                                       [-2., 0.],
+                                       [np.inf, np.nan]])
+def test_compiled_stack_matches_backend(sample_x, operator, constants):
+    stack = np.array([[0, 0, 0],
+                      [1, 1, 1],
+                      [operator, 0, 1],
+                      [operator, 2, 0],
+                      [0, 1, 1],
+                      [operator, 4, 3],
+                      [operator, 1, 4],
+                      [2, 2, 3],
+                      [2, 7, 5],
+                      [2, 8, 6]])
+    np.testing.assert_array_equal(
+        StackCompiler.evaluate(stack, sample_x, constants),
+        Backend.evaluate(stack, sample_x, constants))
+
+
+def test_compiled_constant_stack_is_broadcast(sample_x):
+    stack = np.array([[1, 0, 0],
+                      [1, 1, 1],
+                      [5, 0, 1]])
+    f_of_x = StackCompiler.evaluate(stack, sample_x, [1.0, 0.0])
+    np.testing.assert_array_equal(f_of_x, np.full((11, 1), np.inf))
+
+
+def test_compiled_stacks_are_cached(sample_x):
+    StackCompiler.clear_cache()
+    stack = np.array([[0, 0, 0],
+                      [6, 0, 0]])
+    first_function = StackCompiler.compile_stack(stack)
+    StackCompiler.evaluate(stack, sample_x, [])
+    assert StackCompiler.compile_stack(stack.copy()) is first_function
+    assert StackCompiler.cache_info().hits == 2
+    assert StackCompiler.cache_info().misses == 1
@@ -4,6 +4,7 @@
 import collections
 
 import pytest
+import numpy as np
 
 from bingo.Base.MultipleValues import MultipleValueChromosomeGenerator, \
                                  MultipleValueChromosome
@@ -232,3 +233,53 @@ def test_get_pareto_front(pareto_front_population,
     new_population = selection.select_pareto_front(population)
     assert collections.Counter(new_population) == \
     collections.Counter(pareto_front_population)
+
+
+def pairwise_removal_set(ages, fitnesses, target_num_remaining):
+    removed = []
+    num_selected = len(ages)
+    for i in range(num_selected - 1):
+        for j in range(i + 1, num_selected):
+            if ages[i] <= ages[j] and fitnesses[i] <= fitnesses[j]:
+                if j not in removed:
+                    removed.append(j)
+            elif ages[j] <= ages[i] and fitnesses[j] <= fitnesses[i]:
+                if i not in removed:
+                    removed.append(i)
+            if num_selected - len(removed) == target_num_remaining:
+                return removed
+    return removed
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_removal_order_matches_pairwise_comparison(seed):
+    np.random.seed(seed)
+    num_selected = 30
+    ages = np.random.randint(0, 4, num_selected).astype(float)
+    fitnesses = np.random.randint(0, 5, num_selected).astype(float)
+    fitnesses[np.random.random(num_selected) < 0.1] = np.nan
+    removal_order = AgeFitness._get_removal_order(ages, fitnesses)
+    for target in [1, 10, 25]:
+        expected = pairwise_removal_set(ages, fitnesses, target)
+        np.testing.assert_array_equal(removal_order[:num_selected - target],
+                                      expected)
+
+
+@pytest.mark.parametrize("num_selected", [2, 3, 8, 16])
+@pytest.mark.parametrize("seed", range(5))
+def test_pairwise_removal_order_matches_sweep(seed, num_selected):
+    np.random.seed(seed)
+    ages = np.random.randint(0, 3, num_selected).astype(float)
+    fitnesses = np.random.randint(0, 3, num_selected).astype(float)
+    fitnesses[np.random.random(num_selected) < 0.1] = np.nan
+    np.testing.assert_array_equal(
+        AgeFitness._get_pairwise_removal_order(ages, fitnesses),
+        AgeFitness._get_removal_order(ages, fitnesses))
+
+
+def test_small_groups_not_compared_by_sweep(mocker, strong_population):
+    mocker.spy(AgeFitness, "_get_removal_order")
+    _ = AgeFitness(selection_size=2)(strong_population, TARGET_POP_SIZE)
+    assert AgeFitness._get_removal_order.call_count == 0
+    _ = AgeFitness().select_pareto_front(strong_population * 10)
+    assert AgeFitness._get_removal_order.call_count == 1
@@ -4,7 +4,8 @@
 import pytest
 import numpy as np
 
-from bingo.Base.FitnessFunction import FitnessFunction, VectorBasedFunction
+from bingo.Base.FitnessFunction import FitnessFunction, VectorBasedFunction, \
+                                      VectorGradientMixin
 from bingo.Base.ContinuousLocalOptimization import ContinuousLocalOptimization
 from bingo.Base.MultipleFloats import MultipleFloatChromosome
 
@@ -24,6 +25,16 @@ class FloatVectorFitnessFunction(VectorBasedFunction):
         return [x - 0 for x in vals]
 
 
+class FloatVectorGradientFitnessFunction(FloatVectorFitnessFunction,
+                                         VectorGradientMixin):
+    def get_fitness_vector_and_jacobian(self, individual):
+        self.eval_count += 1
+        jacobian = np.zeros((NUM_VALS, NUM_OPT))
+        for i, index in enumerate(individual._needs_opt_list):
+            jacobian[index, i] = 1.0
+        return self._evaluate_fitness_vector(individual), jacobian
+
+
 @pytest.fixture
 def opt_individual():
     vals = [1. for _ in range(NUM_VALS)]
@@ -130,3 +141,79 @@ def test_set_training_data_pass_through():
         ContinuousLocalOptimization(fitness_function, "Powell")
     local_opt_fitness_function.training_data = 123
     assert fitness_function.training_data == 123
+
+
+def test_optimize_fitness_vector_with_jacobian(mocker, opt_individual):
+    opt_list = [1. for _ in range(NUM_VALS)]
+    opt_list[:3] = [0., 0., 0.]
+    fitness_function = FloatVectorGradientFitnessFunction()
+    mocker.spy(fitness_function, "get_fitness_vector_and_jacobian")
+    local_opt_fitness_function = ContinuousLocalOptimization(
+        fitness_function, 'lm')
+    opt_indv_fitness = local_opt_fitness_function(opt_individual)
+    assert opt_indv_fitness == pytest.approx(np.mean(opt_list))
+    assert fitness_function.get_fitness_vector_and_jacobian.call_count > 0
+
+
+@pytest.mark.parametrize("algorithm", ['CG', 'BFGS', 'L-BFGS-B', 'SLSQP'])
+def test_minimize_uses_gradient(mocker, opt_individual, algorithm):
+    fitness_function = FloatVectorGradientFitnessFunction()
+    mocker.spy(fitness_function, "get_fitness_and_gradient")
+    local_opt_fitness_function = ContinuousLocalOptimization(
+        fitness_function, algorithm)
+    local_opt_fitness_function(opt_individual)
+    assert fitness_function.get_fitness_and_gradient.call_count > 0
+
+
+@pytest.mark.parametrize("algorithm", ['lm', 'CG', 'BFGS', 'L-BFGS-B',
+                                       'SLSQP'])
+def test_fitness_not_evaluated_separately_from_jacobian(mocker, opt_individual,
+                                                        algorithm):
+    fitness_function = FloatVectorGradientFitnessFunction()
+    mocker.spy(fitness_function, "_evaluate_fitness_vector")
+    mocker.spy(fitness_function, "get_fitness_vector_and_jacobian")
+    local_opt_fitness_function = ContinuousLocalOptimization(
+        fitness_function, algorithm)
+    local_opt_fitness_function._optimize_params(opt_individual)
+    assert fitness_function._evaluate_fitness_vector.call_count == \
+        fitness_function.get_fitness_vector_and_jacobian.call_count
+
+
+class ConstantGradientFitnessFunction(VectorGradientMixin):
+    def get_fitness_vector_and_jacobian(self, individual):
+        return np.array([1., -3.]), np.array([[1., 2.], [1., 2.]])
+
+
+def test_gradient_mixin_unchunked_by_default():
+    fitness_function = ConstantGradientFitnessFunction()
+    assert fitness_function.chunk_size is None
+    fitness, gradient = fitness_function.get_fitness_and_gradient(None)
+    assert fitness == pytest.approx(2.)
+    np.testing.assert_array_almost_equal(gradient, [0., 0.])
+
+
+def test_no_jacobian_for_derivative_free_algorithm(mocker, opt_individual):
+    fitness_function = FloatVectorGradientFitnessFunction()
+    mocker.spy(fitness_function, "get_fitness_vector_and_jacobian")
+    local_opt_fitness_function = ContinuousLocalOptimization(
+        fitness_function, 'Nelder-Mead')
+    local_opt_fitness_function(opt_individual)
+    assert fitness_function.get_fitness_vector_and_jacobian.call_count == 0
+
+
+def test_evaluate_fitness_vector_optimizes_params(opt_individual):
+    fitness_function = FloatVectorFitnessFunction()
+    local_opt_fitness_function = ContinuousLocalOptimization(
+        fitness_function, "lm")
+    fitness_vector = \
+        local_opt_fitness_function.evaluate_fitness_vector(opt_individual)
+    expected_vector = np.ones(NUM_VALS)
+    expected_vector[[1, 3, 4]] = 0.
+    np.testing.assert_array_almost_equal(fitness_vector, expected_vector)
+
+
+def test_evaluate_fitness_vector_needs_vector_based_function(reg_individual):
+    local_opt_fitness_function = ContinuousLocalOptimization(
+        MultipleFloatValueFitnessFunction())
+    with pytest.raises(AttributeError):
+        local_opt_fitness_function.evaluate_fitness_vector(reg_individual)
@@ -6,7 +6,8 @@ import numpy as np
 
 from bingo.Base.DeterministicCrowdingSelection import \
     DeterministicCrowdingSelection
-from bingo.Base.MultipleValues import MultipleValueChromosomeGenerator
+from bingo.Base.MultipleValues import MultipleValueChromosome, \
+    MultipleValueChromosomeGenerator
 
 
 @pytest.fixture
@@ -83,3 +84,28 @@ def test_unfit_parents_chosen_over_unfit_offspring(unfit_pop, onemax_evaluator,
     for old, new in zip(unfit_pop, next_gen):
         assert old.fitness == new.fitness
         assert old == new
+
+
+def test_distances_computed_for_whole_population(fit_pop, unfit_pop, mocker,
+                                                 selection):
+    spy = mocker.spy(MultipleValueChromosome, "paired_distances")
+    _ = selection(fit_pop + unfit_pop, 10)
+    assert spy.call_count == 1
+
+
+def test_children_paired_with_closest_parents(selection):
+    parents = [MultipleValueChromosome([0, 0, 0]),
+               MultipleValueChromosome([1, 1, 1])]
+    children = [MultipleValueChromosome([1, 1, 0]),
+                MultipleValueChromosome([0, 0, 1])]
+    for indv in parents:
+        indv.fitness = 1
+    for indv in children:
+        indv.fitness = 0
+    next_gen = selection(parents + children, 2)
+    assert next_gen[0] is children[1]
+    assert next_gen[1] is children[0]
+
+
+def test_empty_population(selection):
+    assert selection([], 0) == []
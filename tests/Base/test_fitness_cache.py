@@ -0,0 +1,109 @@
+# Ignoring some linting rules in tests
+# pylint: disable=redefined-outer-name
+# pylint: disable=missing-docstring
+import pytest
+import numpy as np
+
+from bingo.Base.FitnessCache import FitnessCache
+from bingo.Base.FitnessFunction import FitnessFunction
+from bingo.Base.MultipleFloats import MultipleFloatChromosome
+
+
+class StructuredFloatChromosome(MultipleFloatChromosome):
+    def __init__(self, values, needs_opt_list):
+        super().__init__(values, needs_opt_list)
+        self.optimized = False
+
+    def needs_local_optimization(self):
+        return not self.optimized
+
+    def get_structure_key(self):
+        return tuple(self.values[len(self._needs_opt_list):])
+
+    def get_local_optimization_params(self):
+        return [self.values[i] for i in self._needs_opt_list]
+
+    def set_local_optimization_params(self, params):
+        super().set_local_optimization_params(params)
+        self.optimized = True
+
+
+class OptimizingFitnessFunction(FitnessFunction):
+    def __call__(self, individual):
+        self.eval_count += 1
+        if individual.needs_local_optimization():
+            individual.set_local_optimization_params(
+                [-1.0] * individual.get_number_local_optimization_params())
+        return sum(individual.values)
+
+
+def structured_individual(*structure):
+    return StructuredFloatChromosome([0.0, 0.0] + list(structure), [0, 1])
+
+
+@pytest.fixture
+def cached_fitness():
+    return FitnessCache(OptimizingFitnessFunction(), cache_size=2)
+
+
+def test_cache_hit_sets_fitness_and_params(cached_fitness):
+    first = structured_individual(1.0, 2.0)
+    repeat = structured_individual(1.0, 2.0)
+    assert cached_fitness(first) == 1.0
+    assert cached_fitness(repeat) == 1.0
+    assert repeat.values == [-1.0, -1.0, 1.0, 2.0]
+    assert not repeat.needs_local_optimization()
+    assert cached_fitness.eval_count == 1
+    assert cached_fitness.hits == 1
+    assert cached_fitness.misses == 1
+
+
+def test_individuals_not_needing_optimization_are_not_cached(cached_fitness):
+    indv = structured_individual(1.0, 2.0)
+    indv.optimized = True
+    cached_fitness(indv)
+    cached_fitness(indv)
+    assert cached_fitness.eval_count == 2
+    assert len(cached_fitness) == 0
+
+
+def test_least_recently_used_structure_is_evicted(cached_fitness):
+    cached_fitness(structured_individual(1.0))
+    cached_fitness(structured_individual(2.0))
+    cached_fitness(structured_individual(1.0))
+    cached_fitness(structured_individual(3.0))
+    assert len(cached_fitness) == 2
+    cached_fitness(structured_individual(1.0))
+    assert cached_fitness.hits == 2
+    cached_fitness(structured_individual(2.0))
+    assert cached_fitness.misses == 4
+
+
+def test_setting_training_data_clears_cache(cached_fitness):
+    cached_fitness(structured_individual(1.0))
+    cached_fitness.training_data = np.ones(3)
+    assert len(cached_fitness) == 0
+    np.testing.assert_array_equal(
+        cached_fitness._fitness_function.training_data, np.ones(3))
+
+
+@pytest.mark.parametrize("fitness", [np.nan, np.inf])
+def test_non_finite_fitness_not_cached(mocker, cached_fitness, fitness):
+    mocker.patch.object(OptimizingFitnessFunction, "__call__",
+                        side_effect=[fitness, 3.0])
+    _ = cached_fitness(structured_individual(1.0, 2.0))
+    assert len(cached_fitness) == 0
+    assert cached_fitness(structured_individual(1.0, 2.0)) == 3.0
+    assert len(cached_fitness) == 1
+    assert cached_fitness.misses == 2
+
+
+def test_eval_count_pass_through(cached_fitness):
+    cached_fitness.eval_count = 123
+    assert cached_fitness._fitness_function.eval_count == 123
+
+
+@pytest.mark.parametrize("cache_size", [0, -1])
+def test_raises_error_invalid_cache_size(cache_size):
+    with pytest.raises(ValueError):
+        FitnessCache(OptimizingFitnessFunction(), cache_size)
@@ -1,12 +1,16 @@
 # Ignoring some linting rules in tests
 # pylint: disable=redefined-outer-name
 # pylint: disable=missing-docstring
+import pickle
+
 import pytest
 import numpy as np
-from bingo.Base.FitnessFunction import FitnessFunction
+from bingo.Base.FitnessFunction import FitnessFunction, VectorBasedFunction
 from bingo.Base.FitnessPredictor import FitnessPredictorFitnessFunction, \
-                                   FitnessPredictorIndexGenerator
-from bingo.Base.MultipleValues import MultipleValueChromosome
+                                   FitnessPredictorIndexGenerator, \
+                                   MAX_INCREMENTAL_SUM_UPDATES
+from bingo.Base.MultipleValues import MultipleValueChromosome, \
+    SinglePointMutation
 
 
 class MinPlusMean(FitnessFunction):
@@ -14,6 +18,31 @@ class MinPlusMean(FitnessFunction):
         return min(individual.values) + np.mean(self.training_data)
 
 
+class DistanceToValues(VectorBasedFunction):
+    def _evaluate_fitness_vector(self, individual):
+        self.eval_count += 1
+        return self.training_data - np.mean(individual.values)
+
+
+class GatherCountingData:
+    def __init__(self, data):
+        self.data = data
+        self.num_gathers = 0
+
+    def __getitem__(self, items):
+        self.num_gathers += 1
+        return self.data[items]
+
+    def __len__(self):
+        return len(self.data)
+
+    def __array__(self, dtype=None):
+        return np.asarray(self.data, dtype)
+
+    def __sub__(self, other):
+        return self.data - other
+
+
 @pytest.fixture
 def training_data():
     return np.arange(10)
@@ -80,9 +109,186 @@ def test_predicted_fitness_for_trainer(predictor_fitness_function,
         np.testing.assert_almost_equal(prediction, expected_prediction)
 
 
+@pytest.fixture
+def vector_predictor_fitness_function(training_data, sample_population):
+    return FitnessPredictorFitnessFunction(training_data,
+                                           DistanceToValues(training_data),
+                                           sample_population, 4)
+
+
+@pytest.mark.parametrize("predictor_values", [[0, 1],
+                                              [2],
+                                              [5, 5, 5],
+                                              [9, 8, 0]])
+def test_vector_predictor_fitness_uses_cached_trainer_errors(
+        vector_predictor_fitness_function, training_data, sample_population,
+        predictor_values):
+    subset = training_data[predictor_values]
+    expected_fitness = np.mean(
+        [abs(np.mean(np.abs(training_data - np.mean(trainer.values)))
+             - np.mean(np.abs(subset - np.mean(trainer.values))))
+         for trainer in sample_population[:4]])
+
+    full_fitness_function = vector_predictor_fitness_function._fitness_function
+    eval_count = full_fitness_function.eval_count
+    predictor = MultipleValueChromosome(predictor_values)
+    fitness = vector_predictor_fitness_function(predictor)
+    np.testing.assert_almost_equal(fitness, expected_fitness)
+    assert full_fitness_function.eval_count == eval_count
+    assert vector_predictor_fitness_function.point_eval_count == \
+        4 * len(training_data) + 4 * len(predictor_values)
+
+
+def test_added_trainer_errors_are_cached(vector_predictor_fitness_function,
+                                         training_data):
+    predictor = MultipleValueChromosome([0, 9])
+    fitness_before = vector_predictor_fitness_function(predictor)
+    trainer = MultipleValueChromosome([3, 4])
+    vector_predictor_fitness_function.add_trainer(trainer)
+    np.testing.assert_almost_equal(
+        vector_predictor_fitness_function._point_errors_for_trainers[0],
+        np.abs(training_data - 3.5))
+
+    fitness_after = vector_predictor_fitness_function(predictor)
+    assert fitness_after != pytest.approx(fitness_before)
+    vector_predictor_fitness_function._point_error_sums_cache.clear()
+    np.testing.assert_almost_equal(vector_predictor_fitness_function(predictor),
+                                   fitness_after)
+
+
+def test_mutated_predictor_sums_updated_incrementally(
+        mocker, vector_predictor_fitness_function):
+    parent = MultipleValueChromosome([0, 4, 7, 9])
+    parent_fitness = vector_predictor_fitness_function(parent)
+
+    mutation = SinglePointMutation(lambda: 2)
+    np.random.seed(0)
+    child = mutation(parent)
+    mocker.spy(np, "sum")
+    child_fitness = vector_predictor_fitness_function(child)
+    assert np.sum.call_count == 0
+    assert parent_fitness == vector_predictor_fitness_function(parent)
+
+    vector_predictor_fitness_function._point_error_sums_cache.clear()
+    np.testing.assert_almost_equal(vector_predictor_fitness_function(child),
+                                   child_fitness)
+
+
+def test_predictor_sums_not_stored_with_predictor(
+        vector_predictor_fitness_function):
+    predictor = MultipleValueChromosome([0, 4, 7, 9])
+    attributes = set(vars(predictor))
+    _ = vector_predictor_fitness_function(predictor)
+    assert set(vars(predictor)) == attributes
+    assert set(vars(predictor.copy())) == attributes
+
+
+def test_predictor_sums_recomputed_after_many_incremental_updates(
+        mocker, vector_predictor_fitness_function):
+    predictors = [MultipleValueChromosome([0, 4, 7, 9])]
+    _ = vector_predictor_fitness_function(predictors[0])
+    mocker.spy(np, "sum")
+    for i in range(MAX_INCREMENTAL_SUM_UPDATES + 1):
+        child = predictors[-1].copy()
+        child.values[i % 4] = (child.values[i % 4] + 1) % 10
+        _ = vector_predictor_fitness_function(child)
+        predictors.append(child)
+    assert np.sum.call_count == 4
+
+
+def test_predictor_sums_cache_not_pickled(vector_predictor_fitness_function):
+    _ = vector_predictor_fitness_function(MultipleValueChromosome([0, 4]))
+    fitness_function = pickle.loads(
+        pickle.dumps(vector_predictor_fitness_function))
+    assert not fitness_function._point_error_sums_cache
+
+
+def test_crossed_over_predictor_sums_recomputed(
+        vector_predictor_fitness_function):
+    parent_1 = MultipleValueChromosome([0, 4, 7, 9])
+    parent_2 = MultipleValueChromosome([1, 1, 2, 2])
+    _ = vector_predictor_fitness_function(parent_1)
+    _ = vector_predictor_fitness_function(parent_2)
+    child = parent_1.copy()
+    child.values = [0, 4, 2, 2]
+    expected_child = MultipleValueChromosome([0, 4, 2, 2])
+    np.testing.assert_almost_equal(
+        vector_predictor_fitness_function(child),
+        vector_predictor_fitness_function(expected_child))
+
+
 @pytest.mark.parametrize("maximum", [2, 20])
 def test_index_generator(maximum):
     generator = FitnessPredictorIndexGenerator(maximum)
     indices = np.array([generator() for _ in range(100)])
     assert np.all(indices >= 0)
     assert np.all(indices < maximum)
+
+
+@pytest.mark.parametrize("fitness_function_fixture",
+                         ["predictor_fitness_function",
+                          "vector_predictor_fitness_function"])
+def test_predicted_fitness_by_predictors(request, sample_population,
+                                         fitness_function_fixture):
+    fitness_function = request.getfixturevalue(fitness_function_fixture)
+    predictors = [MultipleValueChromosome(values)
+                  for values in [[0, 1], [2], [5, 5, 5], [9, 8, 0]]]
+    for trainer in sample_population:
+        expected_predictions = \
+            [fitness_function.predict_fitness_for_trainer(predictor, trainer)
+             for predictor in predictors]
+        predictions = fitness_function.\
+            predict_fitness_for_trainer_by_predictors(predictors, trainer)
+        np.testing.assert_array_almost_equal(predictions,
+                                             expected_predictions)
+
+
+def test_predicted_fitness_by_predictors_evaluates_trainer_once(
+        vector_predictor_fitness_function):
+    full_fitness_function = vector_predictor_fitness_function._fitness_function
+    eval_count = full_fitness_function.eval_count
+    point_eval_count = vector_predictor_fitness_function.point_eval_count
+    predictors = [MultipleValueChromosome(values)
+                  for values in [[0, 1], [1, 2], [2, 3]]]
+    _ = vector_predictor_fitness_function.\
+        predict_fitness_for_trainer_by_predictors(
+            predictors, MultipleValueChromosome([4, 5]))
+    assert full_fitness_function.eval_count == eval_count + 1
+    assert vector_predictor_fitness_function.point_eval_count == \
+        point_eval_count + 6
+
+
+def test_predictor_subset_gathered_once(training_data, sample_population):
+    counting_data = GatherCountingData(training_data)
+    fitness_function = FitnessPredictorFitnessFunction(
+        counting_data, MinPlusMean(counting_data), sample_population, 4)
+    counting_data.num_gathers = 0
+    predictor = MultipleValueChromosome([9, 0, 4])
+    first_fitness = fitness_function(predictor)
+    assert fitness_function(predictor) == first_fitness
+    assert counting_data.num_gathers == 1
+
+    predictor.values[1] = 5
+    _ = fitness_function(predictor)
+    assert counting_data.num_gathers == 2
+
+
+def test_union_of_predictor_subsets_gathered_once(training_data,
+                                                  sample_population):
+    counting_data = GatherCountingData(training_data)
+    fitness_function = FitnessPredictorFitnessFunction(
+        counting_data, DistanceToValues(counting_data), sample_population, 4)
+    counting_data.num_gathers = 0
+    predictors = [MultipleValueChromosome(values)
+                  for values in [[7, 1], [3, 9], [1, 4]]]
+    for trainer in sample_population:
+        _ = fitness_function.predict_fitness_for_trainer_by_predictors(
+            predictors, trainer)
+    assert counting_data.num_gathers == 1
+
+
+def test_subset_caches_not_pickled(predictor_fitness_function):
+    _ = predictor_fitness_function(MultipleValueChromosome([0, 1]))
+    unpickled = pickle.loads(pickle.dumps(predictor_fitness_function))
+    assert unpickled._subset_training_data_cache == {}
+    assert unpickled._union_training_data is None
@@ -11,7 +11,7 @@ from bingo.Base import FitnessPredictorIsland
 from bingo.Base.MuPlusLambdaEA import MuPlusLambda
 from bingo.Base.TournamentSelection import Tournament
 from bingo.Base.Evaluation import Evaluation
-from bingo.Base.FitnessFunction import FitnessFunction
+from bingo.Base.FitnessFunction import FitnessFunction, VectorBasedFunction
 
 
 MAIN_POPULATION_SIZE = 40
@@ -28,13 +28,19 @@ class DistanceToAverage(FitnessFunction):
         return np.linalg.norm(individual.values - avg_data)
 
 
-@pytest.fixture
-def ev_alg():
+class DistanceToData(VectorBasedFunction):
+    def _evaluate_fitness_vector(self, individual):
+        self.eval_count += 1
+        return np.mean(individual.values) - self.training_data
+
+
+@pytest.fixture(params=[DistanceToAverage, DistanceToData])
+def ev_alg(request):
     crossover = SinglePointCrossover()
     mutation = SinglePointMutation(np.random.random)
     selection = Tournament(2)
     training_data = np.linspace(0.1, 1, FULL_TRAINING_DATA_SIZE)
-    fitness = DistanceToAverage(training_data)
+    fitness = request.param(training_data)
     evaluator = Evaluation(fitness)
     return MuPlusLambda(evaluator, selection, crossover, mutation,
                         0., 1.0, MAIN_POPULATION_SIZE)
@@ -165,6 +171,33 @@ def test_nan_on_predicted_variance_of_trainer(mocker,
     assert np.isnan(variance)
 
 
+def test_best_new_trainer_has_max_predictor_variance(mocker,
+                                                     fitness_predictor_island):
+    island = fitness_predictor_island
+    variances = np.zeros(MAIN_POPULATION_SIZE)
+    variances[[3, 7]] = 2.0
+    variances[5] = np.nan
+    mocker.patch.object(island, "_calculate_predictor_variance_of",
+                        side_effect=variances)
+    assert island._find_best_new_trainer() is island.population[3]
+
+
+def test_training_data_kept_while_best_predictor_unchanged(
+        fitness_predictor_island):
+    island = fitness_predictor_island
+    training_data = island._fitness_function.training_data
+    island._update_to_use_best_fitness_predictor()
+    assert island._fitness_function.training_data is training_data
+
+    best_predictor = island._predictor_island.best_individual()
+    best_predictor.values[0] = (best_predictor.values[0] + 1) \
+        % FULL_TRAINING_DATA_SIZE
+    island._update_to_use_best_fitness_predictor()
+    np.testing.assert_array_equal(
+        island._fitness_function.training_data,
+        island._full_training_data[best_predictor.values])
+
+
 def assert_expected_compute_ratio(fitness_predictor_island, point_evals_main,
                                   point_evals_predictor):
     ratio_after_init = \
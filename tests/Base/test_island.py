@@ -72,3 +72,35 @@ def test_pareto_front_sorted_by_fitness(island):
     assert all(pareto_front[i].fitness <= pareto_front[i+1].fitness \
                for i in range(len(pareto_front)-1))
 
+
+def test_pareto_front_of_age_and_fitness_by_default(island):
+    assert island.pareto_archive is None
+    island.execute_generational_step()
+    island.update_pareto_front()
+    expected_front = island.pareto_front_selection.select_pareto_front(
+        island.population)
+    assert sorted(indv.fitness for indv in island.get_pareto_front()) == \
+        sorted(indv.fitness for indv in expected_front)
+
+
+def test_pareto_front_uses_given_archive(island, mocker):
+    archive = mocker.Mock()
+    archive.get_individuals.return_value = ["front"]
+    island.pareto_archive = archive
+    island.update_pareto_front()
+    archive.update.assert_called_once_with(island.population)
+    assert island.get_pareto_front() == ["front"]
+
+
+def test_population_built_by_generate_population(mocker):
+    generator = MultipleValueChromosomeGenerator(mutation_function, 10)
+    mocker.spy(generator, "generate_population")
+    island = Island(mocker.Mock(), generator, 25)
+    generator.generate_population.assert_called_once_with(25)
+    assert len(island.population) == 25
+
+
+def test_population_built_by_calling_plain_generator(mocker):
+    generator = MultipleValueChromosomeGenerator(mutation_function, 10)
+    island = Island(mocker.Mock(), generator.__call__, 25)
+    assert len(island.population) == 25
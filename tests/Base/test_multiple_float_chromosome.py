@@ -77,3 +77,7 @@ def test_generate_individual_with_no_opt_list():
                                                  LIST_SIZE)
     individual = generator()
     assert not individual._needs_opt_list
+
+def test_get_local_optimization_params(opt_individual):
+    params = opt_individual.get_local_optimization_params()
+    assert params == opt_individual.values[OPT_INDEX_START:OPT_INDEX_STOP + 1]
@@ -138,3 +138,32 @@ def test_distance(sample_bool_list_chromosome):
     chromosome.values[0] = \
         (not sample_bool_list_chromosome.values[0])
     assert sample_bool_list_chromosome.distance(chromosome) == 1
+
+
+def test_distance_counts_differing_values():
+    chromosome = MultipleValueChromosome([1, 2, 3, 4])
+    other = MultipleValueChromosome([1, 0, 3, 0])
+    assert chromosome.distance(other) == 2
+
+
+def test_paired_distances_match_distance():
+    individuals = [MultipleValueChromosome([1, 2, 3, 4]),
+                   MultipleValueChromosome([0, 0, 0, 0])]
+    others = [MultipleValueChromosome([1, 0, 3, 4]),
+              MultipleValueChromosome([1, 0, 3, 0])]
+    expected = [indv.distance(other)
+                for indv, other in zip(individuals, others)]
+    np.testing.assert_array_equal(
+        MultipleValueChromosome.paired_distances(individuals, others),
+        expected)
+
+
+def test_copy_has_independent_values(sample_int_list_chromosome):
+    sample_int_list_chromosome.genetic_age = 3
+    sample_int_list_chromosome.fitness = 1.5
+    chromosome = sample_int_list_chromosome.copy()
+    chromosome.values[0] = 2
+    assert sample_int_list_chromosome.values[0] != 2
+    assert chromosome.genetic_age == 3
+    assert chromosome.fitness == 1.5
+    assert chromosome.fit_set
@@ -0,0 +1,209 @@
+# Ignoring some linting rules in tests
+# pylint: disable=redefined-outer-name
+# pylint: disable=missing-docstring
+import pytest
+import numpy as np
+
+from bingo.Base.MultipleValues import SinglePointCrossover, \
+                                      SinglePointMutation, \
+                                      MultipleValueChromosomeGenerator
+from bingo.Base.Island import Island
+from bingo.Base.MuPlusLambdaEA import MuPlusLambda
+from bingo.Base.TournamentSelection import Tournament
+from bingo.Base.Evaluation import Evaluation
+from bingo.Base.FitnessFunction import FitnessFunction
+from bingo.Base.ParallelArchipelago import ParallelArchipelago
+
+
+POP_SIZE = 5
+SELECTION_SIZE = 10
+VALUE_LIST_SIZE = 10
+OFFSPRING_SIZE = 20
+ERROR_TOL = 10e-6
+
+
+class MultipleValueFitnessFunction(FitnessFunction):
+    def __call__(self, individual):
+        fitness = np.count_nonzero(individual.values)
+        self.eval_count += 1
+        return fitness
+
+
+def generate_three():
+    return 3
+
+
+def generate_two():
+    return 2
+
+
+def generate_one():
+    return 1
+
+
+def generate_zero():
+    return 0
+
+
+def mutation_function():
+    return np.random.choice([False, True])
+
+
+@pytest.fixture
+def evol_alg():
+    crossover = SinglePointCrossover()
+    mutation = SinglePointMutation(mutation_function)
+    selection = Tournament(SELECTION_SIZE)
+    fitness = MultipleValueFitnessFunction()
+    evaluator = Evaluation(fitness)
+    return MuPlusLambda(evaluator, selection, crossover, mutation,
+                        0.2, 0.4, OFFSPRING_SIZE)
+
+
+@pytest.fixture
+def zero_island(evol_alg):
+    generator = MultipleValueChromosomeGenerator(generate_zero,
+                                                 VALUE_LIST_SIZE)
+    return Island(evol_alg, generator, POP_SIZE)
+
+
+@pytest.fixture
+def one_island(evol_alg):
+    generator = MultipleValueChromosomeGenerator(generate_one,
+                                                 VALUE_LIST_SIZE)
+    return Island(evol_alg, generator, POP_SIZE)
+
+
+@pytest.fixture
+def two_island(evol_alg):
+    generator = MultipleValueChromosomeGenerator(generate_two,
+                                                 VALUE_LIST_SIZE)
+    return Island(evol_alg, generator, POP_SIZE)
+
+
+@pytest.fixture
+def three_island(evol_alg):
+    generator = MultipleValueChromosomeGenerator(generate_three,
+                                                 VALUE_LIST_SIZE)
+    return Island(evol_alg, generator, POP_SIZE)
+
+
+@pytest.fixture
+def island_list(zero_island, one_island, two_island, three_island):
+    return [zero_island, one_island, two_island, three_island]
+
+
+@pytest.fixture
+def island(evol_alg):
+    generator = MultipleValueChromosomeGenerator(mutation_function,
+                                                 VALUE_LIST_SIZE)
+    return Island(evol_alg, generator, POP_SIZE)
+
+
+@pytest.fixture
+def archipelago(island):
+    archipelago = ParallelArchipelago(island, num_islands=3)
+    yield archipelago
+    archipelago.shutdown()
+
+
+def test_archipelago_generated(archipelago, island):
+    populations = archipelago.get_populations()
+    assert len(populations) == 3
+    for population in populations:
+        assert len(population) == len(island.population)
+
+
+def test_generational_step_executed(archipelago):
+    archipelago.step_through_generations(2)
+    assert archipelago.archipelago_age == 2
+    for population in archipelago.get_populations():
+        for indv in population:
+            assert indv.fit_set
+
+
+def test_island_migration(one_island, island_list):
+    archipelago = ParallelArchipelago(one_island, num_islands=4)
+    archipelago._islands = island_list
+
+    archipelago.coordinate_migration_between_islands()
+    populations = archipelago.get_populations()
+    archipelago.shutdown()
+
+    migration_count = 0
+    for i, population in enumerate(populations):
+        assert len(population) == POP_SIZE
+        initial_individual_values = [i]*VALUE_LIST_SIZE
+        for individual in population:
+            if initial_individual_values != individual.values:
+                migration_count += 1
+                break
+    assert len(island_list) == migration_count
+
+
+def test_convergence_of_archipelago(one_island, island_list):
+    archipelago = ParallelArchipelago(one_island, num_islands=4)
+    archipelago._islands = island_list
+
+    converged = archipelago.test_for_convergence(0)
+    archipelago.shutdown()
+    assert converged
+    assert archipelago.get_best_individual().fitness == 0
+
+
+def test_convergence_of_archipelago_unconverged(one_island):
+    archipelago = ParallelArchipelago(one_island, num_islands=6)
+    converged = archipelago.test_for_convergence(0)
+    archipelago.shutdown()
+    assert not converged
+
+
+def test_worker_errors_are_raised(archipelago):
+    archipelago._send_to_all("not a command")
+    with pytest.raises(KeyError):
+        archipelago._receive_from_all()
+
+
+def test_archipelago_usable_after_worker_error(archipelago, island):
+    archipelago._send_to_all("not a command")
+    with pytest.raises(KeyError):
+        archipelago._receive_from_all()
+    populations = archipelago.get_populations()
+    assert len(populations) == 3
+    for population in populations:
+        assert len(population) == len(island.population)
+
+
+def test_workers_terminated_when_worker_fails(archipelago):
+    archipelago.step_through_generations(1)
+    workers = archipelago._workers
+    connections = archipelago._connections
+    workers[1].terminate()
+    workers[1].join()
+    with pytest.raises((EOFError, OSError)):
+        archipelago.get_populations()
+    assert not any(worker.is_alive() for worker in workers)
+    assert all(connection.closed for connection in connections)
+    with pytest.raises(RuntimeError):
+        archipelago.get_populations()
+
+
+def test_shutdown_closes_connections(archipelago):
+    archipelago.step_through_generations(1)
+    workers = archipelago._workers
+    connections = archipelago._connections
+    archipelago.shutdown()
+    assert not any(worker.is_alive() for worker in workers)
+    assert all(connection.closed for connection in connections)
+
+
+def test_archipelago_runs(one_island, two_island, three_island):
+    archipelago = ParallelArchipelago(one_island, num_islands=4)
+    archipelago._islands = [one_island, two_island, three_island,
+                            three_island]
+    converged = archipelago.run_islands(max_generations=100,
+                                        min_generations=20,
+                                        generation_step_report=10,
+                                        error_tol=0)
+    archipelago.shutdown()
+    assert converged
@@ -0,0 +1,117 @@
+# Ignoring some linting rules in tests
+# pylint: disable=redefined-outer-name
+# pylint: disable=missing-docstring
+import pickle
+import pytest
+import numpy as np
+
+from bingo.Base.ParallelEvaluation import ParallelEvaluation
+from bingo.Base.ContinuousLocalOptimization import ContinuousLocalOptimization
+from bingo.Base.FitnessFunction import FitnessFunction
+from bingo.Base.MultipleFloats import MultipleFloatChromosome
+from SingleValue import SingleValueFitnessFunction
+
+
+class FloatNormFitnessFunction(FitnessFunction):
+    def __call__(self, individual):
+        self.eval_count += 1
+        return np.linalg.norm(individual.values)
+
+
+@pytest.fixture
+def parallel_evaluation():
+    evaluation = ParallelEvaluation(SingleValueFitnessFunction(),
+                                    num_workers=2)
+    yield evaluation
+    evaluation.shutdown()
+
+
+def test_parallel_evaluation_evaluates_all_individuals(
+        parallel_evaluation, single_value_population_of_4):
+    parallel_evaluation(single_value_population_of_4)
+    assert parallel_evaluation.eval_count == 4
+    for indv in single_value_population_of_4:
+        assert indv.fit_set
+        assert indv.fitness == indv.value
+
+
+def test_parallel_evaluation_skips_already_calculated_fitnesses(
+        parallel_evaluation, single_value_population_of_4):
+    single_value_population_of_4[0].fitness = 1.0
+    parallel_evaluation(single_value_population_of_4)
+    assert parallel_evaluation.eval_count == 3
+    assert single_value_population_of_4[0].fitness == 1.0
+
+
+def test_parallel_evaluation_returns_optimized_params():
+    population = [MultipleFloatChromosome([1.0, 1.0, 1.0], [0, 2])
+                  for _ in range(3)]
+    fitness_function = ContinuousLocalOptimization(FloatNormFitnessFunction(),
+                                                   algorithm="BFGS")
+    evaluation = ParallelEvaluation(fitness_function, num_workers=2)
+    evaluation(population)
+    evaluation.shutdown()
+    for indv in population:
+        assert indv.fitness == pytest.approx(1.0)
+        np.testing.assert_allclose(indv.values, [0.0, 1.0, 0.0], atol=1e-4)
+    assert evaluation.eval_count > 3
+
+
+def test_workers_restart_with_new_training_data(
+        parallel_evaluation, single_value_population_of_4):
+    parallel_evaluation(single_value_population_of_4)
+    first_executor = parallel_evaluation._executor
+    parallel_evaluation.fitness_function.training_data = [1, 2, 3]
+    for indv in single_value_population_of_4:
+        indv.fit_set = False
+    parallel_evaluation(single_value_population_of_4)
+    assert parallel_evaluation._executor is not first_executor
+
+
+def test_workers_not_restarted_with_equal_training_data(
+        parallel_evaluation, single_value_population_of_4):
+    parallel_evaluation.fitness_function.training_data = [1, 2, 3]
+    parallel_evaluation(single_value_population_of_4)
+    first_executor = parallel_evaluation._executor
+    parallel_evaluation.fitness_function.training_data = [1, 2, 3]
+    for indv in single_value_population_of_4:
+        indv.fit_set = False
+    parallel_evaluation(single_value_population_of_4)
+    assert parallel_evaluation._executor is first_executor
+
+
+def test_workers_not_restarted_with_view_of_same_training_data(
+        parallel_evaluation, single_value_population_of_4):
+    data = np.arange(10.)
+    parallel_evaluation.fitness_function.training_data = data[2:6]
+    parallel_evaluation(single_value_population_of_4)
+    first_executor = parallel_evaluation._executor
+    parallel_evaluation.fitness_function.training_data = data[2:6]
+    for indv in single_value_population_of_4:
+        indv.fit_set = False
+    parallel_evaluation(single_value_population_of_4)
+    assert parallel_evaluation._executor is first_executor
+
+    parallel_evaluation.fitness_function.training_data = data[2:6].copy()
+    for indv in single_value_population_of_4:
+        indv.fit_set = False
+    parallel_evaluation(single_value_population_of_4)
+    assert parallel_evaluation._executor is not first_executor
+
+
+def test_workers_restarted_when_training_data_refreshed(
+        parallel_evaluation, single_value_population_of_4):
+    parallel_evaluation(single_value_population_of_4)
+    first_executor = parallel_evaluation._executor
+    parallel_evaluation.refresh_training_data()
+    for indv in single_value_population_of_4:
+        indv.fit_set = False
+    parallel_evaluation(single_value_population_of_4)
+    assert parallel_evaluation._executor is not first_executor
+
+
+def test_parallel_evaluation_can_be_pickled(parallel_evaluation,
+                                            single_value_population_of_4):
+    parallel_evaluation(single_value_population_of_4)
+    copied_evaluation = pickle.loads(pickle.dumps(parallel_evaluation))
+    assert copied_evaluation.eval_count == 4
@@ -0,0 +1,119 @@
+# Ignoring some linting rules in tests
+# pylint: disable=redefined-outer-name
+# pylint: disable=missing-docstring
+import pytest
+import numpy as np
+
+from bingo.Base.ParetoArchive import ParetoArchive
+from bingo.Base.MultipleValues import MultipleValueChromosome
+
+
+class ComplexChromosome(MultipleValueChromosome):
+    def __init__(self, fitness, complexity):
+        super().__init__([0])
+        self.fitness = fitness
+        self.complexity = complexity
+
+    def get_complexity(self):
+        return self.complexity
+
+
+def brute_force_front(individuals):
+    front = []
+    for indv in individuals:
+        objectives = (indv.fitness, indv.complexity)
+        dominated = any(other.fitness <= indv.fitness and
+                        other.complexity <= indv.complexity and
+                        (other.fitness, other.complexity) != objectives
+                        for other in individuals)
+        if not dominated and objectives not in front:
+            front.append(objectives)
+    return sorted(front)
+
+
+def objectives_of(archive):
+    return [(indv.fitness, indv.get_complexity()) for indv in archive]
+
+
+def test_insert_keeps_only_non_dominated():
+    archive = ParetoArchive()
+    assert archive.insert(ComplexChromosome(3., 1))
+    assert archive.insert(ComplexChromosome(1., 3))
+    assert not archive.insert(ComplexChromosome(3., 3))
+    assert archive.insert(ComplexChromosome(2., 1))
+    assert objectives_of(archive) == [(1., 3), (2., 1)]
+
+
+def test_duplicate_objectives_are_not_inserted():
+    archive = ParetoArchive()
+    assert archive.insert(ComplexChromosome(1., 1))
+    assert not archive.insert(ComplexChromosome(1., 1))
+    assert len(archive) == 1
+
+
+def test_unevaluated_and_nan_individuals_are_not_inserted():
+    archive = ParetoArchive()
+    assert not archive.insert(ComplexChromosome(np.nan, 1))
+    assert not archive.insert(MultipleValueChromosome([0]))
+    assert len(archive) == 0
+
+
+def test_chromosome_without_complexity_keeps_best_fitness():
+    archive = ParetoArchive()
+    for fitness in [3., 1., 2.]:
+        indv = MultipleValueChromosome([0])
+        indv.fitness = fitness
+        archive.insert(indv)
+    assert [indv.fitness for indv in archive] == [1.]
+
+
+def test_update_matches_brute_force_front():
+    np.random.seed(0)
+    population = [ComplexChromosome(float(np.random.randint(20)),
+                                     np.random.randint(20))
+                  for _ in range(200)]
+    archive = ParetoArchive()
+    for i in range(0, 200, 25):
+        archive.update(population[i:i + 25])
+    assert objectives_of(archive) == brute_force_front(population)
+
+
+def test_archive_is_sorted_by_fitness():
+    np.random.seed(1)
+    archive = ParetoArchive()
+    archive.update([ComplexChromosome(np.random.random(),
+                                      np.random.randint(10))
+                    for _ in range(100)])
+    fitnesses = [indv.fitness for indv in archive]
+    assert fitnesses == sorted(fitnesses)
+
+
+def test_stored_individuals_are_copies():
+    indv = ComplexChromosome(1., 1)
+    archive = ParetoArchive()
+    archive.insert(indv)
+    assert archive[0] is not indv
+    assert archive[0].fitness == 1.
+
+
+def test_max_size_evicts_most_crowded():
+    archive = ParetoArchive(max_size=3)
+    archive.update([ComplexChromosome(0., 10), ComplexChromosome(10., 0),
+                    ComplexChromosome(5., 5), ComplexChromosome(6., 4)])
+    assert len(archive) == 3
+    assert objectives_of(archive)[0] == (0., 10)
+    assert objectives_of(archive)[-1] == (10., 0)
+
+
+@pytest.mark.parametrize("max_size", [0, -1])
+def test_raises_error_invalid_max_size(max_size):
+    with pytest.raises(ValueError):
+        ParetoArchive(max_size=max_size)
+
+
+def test_clear():
+    archive = ParetoArchive()
+    archive.insert(ComplexChromosome(1., 1))
+    archive.clear()
+    assert len(archive) == 0
+    assert archive.insert(ComplexChromosome(2., 2))
@@ -83,3 +83,15 @@ def test_multiple_indviduals_added_to_pop(init_replication_variation,
         if all(indv.values):
             count += 1
     assert count == indvs_added
+
+
+def test_random_individuals_added_by_plain_generator(init_replication_variation,
+                                                     true_chromosome_generator,
+                                                     weak_population):
+    indvs_added = 3
+    rand_indv_var_or = AddRandomIndividualVariation(
+        init_replication_variation, true_chromosome_generator.__call__,
+        num_rand_indvs=indvs_added)
+    offspring = rand_indv_var_or(weak_population, POP_SIZE)
+    assert len(offspring) == POP_SIZE + indvs_added
+    assert sum(True in indv.values for indv in offspring) == indvs_added
@@ -2,6 +2,7 @@
 # pylint: disable=redefined-outer-name
 # pylint: disable=missing-docstring
 import pytest
+import numpy as np
 
 from bingo.Base.TournamentSelection import Tournament
 
@@ -59,3 +60,26 @@ def test_no_repeats_in_selected_population(tournament_of_4, population_with_0):
     new_population = tournament_of_4(population_with_0, 4)
     for i, indv in enumerate(new_population[:-1]):
         assert indv not in new_population[i+1:]
+
+
+def test_tournament_of_whole_population_selects_best(population_with_0):
+    new_population = Tournament(4)(population_with_0, 10)
+    assert all(indv.fitness == 0 for indv in new_population)
+
+
+def test_tournament_members_are_distinct():
+    tournaments = Tournament(3)._draw_tournaments(5, 100)
+    assert tournaments.shape == (100, 3)
+    for members in tournaments:
+        assert len(set(members)) == 3
+
+
+def test_nan_fitness_loses_tournament(population_all_ones):
+    population_all_ones[0].fitness = np.nan
+    new_population = Tournament(4)(population_all_ones, 5)
+    assert all(indv.fitness == 1 for indv in new_population)
+
+
+def test_raises_error_tournament_larger_than_population(population_all_ones):
+    with pytest.raises(ValueError):
+        _ = Tournament(5)(population_all_ones, 1)
@@ -70,6 +70,15 @@ def test_pairwise_potential_regression(dummy_sum_equation,
     np.testing.assert_almost_equal(fitness, 0)
 
 
+def test_pairwise_potential_regression_jacobian(dummy_sum_equation,
+                                               dummy_training_data):
+    regressor = PairwiseAtomicPotential(dummy_training_data)
+    fitness_vector, jacobian = \
+        regressor.get_fitness_vector_and_jacobian(dummy_sum_equation)
+    np.testing.assert_array_almost_equal(fitness_vector, np.zeros(4))
+    np.testing.assert_array_almost_equal(jacobian, [[1], [2], [3], [4]])
+
+
 def test_reshaping_of_training_data_energies():
     energies = np.ones((1, 1, 3))
     r_list = np.ones((3, 1))
@@ -137,3 +146,100 @@ def test_training_data_length(data_size):
                                                r_list=r_list,
                                                config_lims_r=config_lims)
     assert len(training_data) == data_size
+
+
+@pytest.fixture
+def uneven_training_data():
+    energies = np.arange(5, dtype=float)
+    r_list = np.arange(12, dtype=float).reshape((-1, 1))
+    config_lims = np.array([0, 2, 3, 3, 7, 12])
+    return PairwiseAtomicTrainingData(potential_energy=energies,
+                                      r_list=r_list,
+                                      config_lims_r=config_lims)
+
+
+@pytest.mark.parametrize("items, expected_r, expected_lims", [
+    ([1, 3], [2, 3, 4, 5, 6], [0, 1, 5]),
+    ([4, 0], [7, 8, 9, 10, 11, 0, 1], [0, 5, 7]),
+    ([1, 2, 3], [2, 3, 4, 5, 6], [0, 1, 1, 5]),
+    (slice(0, 2), [0, 1, 2], [0, 2, 3]),
+])
+def test_training_data_subset_uneven_configs(uneven_training_data, items,
+                                             expected_r, expected_lims):
+    subset = uneven_training_data[items]
+    np.testing.assert_array_equal(subset.potential_energy,
+                                  uneven_training_data.potential_energy[items])
+    np.testing.assert_array_equal(subset.r.flatten(), expected_r)
+    np.testing.assert_array_equal(subset.config_lims_r, expected_lims)
+
+
+def test_consecutive_training_data_subset_is_view(uneven_training_data):
+    subset = uneven_training_data[[1, 2, 3]]
+    assert np.shares_memory(subset.r, uneven_training_data.r)
+    assert np.shares_memory(subset.potential_energy,
+                            uneven_training_data.potential_energy)
+
+
+def test_load_training_data(tmp_path, uneven_training_data):
+    np.save(str(tmp_path / "potential_energy.npy"),
+            uneven_training_data.potential_energy)
+    np.save(str(tmp_path / "r_list.npy"), uneven_training_data.r)
+    np.save(str(tmp_path / "config_lims_r.npy"),
+            uneven_training_data.config_lims_r)
+    training_data = PairwiseAtomicTrainingData.load(str(tmp_path))
+    assert isinstance(training_data.r, np.memmap)
+    np.testing.assert_array_equal(training_data.r, uneven_training_data.r)
+    np.testing.assert_array_equal(training_data[[1, 3]].r,
+                                  uneven_training_data[[1, 3]].r)
+
+
+def test_pairwise_potential_regression_with_empty_configs(
+        dummy_sum_equation, uneven_training_data):
+    regressor = PairwiseAtomicPotential(uneven_training_data)
+    fitness_vector = regressor._evaluate_fitness_vector(dummy_sum_equation)
+    expected_energies = [1, 2, 0, 3 + 4 + 5 + 6, 7 + 8 + 9 + 10 + 11]
+    np.testing.assert_array_almost_equal(
+        fitness_vector,
+        expected_energies - uneven_training_data.potential_energy)
+
+    fitness_vector_2, jacobian = \
+        regressor.get_fitness_vector_and_jacobian(dummy_sum_equation)
+    np.testing.assert_array_almost_equal(fitness_vector_2, fitness_vector)
+    np.testing.assert_array_almost_equal(jacobian.flatten(),
+                                         expected_energies)
+
+
+def brute_force_pair_distances(structure, periodic_size, r_cutoff):
+    r_list = []
+    for i, atom_i in enumerate(structure):
+        for atom_j in structure[i + 1:]:
+            delta = atom_j - atom_i
+            delta -= periodic_size * np.round(delta / periodic_size)
+            r = np.linalg.norm(delta)
+            if r <= r_cutoff:
+                r_list.append(r)
+    return r_list
+
+
+@pytest.fixture
+def large_configuration_set():
+    np.random.seed(0)
+    return [(np.random.uniform(0, 10, (80, 3)), 10.0, 2.5),
+            (np.random.uniform(-5, 15, (60, 3)), 10.0, 3.0),
+            (np.random.uniform(0, 4, (20, 3)), 4.0, 1.9),
+            (np.zeros((0, 3)), 10.0, 2.5)]
+
+
+@pytest.mark.parametrize("num_workers", [1, 2])
+def test_training_data_synthesis_of_large_configurations(
+        large_configuration_set, num_workers):
+    energies = np.ones(len(large_configuration_set))
+    training_data = \
+        PairwiseAtomicTrainingData(potential_energy=energies,
+                                   configurations=large_configuration_set,
+                                   num_workers=num_workers)
+    for i, configuration in enumerate(large_configuration_set):
+        expected_r = brute_force_pair_distances(*configuration)
+        config_r = training_data.r[training_data.config_lims_r[i]:
+                                   training_data.config_lims_r[i + 1]]
+        np.testing.assert_array_almost_equal(config_r.flatten(), expected_r)
@@ -1,6 +1,7 @@
 # Ignoring some linting rules in tests
 # pylint: disable=redefined-outer-name
 # pylint: disable=missing-docstring
+import pickle
 import warnings
 import pytest
 import numpy as np
@@ -27,6 +28,27 @@ def test_explicit_regression(dummy_sum_equation, dummy_training_data):
     np.testing.assert_almost_equal(fitness, 0)
 
 
+def test_explicit_regression_jacobian(dummy_sum_equation,
+                                     dummy_training_data):
+    regressor = ExplicitRegression(dummy_training_data)
+    fitness_vector, jacobian = \
+        regressor.get_fitness_vector_and_jacobian(dummy_sum_equation)
+    np.testing.assert_array_almost_equal(fitness_vector, np.zeros(10))
+    np.testing.assert_array_equal(jacobian, dummy_training_data.x)
+    assert regressor.eval_count == 1
+
+
+def test_explicit_regression_gradient(dummy_sum_equation,
+                                      dummy_training_data):
+    dummy_training_data.y -= 1.0
+    regressor = ExplicitRegression(dummy_training_data)
+    fitness, gradient = \
+        regressor.get_fitness_and_gradient(dummy_sum_equation)
+    np.testing.assert_almost_equal(fitness, 1.0)
+    np.testing.assert_array_almost_equal(
+        gradient, np.mean(dummy_training_data.x, axis=0))
+
+
 def test_explicit_regression_with_nan(dummy_sum_equation,
                                       dummy_training_data):
     dummy_training_data.x[0, 0] = np.nan
@@ -77,3 +99,106 @@ def test_correct_training_data_length(input_size):
     data_input = np.arange(input_size).reshape((-1, 1))
     training_data = ExplicitTrainingData(data_input, data_input)
     assert len(training_data) == input_size
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 10, 20])
+def test_chunked_explicit_regression(mocker, dummy_sum_equation,
+                                     dummy_training_data, chunk_size):
+    dummy_training_data.y[::2] -= 1.0
+    regressor = ExplicitRegression(dummy_training_data)
+    chunked_regressor = ExplicitRegression(dummy_training_data,
+                                           chunk_size=chunk_size)
+    expected_fitness = regressor(dummy_sum_equation)
+    mocker.spy(dummy_sum_equation, "evaluate_equation_at")
+
+    np.testing.assert_almost_equal(chunked_regressor(dummy_sum_equation),
+                                   expected_fitness)
+    assert chunked_regressor.eval_count == 1
+    for call in dummy_sum_equation.evaluate_equation_at.call_args_list:
+        assert call[0][0].shape[0] <= chunk_size
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 10, 20])
+def test_chunked_explicit_regression_jacobian(dummy_sum_equation,
+                                              dummy_training_data,
+                                              chunk_size):
+    dummy_training_data.y[::2] -= 1.0
+    regressor = ExplicitRegression(dummy_training_data)
+    chunked_regressor = ExplicitRegression(dummy_training_data,
+                                           chunk_size=chunk_size)
+
+    expected = regressor.get_fitness_vector_and_jacobian(dummy_sum_equation)
+    chunked = \
+        chunked_regressor.get_fitness_vector_and_jacobian(dummy_sum_equation)
+    np.testing.assert_array_almost_equal(chunked[0], expected[0])
+    np.testing.assert_array_almost_equal(chunked[1], expected[1])
+
+    expected = regressor.get_fitness_and_gradient(dummy_sum_equation)
+    chunked = chunked_regressor.get_fitness_and_gradient(dummy_sum_equation)
+    np.testing.assert_almost_equal(chunked[0], expected[0])
+    np.testing.assert_array_almost_equal(chunked[1], expected[1])
+    assert chunked_regressor.eval_count == 2
+
+
+@pytest.mark.parametrize("chunk_size", [0, "string"])
+def test_raises_error_invalid_chunk_size(dummy_training_data, chunk_size):
+    with pytest.raises((ValueError, TypeError)):
+        _ = ExplicitRegression(dummy_training_data, chunk_size=chunk_size)
+
+
+@pytest.fixture
+def saved_training_data(tmp_path):
+    x = np.arange(30, dtype=float).reshape((10, 3))
+    y = np.arange(10, dtype=float).reshape((10, 1))
+    np.save(str(tmp_path / "x.npy"), x)
+    np.save(str(tmp_path / "y.npy"), y)
+    return str(tmp_path), x, y
+
+
+def test_load_training_data(saved_training_data):
+    path, x, y = saved_training_data
+    training_data = ExplicitTrainingData.load(path)
+    assert isinstance(training_data.x, np.memmap)
+    assert isinstance(training_data.y, np.memmap)
+    np.testing.assert_array_equal(training_data.x, x)
+    np.testing.assert_array_equal(training_data.y, y)
+
+
+def test_load_training_data_into_memory(saved_training_data):
+    path, x, y = saved_training_data
+    training_data = ExplicitTrainingData.load(path, mmap_mode=None)
+    assert not isinstance(training_data.x, np.memmap)
+    np.testing.assert_array_equal(training_data.x, x)
+    np.testing.assert_array_equal(training_data.y, y)
+
+
+@pytest.mark.parametrize("save", [np.savez, np.savez_compressed])
+def test_load_training_data_from_archive(tmp_path, save):
+    x = np.arange(30, dtype=float).reshape((10, 3))
+    y = np.arange(10, dtype=float).reshape((10, 1))
+    filename = str(tmp_path / "data.npz")
+    save(filename, x=x, y=y)
+    training_data = ExplicitTrainingData.load(filename)
+    assert not isinstance(training_data.x, np.memmap)
+    np.testing.assert_array_equal(training_data.x, x)
+    np.testing.assert_array_equal(training_data.y, y)
+
+
+@pytest.mark.parametrize("items", [[2, 3, 4], [1, 3, 5], np.arange(4)])
+def test_evenly_spaced_subset_of_training_data_is_view(saved_training_data,
+                                                       items):
+    path, x, y = saved_training_data
+    training_data = ExplicitTrainingData.load(path)
+    subset = training_data[items]
+    assert np.shares_memory(subset.x, training_data.x)
+    np.testing.assert_array_equal(subset.x, x[items])
+    np.testing.assert_array_equal(subset.y, y[items])
+
+
+def test_pickled_training_data_stays_memory_mapped(saved_training_data):
+    path, x, _ = saved_training_data
+    training_data = ExplicitTrainingData.load(path)[[4, 5, 6]]
+    unpickled = pickle.loads(pickle.dumps(training_data))
+    assert isinstance(unpickled.x, np.memmap)
+    np.testing.assert_array_equal(unpickled.x, x[4:7])
+
@@ -7,7 +7,8 @@ import numpy as np
 
 from bingo.SymbolicRegression.ImplicitRegression import ImplicitRegression, \
                                      ImplicitRegressionSchmidt, \
-                                     ImplicitTrainingData
+                                     ImplicitTrainingData, \
+                                     calculate_partials, savitzky_golay_gram
 
 
 class SampleTrainingData:
@@ -48,12 +49,83 @@ def test_implicit_regression_no_normalization(dummy_sum_equation,
     assert np.isinf(fitness) == infinite_fitness_expected
 
 
+@pytest.mark.parametrize("normalize_dot", [True, False])
+@pytest.mark.parametrize("chunk_size", [1, 3, 10, 20])
+def test_chunked_implicit_regression(dummy_sum_equation, dummy_training_data,
+                                     normalize_dot, chunk_size):
+    regressor = ImplicitRegression(dummy_training_data,
+                                   normalize_dot=normalize_dot,
+                                   chunk_size=chunk_size)
+    fitness = regressor(dummy_sum_equation)
+    np.testing.assert_almost_equal(fitness, 0.14563031020)
+    assert regressor.eval_count == 1
+
+
+@pytest.mark.parametrize("required_params, infinite_fitness_expected",
+                         [(4, False), (5, True)])
+def test_chunked_implicit_regression_required_params(
+        dummy_sum_equation, dummy_training_data, required_params,
+        infinite_fitness_expected):
+    dummy_training_data.dx_dt[1:, 2] = 0
+    dummy_training_data.dx_dt[0, 2] = 1
+    regressor = ImplicitRegression(dummy_training_data,
+                                   required_params=required_params,
+                                   chunk_size=3)
+    fitness = regressor(dummy_sum_equation)
+    assert np.isinf(fitness) == infinite_fitness_expected
+
+
 def test_schmidt_regression(dummy_sum_equation, dummy_training_data):
     regressor = ImplicitRegressionSchmidt(dummy_training_data)
     fitness = regressor(dummy_sum_equation)
     np.testing.assert_almost_equal(fitness, 0.44420421701352086)
 
 
+class GradientEquation:
+    def __init__(self, df_dx):
+        self.df_dx = df_dx
+
+    def evaluate_equation_with_x_gradient_at(self, x):
+        return None, self.df_dx
+
+
+def schmidt_worst_diff_by_loops(df_dx, dx_dt):
+    num_parameters = dx_dt.shape[1]
+    worst_fitness = 0
+    diff_worst = np.full((num_parameters, ), np.inf)
+    for i in range(num_parameters):
+        for j in range(num_parameters):
+            if i != j:
+                df_dxj = np.copy(df_dx[:, j])
+                for k in range(num_parameters):
+                    if k != i and k != j:
+                        df_dxj += df_dx[:, k] * dx_dt[:, k] / dx_dt[:, j]
+                diff = np.log(1. + np.abs(df_dxj / df_dx[:, i] +
+                                          dx_dt[:, i] / dx_dt[:, j]))
+                fit = np.mean(diff)
+                if np.isfinite(fit) and fit > worst_fitness:
+                    diff_worst = diff
+                    worst_fitness = fit
+    return diff_worst
+
+
+@pytest.mark.parametrize("num_parameters", [2, 3, 6])
+@pytest.mark.parametrize("zero_dx_dt_column", [True, False])
+def test_schmidt_regression_matches_pairwise_loops(num_parameters,
+                                                   zero_dx_dt_column):
+    np.random.seed(num_parameters)
+    dx_dt = np.random.randn(30, num_parameters)
+    if zero_dx_dt_column:
+        dx_dt[:, 0] = 0
+    df_dx = np.random.randn(30, num_parameters)
+    training_data = SampleTrainingData(np.zeros(dx_dt.shape), dx_dt)
+    regressor = ImplicitRegressionSchmidt(training_data)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        expected = schmidt_worst_diff_by_loops(df_dx, dx_dt)
+    np.testing.assert_allclose(
+        regressor.evaluate_fitness_vector(GradientEquation(df_dx)), expected)
+
+
 def test_reshaping_of_training_data():
     x = np.zeros(5)
     dx_dt = np.zeros((5, 1))
@@ -89,6 +161,33 @@ def test_getting_subset_of_training_data():
                                   expected_subset)
 
 
+def test_consecutive_subset_of_training_data_is_view():
+    data_input = np.arange(5).reshape((5, 1))
+    training_data = ImplicitTrainingData(data_input, data_input)
+    subset_training_data = training_data[[1, 2, 3]]
+    assert np.shares_memory(subset_training_data.x, training_data.x)
+    np.testing.assert_array_equal(subset_training_data.dx_dt,
+                                  [[1], [2], [3]])
+
+
+@pytest.mark.parametrize("save_dx_dt", [True, False])
+def test_load_training_data(tmp_path, save_dx_dt):
+    x = np.arange(60, dtype=float).reshape((20, 3))
+    dx_dt = np.ones((20, 3))
+    np.save(str(tmp_path / "x.npy"), x)
+    if save_dx_dt:
+        np.save(str(tmp_path / "dx_dt.npy"), dx_dt)
+    training_data = ImplicitTrainingData.load(str(tmp_path))
+    if save_dx_dt:
+        assert isinstance(training_data.x, np.memmap)
+    expected_training_data = ImplicitTrainingData(x, dx_dt if save_dx_dt
+                                                  else None)
+    np.testing.assert_array_almost_equal(training_data.x,
+                                         expected_training_data.x)
+    np.testing.assert_array_almost_equal(training_data.dx_dt,
+                                         expected_training_data.dx_dt)
+
+
 @pytest.mark.parametrize("input_size", [2, 5, 50])
 def test_correct_training_data_length(input_size):
     data_input = np.arange(input_size).reshape((-1, 1))
@@ -116,3 +215,83 @@ def test_correct_partial_calculation_in_training_data_2():
     expected_derivative = np.full((26, 1), 2.0)
     np.testing.assert_array_almost_equal(training_data.dx_dt,
                                          expected_derivative)
+
+
+@pytest.mark.parametrize("window_size, order, deriv", [(7, 3, 1), (9, 4, 0),
+                                                       (5, 2, 2)])
+def test_savitzky_golay_columns_filtered_separately(window_size, order,
+                                                     deriv):
+    y = np.random.random((30, 3))
+    filtered = savitzky_golay_gram(y, window_size, order, deriv)
+    for i in range(3):
+        np.testing.assert_array_equal(
+            filtered[:, i], savitzky_golay_gram(y[:, i], window_size, order,
+                                                deriv))
+
+
+@pytest.mark.parametrize("deriv, expected", [(0, lambda t: t**3),
+                                             (1, lambda t: 3 * t**2),
+                                             (2, lambda t: 6 * t)])
+def test_savitzky_golay_exact_for_cubic(deriv, expected):
+    t = np.arange(20, dtype=float)
+    np.testing.assert_allclose(savitzky_golay_gram(t**3, 7, 3, deriv),
+                               expected(t), atol=1e-8)
+
+
+def test_partials_of_multiple_trajectories():
+    data_input = np.arange(60, dtype=float).reshape((20, 3))
+    data_input = np.vstack((data_input, [[np.nan] * 3], [[np.nan] * 3],
+                            data_input[:10], [[np.nan] * 3], data_input))
+    x, dx_dt, inds = calculate_partials(data_input)
+    assert x.shape == dx_dt.shape == (29, 3)
+    np.testing.assert_array_equal(x, data_input[inds])
+    np.testing.assert_array_almost_equal(dx_dt, np.full((29, 3), 3.0))
+
+
+def test_normalized_dx_dt_of_training_data():
+    dx_dt = np.array([[3., 4.], [0., 2.], [-1., 0.]])
+    training_data = ImplicitTrainingData(np.zeros((3, 2)), dx_dt)
+    np.testing.assert_array_almost_equal(training_data.normalized_dx_dt,
+                                         [[0.6, 0.8], [0., 1.], [-1., 0.]])
+    assert training_data.normalized_dx_dt is training_data.normalized_dx_dt
+
+
+def test_normalized_dx_dt_invalidated_when_dx_dt_replaced():
+    training_data = ImplicitTrainingData(np.zeros((3, 2)), np.ones((3, 2)))
+    _ = training_data.normalized_dx_dt
+    training_data.dx_dt = np.array([[1., 0.], [0., 1.], [0., 2.]])
+    np.testing.assert_array_almost_equal(training_data.normalized_dx_dt,
+                                         [[1., 0.], [0., 1.], [0., 1.]])
+
+
+def test_normalized_dx_dt_passed_to_subset():
+    x = np.arange(20, dtype=float).reshape((10, 2))
+    training_data = ImplicitTrainingData(x, x + 1)
+    normalized_dx_dt = training_data.normalized_dx_dt
+    subset = training_data[[1, 4, 7]]
+    np.testing.assert_array_equal(subset.normalized_dx_dt,
+                                  normalized_dx_dt[[1, 4, 7]])
+    assert np.shares_memory(subset.normalized_dx_dt, normalized_dx_dt)
+
+
+def test_normalized_dx_dt_not_pickled():
+    training_data = ImplicitTrainingData(np.zeros((3, 2)), np.ones((3, 2)))
+    _ = training_data.normalized_dx_dt
+    assert training_data.__getstate__()["_normalized_dx_dt"] is None
+
+
+@pytest.mark.parametrize("required_params", [None, 3, 4])
+def test_normalized_implicit_regression_uses_cached_dx_dt(
+        dummy_sum_equation, dummy_training_data, required_params):
+    training_data = ImplicitTrainingData(dummy_training_data.x,
+                                         dummy_training_data.dx_dt)
+    sample_regressor = ImplicitRegression(dummy_training_data,
+                                          required_params=required_params,
+                                          normalize_dot=True)
+    regressor = ImplicitRegression(training_data,
+                                   required_params=required_params,
+                                   normalize_dot=True)
+    np.testing.assert_array_almost_equal(
+        regressor.evaluate_fitness_vector(dummy_sum_equation),
+        sample_regressor.evaluate_fitness_vector(dummy_sum_equation))
+    assert training_data._normalized_dx_dt is not None
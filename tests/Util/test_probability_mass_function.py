@@ -2,6 +2,7 @@
 # pylint: disable=redefined-outer-name
 # pylint: disable=missing-docstring
 import pytest
+import numpy as np
 
 from bingo.Util.ProbabilityMassFunction import ProbabilityMassFunction
 
@@ -85,3 +86,33 @@ def test_default_equal_weight_added(equal_pmf):
 
     assert equal_pmf.normalized_weights[2] == equal_pmf.normalized_weights[0]
     assert equal_pmf.normalized_weights[2] == equal_pmf.normalized_weights[1]
+
+
+def test_raises_exception_for_draws_from_empty_pmf(empty_pmf):
+    with pytest.raises(ValueError):
+        _ = empty_pmf.draw_samples(3)
+
+
+def test_constant_pmf_draw_samples(constant_pmf):
+    pmf, expected_value = constant_pmf
+    np.testing.assert_array_equal(pmf.draw_samples(10),
+                                  np.full(10, expected_value))
+
+
+def test_samples_match_numpy_choice(sample_pmf):
+    np.random.seed(0)
+    expected = np.random.choice(sample_pmf.items, 20,
+                                p=sample_pmf.normalized_weights)
+    np.random.seed(0)
+    samples = [sample_pmf.draw_sample() for _ in range(20)]
+    np.random.seed(0)
+    batch_samples = sample_pmf.draw_samples(20)
+    np.testing.assert_array_equal(samples, expected)
+    np.testing.assert_array_equal(batch_samples, expected)
+
+
+def test_draw_samples_of_added_function_items(empty_pmf):
+    empty_pmf.add_item(sum)
+    empty_pmf.add_item(max, 0.0)
+    samples = empty_pmf.draw_samples(5)
+    assert all(sample is sum for sample in samples)
@@ -0,0 +1,59 @@
+import timeit
+
+import numpy as np
+
+from bingo.Base.AgeFitnessSelection import AgeFitness
+from bingo.Base.MultipleValues import MultipleValueChromosome
+from performance_benchmarks import StatsPrinter
+
+POP_SIZE = 4000
+TARGET_POP_SIZE = 2000
+MAX_AGE = 10
+
+
+def init_population():
+    np.random.seed(0)
+    population = []
+    for _ in range(POP_SIZE):
+        individual = MultipleValueChromosome([0])
+        individual.fitness = np.random.random()
+        individual.genetic_age = np.random.randint(MAX_AGE)
+        population.append(individual)
+    return population
+
+
+TEST_POPULATION = init_population()
+
+
+class SelectionStatsPrinter(StatsPrinter):
+    def __init__(self):
+        super().__init__()
+        self._output = ["-"*24+":::: SELECTION BENCHMARKS ::::" + "-"*24,
+                        self._header_format_string.format("NAME", "MEAN",
+                                                          "STD", "MIN", "MAX"),
+                        "-"*78]
+
+
+def age_fitness_selection_benchmark():
+    _ = AgeFitness()(TEST_POPULATION, TARGET_POP_SIZE)
+
+
+def age_fitness_pareto_front_benchmark():
+    _ = AgeFitness().select_pareto_front(TEST_POPULATION)
+
+
+def do_benchmarking():
+    printer = SelectionStatsPrinter()
+    printer.add_stats("Age-fitness selection",
+                      timeit.repeat(age_fitness_selection_benchmark,
+                                    number=1,
+                                    repeat=10))
+    printer.add_stats("Age-fitness pareto front",
+                      timeit.repeat(age_fitness_pareto_front_benchmark,
+                                    number=1,
+                                    repeat=10))
+    printer.print()
+
+
+if __name__ == "__main__":
+    do_benchmarking()